@@ -11,6 +11,24 @@ DATABASE_URL = os.environ.get(
     f"sqlite+aiosqlite:///{DATA_DIR / 'skating.db'}",
 )
 
+# SQLite connection profile (ignored for other databases). SQLITE_PRAGMAS=0
+# falls back to SQLite defaults (rollback journal, no busy timeout).
+SQLITE_PRAGMAS = os.environ.get("SQLITE_PRAGMAS", "1") == "1"
+SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_MMAP_SIZE = int(os.environ.get("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE_KB = int(os.environ.get("SQLITE_CACHE_SIZE_KB", str(64 * 1024)))
+
+# Connection pool for server databases (PostgreSQL via asyncpg; ignored for
+# SQLite). Each uvicorn worker holds its own pool, once for the write engine
+# and once for the read engine, so keep
+# workers * 2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW) under the server's
+# max_connections. Connections are recycled after DB_POOL_RECYCLE seconds
+# and checked before reuse.
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "1800"))
+
 # Auth
 SECRET_KEY = os.environ.get("SECRET_KEY", "dev-secret-change-me")
 SECURE_COOKIES = os.environ.get("SECURE_COOKIES", "true").lower() == "true"
@@ -38,6 +56,27 @@ SMTP_USER = os.environ.get("SMTP_USER", "")
 SMTP_PASSWORD = os.environ.get("SMTP_PASSWORD", "")
 SMTP_FROM = os.environ.get("SMTP_FROM", "")
 
+# Job queue: workers hold a lease on claimed jobs, renewed while they run, and
+# poll the jobs table for work queued by other processes.
+JOB_LEASE_SECONDS = int(os.environ.get("JOB_LEASE_SECONDS", "120"))
+JOB_POLL_INTERVAL = float(os.environ.get("JOB_POLL_INTERVAL", "5"))
+
+# Dashboard and stats responses kept in memory per worker (see
+# services/response_cache.py), least recently used evicted first.
+RESPONSE_CACHE_SIZE = int(os.environ.get("RESPONSE_CACHE_SIZE", "256"))
+
+# Competition polling: every few minutes on days with scheduled segments,
+# exponential backoff from the quiet interval up to the maximum on other days.
+# Polling stops once the schedule is over and nothing changed for
+# POLL_STOP_AFTER_HOURS. Each delay is randomised by +/- POLL_JITTER so
+# competitions don't all poll at the same moment.
+POLL_TICK_SECONDS = float(os.environ.get("POLL_TICK_SECONDS", "60"))
+POLL_ACTIVE_INTERVAL_MINUTES = float(os.environ.get("POLL_ACTIVE_INTERVAL_MINUTES", "5"))
+POLL_QUIET_INTERVAL_MINUTES = float(os.environ.get("POLL_QUIET_INTERVAL_MINUTES", "30"))
+POLL_MAX_INTERVAL_HOURS = float(os.environ.get("POLL_MAX_INTERVAL_HOURS", "6"))
+POLL_STOP_AFTER_HOURS = float(os.environ.get("POLL_STOP_AFTER_HOURS", "48"))
+POLL_JITTER = float(os.environ.get("POLL_JITTER", "0.1"))
+
 # Ensure data directories exist
 DATA_DIR.mkdir(exist_ok=True)
 PDF_DIR.mkdir(exist_ok=True)
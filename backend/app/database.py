@@ -1,7 +1,7 @@
 import logging
 
-from sqlalchemy import select, text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 logger = logging.getLogger(__name__)
@@ -12,6 +12,14 @@ from app.config import (
     ADMIN_PASSWORD,
     CLUB_NAME,
     CLUB_SHORT,
+    SQLITE_PRAGMAS,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_MMAP_SIZE,
+    SQLITE_CACHE_SIZE_KB,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
 )
 
 
@@ -19,255 +27,81 @@ class Base(DeclarativeBase):
     pass
 
 
-engine = create_async_engine(DATABASE_URL, echo=False)
-async_session_factory = async_sessionmaker(engine, expire_on_commit=False)
-
-
-async def init_db() -> None:
-    # Import models so Base.metadata knows all tables
-    import app.models  # noqa: F401
-
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-        await _migrate_add_columns(conn)
-        await _migrate_drop_constraints(conn)
-        await _backfill_score_club(conn)
-
-    await _backfill_categories()
-    await _merge_pair_skaters()
-    await _bootstrap()
-
-
-async def _migrate_add_columns(conn) -> None:
-    """Add columns that may be missing in existing SQLite databases."""
-    _MIGRATIONS = [
-        ("competitions", "rink", "VARCHAR(255)"),
-        ("scores", "skating_level", "VARCHAR(20)"),
-        ("scores", "age_group", "VARCHAR(30)"),
-        ("scores", "gender", "VARCHAR(10)"),
-        ("category_results", "skating_level", "VARCHAR(20)"),
-        ("category_results", "age_group", "VARCHAR(30)"),
-        ("category_results", "gender", "VARCHAR(10)"),
-        ("users", "must_change_password", "BOOLEAN DEFAULT 0"),
-        ("users", "email_notifications", "BOOLEAN DEFAULT 1"),
-        ("users", "last_login_at", "DATETIME"),
-        ("skaters", "training_tracked", "BOOLEAN DEFAULT 0"),
-        ("skaters", "manual_create", "BOOLEAN DEFAULT 0"),
-        ("app_settings", "training_enabled", "INTEGER DEFAULT 0"),
-        ("app_settings", "smtp_host", "VARCHAR(255)"),
-        ("app_settings", "smtp_port", "INTEGER DEFAULT 587"),
-        ("app_settings", "smtp_user", "VARCHAR(255)"),
-        ("app_settings", "smtp_password", "TEXT"),
-        ("app_settings", "smtp_from", "VARCHAR(255)"),
-        ("app_settings", "smtp_from_name", "VARCHAR(255)"),
-        ("competitions", "ligue", "VARCHAR(50)"),
-        ("competitions", "date_end", "DATE"),
-        ("competitions", "polling_enabled", "BOOLEAN DEFAULT 0"),
-        ("competitions", "polling_activated_at", "DATETIME"),
-        ("competitions", "team_medians", "JSON"),
-        ("app_settings", "default_team_medians", "JSON"),
-        ("scores", "is_titular", "BOOLEAN"),
-        ("scores", "club", "VARCHAR(255)"),
-        ("category_results", "club", "VARCHAR(255)"),
+def _sqlite_pragmas(*, query_only: bool) -> list[str]:
+    # WAL lets readers run while an import commits; synchronous=NORMAL is
+    # durable across application crashes in WAL mode and skips an fsync per
+    # commit. cache_size is negative to mean KiB rather than pages.
+    pragmas = [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}",
+        f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}",
+        "PRAGMA temp_store=MEMORY",
     ]
-    for table, column, col_type in _MIGRATIONS:
-        try:
-            await conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {col_type}"))
-            logger.info("Added column %s.%s", table, column)
-        except Exception:
-            pass  # Column already exists
+    if query_only:
+        pragmas.append("PRAGMA query_only=ON")
+    return pragmas
 
 
-async def _migrate_drop_constraints(conn) -> None:
-    """Drop constraints that are no longer needed.
+def create_engine(url: str, *, read_only: bool = False) -> AsyncEngine:
+    """Create an engine for ``url``.
 
-    SQLite does not support ALTER TABLE DROP CONSTRAINT, so we must
-    recreate the table without the constraint.
+    SQLite gets the pragma profile on connect; server databases get the
+    pooling settings from app.config. ``read_only`` engines refuse writes at
+    the connection level.
     """
-    # Check if self_evaluations still has the unique constraint
-    try:
-        result = await conn.execute(
-            text("SELECT sql FROM sqlite_master WHERE type='table' AND name='self_evaluations'")
-        )
-        row = result.fetchone()
-        if row and "uq_self_eval_skater_date" in (row[0] or ""):
-            logger.info("Recreating self_evaluations table to drop unique constraint")
-            await conn.execute(text("ALTER TABLE self_evaluations RENAME TO _self_evaluations_old"))
-            await conn.execute(text("""
-                CREATE TABLE self_evaluations (
-                    id INTEGER NOT NULL PRIMARY KEY,
-                    skater_id INTEGER NOT NULL,
-                    mood_id INTEGER,
-                    date DATE NOT NULL,
-                    notes TEXT,
-                    element_ratings JSON,
-                    shared BOOLEAN NOT NULL,
-                    created_at DATETIME NOT NULL,
-                    updated_at DATETIME NOT NULL,
-                    FOREIGN KEY(skater_id) REFERENCES skaters (id) ON DELETE CASCADE,
-                    FOREIGN KEY(mood_id) REFERENCES training_moods (id) ON DELETE SET NULL
-                )
-            """))
-            await conn.execute(text("""
-                INSERT INTO self_evaluations
-                SELECT * FROM _self_evaluations_old
-            """))
-            await conn.execute(text("DROP TABLE _self_evaluations_old"))
-            logger.info("Dropped unique constraint uq_self_eval_skater_date")
-    except Exception:
-        logger.exception("Failed to drop unique constraint on self_evaluations")
-
-
-async def _backfill_score_club(conn) -> None:
-    """One-time backfill: copy skater.club to scores/category_results where club is NULL."""
-    await conn.execute(text("""
-        UPDATE scores SET club = (
-            SELECT skaters.club FROM skaters WHERE skaters.id = scores.skater_id
-        ) WHERE scores.club IS NULL
-    """))
-    await conn.execute(text("""
-        UPDATE category_results SET club = (
-            SELECT skaters.club FROM skaters WHERE skaters.id = category_results.skater_id
-        ) WHERE category_results.club IS NULL
-    """))
-    logger.info("Backfilled score/category_result club from skater.club")
-
-
-async def _backfill_categories() -> None:
-    """Parse category field for existing rows that lack structured fields."""
-    from app.models.score import Score
-    from app.models.category_result import CategoryResult
-    from app.services.category_parser import parse_category
-
-    async with async_session_factory() as session:
-        result = await session.execute(
-            select(Score).where(Score.skating_level.is_(None), Score.category.isnot(None))
-        )
-        scores = result.scalars().all()
-        for score in scores:
-            parsed = parse_category(score.category)
-            score.skating_level = parsed["skating_level"]
-            score.age_group = parsed["age_group"]
-            score.gender = parsed["gender"]
-
-        result = await session.execute(
-            select(CategoryResult).where(
-                CategoryResult.skating_level.is_(None), CategoryResult.category.isnot(None)
-            )
-        )
-        cat_results = result.scalars().all()
-        for cr in cat_results:
-            parsed = parse_category(cr.category)
-            cr.skating_level = parsed["skating_level"]
-            cr.age_group = parsed["age_group"]
-            cr.gender = parsed["gender"]
-
-        if scores or cat_results:
-            await session.commit()
-            logger.info("Backfilled categories: %d scores, %d category_results", len(scores), len(cat_results))
-
+    if url.startswith("sqlite"):
+        return _create_sqlite_engine(url, read_only=read_only)
+
+    connect_args = {}
+    if read_only and url.startswith("postgresql+asyncpg"):
+        connect_args["server_settings"] = {"default_transaction_read_only": "on"}
+    return create_async_engine(
+        url,
+        echo=False,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        connect_args=connect_args,
+    )
+
+
+def _create_sqlite_engine(url: str, *, read_only: bool) -> AsyncEngine:
+    new_engine = create_async_engine(url, echo=False)
+    if SQLITE_PRAGMAS:
+        pragmas = _sqlite_pragmas(query_only=read_only)
+
+        @event.listens_for(new_engine.sync_engine, "connect")
+        def _apply_pragmas(dbapi_connection, _record) -> None:
+            cursor = dbapi_connection.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
+    return new_engine
+
+
+# All writes go through ``engine``; GET routes read through ``read_engine`` so
+# they don't compete with writers for its connections.
+engine = create_engine(DATABASE_URL)
+async_session_factory = async_sessionmaker(engine, expire_on_commit=False)
+read_engine = create_engine(DATABASE_URL, read_only=True)
+read_session_factory = async_sessionmaker(read_engine, expire_on_commit=False)
 
-async def _merge_pair_skaters() -> None:
-    """Merge old-format pair skater records into the correct format.
 
-    Old format: first_name="Laurence", last_name="FOURNIER BEAUDRY / Guillaume CIZERON"
-    New format: first_name="",         last_name="Laurence FOURNIER BEAUDRY / Guillaume CIZERON"
+async def init_db() -> list:
+    """Bring the schema up to date and seed first-run data.
 
-    Reassigns scores and category_results from old to new, then deletes orphans.
+    Returns the background migrations still to run (see app.migrations).
     """
-    from app.models.skater import Skater
-    from app.models.score import Score
-    from app.models.category_result import CategoryResult
-
-    async with async_session_factory() as session:
-        # Find old-format pair skaters: non-empty first_name with " / " in last_name
-        result = await session.execute(
-            select(Skater).where(
-                Skater.first_name != "",
-                Skater.last_name.contains(" / "),
-            )
-        )
-        old_pairs = result.scalars().all()
-
-        merged = 0
-        for old in old_pairs:
-            correct_last = f"{old.first_name} {old.last_name}"
-            # Check if the correct-format record already exists
-            result = await session.execute(
-                select(Skater).where(
-                    Skater.first_name == "",
-                    Skater.last_name == correct_last,
-                )
-            )
-            new = result.scalar_one_or_none()
-
-            if new:
-                # Reassign scores from old to new (skip duplicates)
-                old_scores = (await session.execute(
-                    select(Score).where(Score.skater_id == old.id)
-                )).scalars().all()
-                for score in old_scores:
-                    existing = (await session.execute(
-                        select(Score).where(
-                            Score.skater_id == new.id,
-                            Score.competition_id == score.competition_id,
-                            Score.category == score.category,
-                            Score.segment == score.segment,
-                        )
-                    )).scalar_one_or_none()
-                    if existing:
-                        await session.delete(score)
-                    else:
-                        score.skater_id = new.id
-
-                # Reassign category_results from old to new (skip duplicates)
-                old_crs = (await session.execute(
-                    select(CategoryResult).where(CategoryResult.skater_id == old.id)
-                )).scalars().all()
-                for cr in old_crs:
-                    existing = (await session.execute(
-                        select(CategoryResult).where(
-                            CategoryResult.skater_id == new.id,
-                            CategoryResult.competition_id == cr.competition_id,
-                            CategoryResult.category == cr.category,
-                        )
-                    )).scalar_one_or_none()
-                    if existing:
-                        await session.delete(cr)
-                    else:
-                        cr.skater_id = new.id
+    from app.migrations import run_migrations
 
-                # Merge metadata
-                if not new.nationality and old.nationality:
-                    new.nationality = old.nationality
-                if not new.club and old.club:
-                    new.club = old.club
-
-                await session.delete(old)
-            else:
-                # No new-format record — just fix the old one in place
-                old.last_name = correct_last
-                old.first_name = ""
-
-            merged += 1
-
-        if merged:
-            await session.commit()
-            logger.info("Merged %d old-format pair skater records", merged)
-
-        # Delete orphaned skaters (no scores and no category results, not manually created)
-        from sqlalchemy import exists
-        orphan_stmt = select(Skater).where(
-            ~exists(select(Score.id).where(Score.skater_id == Skater.id)),
-            ~exists(select(CategoryResult.id).where(CategoryResult.skater_id == Skater.id)),
-            Skater.manual_create != True,  # noqa: E712
-        )
-        orphans = (await session.execute(orphan_stmt)).scalars().all()
-        if orphans:
-            for orphan in orphans:
-                await session.delete(orphan)
-            await session.commit()
-            logger.info("Deleted %d orphaned skater records", len(orphans))
+    pending = await run_migrations(engine)
+    await _bootstrap()
+    return pending
 
 
 async def _bootstrap() -> None:
@@ -304,3 +138,9 @@ async def _bootstrap() -> None:
 async def get_session() -> AsyncSession:
     async with async_session_factory() as session:
         yield session
+
+
+async def get_read_session() -> AsyncSession:
+    """Session on the read-only engine, for handlers that never write."""
+    async with read_session_factory() as session:
+        yield session
@@ -1,17 +1,19 @@
 import asyncio
 import logging
 from contextlib import asynccontextmanager
-from datetime import date as date_type, timedelta
+from datetime import date as date_type, datetime, timedelta, timezone
 from typing import AsyncGenerator
 
 from litestar import Litestar, get
 from litestar.config.cors import CORSConfig
 from litestar.static_files import StaticFilesConfig
-from sqlalchemy import select
+from sqlalchemy import select, or_
 
-from app.config import ALLOWED_ORIGINS, LOGOS_DIR, PDF_DIR
-from app.database import init_db, async_session_factory
+from app.config import ALLOWED_ORIGINS, LOGOS_DIR, PDF_DIR, POLL_TICK_SECONDS
+from app.database import init_db, async_session_factory, engine
+from app.migrations import run_background_migrations
 from app.auth.guards import auth_guard
+from app.services import poll_scheduler
 from app.services.job_queue import job_queue
 from app.services.import_service import run_import, run_enrich
 from app.routes.auth import router as auth_router
@@ -31,6 +33,7 @@ from app.routes.training import router as training_router
 from app.routes.notifications import router as notifications_router
 from app.routes.team_scores import router as team_scores_router
 from app.routes.program_builder import router as program_builder_router
+from app.routes.events import router as events_router
 
 
 logger = logging.getLogger(__name__)
@@ -45,33 +48,47 @@ def _should_disable_polling(comp, today: date_type | None = None) -> bool:
     return (comp.date_end + timedelta(days=7)) < today
 
 
-async def _polling_loop() -> None:
-    """Background loop that polls enabled competitions every hour."""
+async def _poll_due_competitions(session, now: datetime) -> int:
+    """Submit import+enrich jobs for competitions whose next poll is due."""
     from app.models.competition import Competition
 
+    stmt = select(Competition).where(
+        Competition.polling_enabled == True,  # noqa: E712
+        or_(Competition.next_poll_at.is_(None), Competition.next_poll_at <= now),
+    )
+    comps = (await session.execute(stmt)).scalars().all()
+    polled = 0
+    for comp in comps:
+        if _should_disable_polling(comp, now.date()) or poll_scheduler.should_stop_polling(comp, now):
+            comp.polling_enabled = False
+            logger.info("Auto-disabled polling for competition %d (%s)", comp.id, comp.name)
+            continue
+        await job_queue.create_job("import", comp.id, trigger="auto")
+        await job_queue.create_job("enrich", comp.id, trigger="auto")
+        poll_scheduler.record_poll(comp, now)
+        polled += 1
+        logger.info(
+            "Polling: submitted import+enrich for competition %d (%s), next poll at %s",
+            comp.id, comp.name, comp.next_poll_at.isoformat(timespec="seconds"),
+        )
+    await session.commit()
+    return polled
+
+
+async def _polling_loop() -> None:
+    """Background loop that polls enabled competitions when their schedule says so."""
     while True:
-        await asyncio.sleep(3600)
+        await asyncio.sleep(POLL_TICK_SECONDS)
         try:
             async with async_session_factory() as session:
-                stmt = select(Competition).where(Competition.polling_enabled == True)  # noqa: E712
-                comps = (await session.execute(stmt)).scalars().all()
-                today = date_type.today()
-                for comp in comps:
-                    if _should_disable_polling(comp, today):
-                        comp.polling_enabled = False
-                        logger.info("Auto-disabled polling for competition %d (%s)", comp.id, comp.name)
-                        continue
-                    await job_queue.create_job("import", comp.id, trigger="auto")
-                    await job_queue.create_job("enrich", comp.id, trigger="auto")
-                    logger.info("Polling: submitted import+enrich for competition %d (%s)", comp.id, comp.name)
-                await session.commit()
+                await _poll_due_competitions(session, datetime.now(timezone.utc).replace(tzinfo=None))
         except Exception:
             logger.exception("Error in polling loop")
 
 
 @asynccontextmanager
 async def lifespan(_: Litestar) -> AsyncGenerator[None, None]:
-    await init_db()
+    pending_migrations = await init_db()
     job_queue.set_session_factory(async_session_factory)
     await job_queue.cleanup(days=7)
 
@@ -89,14 +106,16 @@ async def lifespan(_: Litestar) -> AsyncGenerator[None, None]:
     job_queue.set_handler(_handle_job)
     await job_queue.start_worker()
     polling_task = asyncio.create_task(_polling_loop())
+    migration_task = asyncio.create_task(run_background_migrations(engine, pending_migrations))
     try:
         yield
     finally:
-        polling_task.cancel()
-        try:
-            await polling_task
-        except asyncio.CancelledError:
-            pass
+        for task in (polling_task, migration_task):
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
         await job_queue.stop_worker()
 
 
@@ -104,6 +123,7 @@ cors_config = CORSConfig(
     allow_origins=ALLOWED_ORIGINS,
     allow_methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["Content-Type", "Authorization"],
+    expose_headers=["X-Total-Count"],
     allow_credentials=True,
 )
 
@@ -133,6 +153,7 @@ app = Litestar(
         notifications_router,
         team_scores_router,
         program_builder_router,
+        events_router,
     ],
     cors_config=cors_config,
     lifespan=[lifespan],
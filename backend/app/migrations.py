@@ -0,0 +1,616 @@
+"""
+Versioned schema migrations.
+
+Each step in MIGRATIONS runs once per database; applied versions are recorded
+in the ``schema_migrations`` table, so booting an up-to-date database only
+reads that table. Schema steps run in ``init_db`` before the app serves
+requests. Background steps are data backfills that scan whole tables: the
+lifespan runs them in a task after startup, and each one is recorded only
+once it has finished, so an interrupted backfill is retried at the next boot.
+A background step gets a connection outside any transaction and commits after
+each batch, so it never holds the SQLite write lock for a whole table; it must
+therefore be safe to rerun over rows an earlier attempt already filled.
+
+A new database is built by ``create_all`` and every step is recorded as
+applied without running it. To change an existing table, append a step with
+the next version number; never renumber or edit a step that has shipped.
+Steps must run on both SQLite and PostgreSQL; guard dialect-specific SQL on
+``conn.dialect.name``. On PostgreSQL several workers may boot at once: the
+runner holds an advisory lock, so one worker migrates while the others wait
+and then find nothing to do, and only one worker runs the backfills.
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+from sqlalchemy import DateTime, bindparam, inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from app.database import Base
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    apply: Callable[[AsyncConnection], Awaitable[None]]
+    background: bool = False
+
+
+async def _table_columns(conn: AsyncConnection, table: str) -> set[str]:
+    return await conn.run_sync(
+        lambda sync_conn: {column["name"] for column in inspect(sync_conn).get_columns(table)}
+    )
+
+
+async def add_columns(conn: AsyncConnection, columns: list[tuple[str, str, str]]) -> None:
+    """Add each missing ``(table, column, type)`` to an existing table."""
+    existing: dict[str, set[str]] = {}
+    for table, column, col_type in columns:
+        if table not in existing:
+            existing[table] = await _table_columns(conn, table)
+        if column in existing[table]:
+            continue
+        await conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {col_type}"))
+        existing[table].add(column)
+        logger.info("Added column %s.%s", table, column)
+
+
+async def create_missing_indexes(conn: AsyncConnection) -> None:
+    """Create model indexes missing from tables that predate them.
+
+    create_all only emits indexes together with their table, so indexes added
+    to an existing model are created here. A failure propagates, so the step
+    is not recorded and is retried at the next boot.
+    """
+    def _create_missing(sync_conn) -> None:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(sync_conn, checkfirst=True)
+
+    await conn.run_sync(_create_missing)
+
+
+async def _model_indexes(conn: AsyncConnection) -> None:
+    # Jobs queued before coalescing existed may repeat a (competition, type)
+    # pair, which the partial unique index rejects: keep the oldest of each.
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    result = await conn.execute(text("""
+        UPDATE jobs SET status = 'cancelled', completed_at = :now
+        WHERE status = 'queued' AND EXISTS (
+            SELECT 1 FROM jobs AS kept
+            WHERE kept.status = 'queued'
+              AND kept.competition_id = jobs.competition_id
+              AND kept.type = jobs.type
+              AND (kept.created_at < jobs.created_at
+                   OR (kept.created_at = jobs.created_at AND kept.id < jobs.id))
+        )
+    """).bindparams(bindparam("now", now, type_=DateTime)))
+    if result.rowcount:
+        logger.info("Cancelled %d duplicate queued jobs", result.rowcount)
+    await create_missing_indexes(conn)
+
+
+# Columns added to existing SQLite databases before migrations were versioned.
+_LEGACY_COLUMNS = [
+    ("competitions", "rink", "VARCHAR(255)"),
+    ("scores", "skating_level", "VARCHAR(20)"),
+    ("scores", "age_group", "VARCHAR(30)"),
+    ("scores", "gender", "VARCHAR(10)"),
+    ("category_results", "skating_level", "VARCHAR(20)"),
+    ("category_results", "age_group", "VARCHAR(30)"),
+    ("category_results", "gender", "VARCHAR(10)"),
+    ("users", "must_change_password", "BOOLEAN DEFAULT 0"),
+    ("users", "email_notifications", "BOOLEAN DEFAULT 1"),
+    ("users", "last_login_at", "DATETIME"),
+    ("skaters", "training_tracked", "BOOLEAN DEFAULT 0"),
+    ("skaters", "manual_create", "BOOLEAN DEFAULT 0"),
+    ("app_settings", "training_enabled", "INTEGER DEFAULT 0"),
+    ("app_settings", "smtp_host", "VARCHAR(255)"),
+    ("app_settings", "smtp_port", "INTEGER DEFAULT 587"),
+    ("app_settings", "smtp_user", "VARCHAR(255)"),
+    ("app_settings", "smtp_password", "TEXT"),
+    ("app_settings", "smtp_from", "VARCHAR(255)"),
+    ("app_settings", "smtp_from_name", "VARCHAR(255)"),
+    ("competitions", "ligue", "VARCHAR(50)"),
+    ("competitions", "date_end", "DATE"),
+    ("competitions", "polling_enabled", "BOOLEAN DEFAULT 0"),
+    ("competitions", "polling_activated_at", "DATETIME"),
+    ("competitions", "schedule_dates", "JSON"),
+    ("competitions", "next_poll_at", "DATETIME"),
+    ("competitions", "last_polled_at", "DATETIME"),
+    ("competitions", "last_change_at", "DATETIME"),
+    ("competitions", "poll_quiet_streak", "INTEGER DEFAULT 0"),
+    ("competitions", "segment_status", "JSON"),
+    ("skaters", "club_key", "VARCHAR(255)"),
+    ("scores", "club_key", "VARCHAR(255)"),
+    ("category_results", "club_key", "VARCHAR(255)"),
+    ("competitions", "team_medians", "JSON"),
+    ("app_settings", "default_team_medians", "JSON"),
+    ("scores", "is_titular", "BOOLEAN"),
+    ("scores", "club", "VARCHAR(255)"),
+    ("category_results", "club", "VARCHAR(255)"),
+    ("jobs", "claimed_by", "VARCHAR(64)"),
+    ("jobs", "lease_until", "DATETIME"),
+    ("jobs", "heartbeat_at", "DATETIME"),
+    ("jobs", "priority", "INTEGER DEFAULT 1 NOT NULL"),
+    ("jobs", "deadline", "DATETIME"),
+    ("jobs", "progress", "JSON"),
+    ("jobs", "metrics", "JSON"),
+]
+
+
+async def _legacy_columns(conn: AsyncConnection) -> None:
+    # PostgreSQL support postdates these columns: such databases start out
+    # complete, and the SQLite column types above would not parse there.
+    if conn.dialect.name != "sqlite":
+        return
+    await add_columns(conn, _LEGACY_COLUMNS)
+
+
+async def _drop_self_eval_unique(conn: AsyncConnection) -> None:
+    """Drop the (skater, date) unique constraint on self_evaluations.
+
+    SQLite does not support ALTER TABLE DROP CONSTRAINT, so the table is
+    recreated without it.
+    """
+    if conn.dialect.name != "sqlite":
+        return
+    result = await conn.execute(
+        text("SELECT sql FROM sqlite_master WHERE type='table' AND name='self_evaluations'")
+    )
+    row = result.fetchone()
+    if not row or "uq_self_eval_skater_date" not in (row[0] or ""):
+        return
+    logger.info("Recreating self_evaluations table to drop unique constraint")
+    await conn.execute(text("ALTER TABLE self_evaluations RENAME TO _self_evaluations_old"))
+    await conn.execute(text("""
+        CREATE TABLE self_evaluations (
+            id INTEGER NOT NULL PRIMARY KEY,
+            skater_id INTEGER NOT NULL,
+            mood_id INTEGER,
+            date DATE NOT NULL,
+            notes TEXT,
+            element_ratings JSON,
+            shared BOOLEAN NOT NULL,
+            created_at DATETIME NOT NULL,
+            updated_at DATETIME NOT NULL,
+            FOREIGN KEY(skater_id) REFERENCES skaters (id) ON DELETE CASCADE,
+            FOREIGN KEY(mood_id) REFERENCES training_moods (id) ON DELETE SET NULL
+        )
+    """))
+    await conn.execute(text("""
+        INSERT INTO self_evaluations
+        SELECT * FROM _self_evaluations_old
+    """))
+    await conn.execute(text("DROP TABLE _self_evaluations_old"))
+    logger.info("Dropped unique constraint uq_self_eval_skater_date")
+
+
+async def _drop_club_expression_indexes(conn: AsyncConnection) -> None:
+    """Drop the lower()/upper() club indexes superseded by the club_key columns."""
+    for name in (
+        "ix_scores_club_lower",
+        "ix_category_results_club_lower",
+        "ix_skaters_club_lower",
+        "ix_skaters_club_upper",
+    ):
+        await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+
+async def _backfill_job_deadlines(conn: AsyncConnection) -> None:
+    """Give jobs queued before priorities existed a deadline, in FIFO order."""
+    await conn.execute(text(
+        "UPDATE jobs SET deadline = created_at WHERE deadline IS NULL AND status = 'queued'"
+    ))
+
+
+async def _backfill_score_club(conn: AsyncConnection) -> None:
+    """Copy skater.club to scores/category_results where club is NULL.
+
+    Walks each table in id ranges of _BACKFILL_BATCH rows, one commit per range.
+    """
+    for table in ("scores", "category_results"):
+        max_id = (await conn.execute(text(f"SELECT MAX(id) FROM {table}"))).scalar() or 0
+        for low in range(0, max_id, _BACKFILL_BATCH):
+            await conn.execute(text(f"""
+                UPDATE {table} SET club = (
+                    SELECT skaters.club FROM skaters WHERE skaters.id = {table}.skater_id
+                ) WHERE {table}.club IS NULL AND {table}.id > :low AND {table}.id <= :high
+            """), {"low": low, "high": low + _BACKFILL_BATCH})
+            await conn.commit()
+    logger.info("Backfilled score/category_result club from skater.club")
+
+
+_BACKFILL_BATCH = 5000
+
+
+async def _backfill_club_keys(conn: AsyncConnection) -> None:
+    """Fill club_key for rows written before it existed (or by raw SQL).
+
+    One UPDATE per distinct club name: there are far fewer clubs than rows.
+    """
+    from app.services.club_key import club_key
+
+    for table in ("skaters", "scores", "category_results"):
+        clubs = (await conn.execute(text(
+            f"SELECT DISTINCT club FROM {table} WHERE club_key IS NULL AND club IS NOT NULL"
+        ))).scalars().all()
+        for club in clubs:
+            await conn.execute(
+                text(f"UPDATE {table} SET club_key = :key WHERE club = :club AND club_key IS NULL"),
+                {"key": club_key(club), "club": club},
+            )
+            await conn.commit()
+        if clubs:
+            logger.info("Backfilled club_key for %d club names in %s", len(clubs), table)
+
+
+async def _backfill_categories(conn: AsyncConnection) -> None:
+    """Parse category field for existing rows that lack structured fields.
+
+    Only the distinct category strings are parsed; the results are joined
+    back with one UPDATE ... FROM per chunk of categories.
+    """
+    from app.services.category_parser import parse_category
+
+    for table in ("scores", "category_results"):
+        categories = (await conn.execute(text(
+            f"SELECT DISTINCT category FROM {table}"
+            " WHERE skating_level IS NULL AND category IS NOT NULL"
+        ))).scalars().all()
+        for start in range(0, len(categories), _CATEGORY_CHUNK):
+            chunk = categories[start:start + _CATEGORY_CHUNK]
+            params: dict[str, str | None] = {}
+            rows = []
+            for i, category in enumerate(chunk):
+                parsed = parse_category(category)
+                params.update({
+                    f"c{i}": category,
+                    f"l{i}": parsed["skating_level"],
+                    f"a{i}": parsed["age_group"],
+                    f"g{i}": parsed["gender"],
+                })
+                rows.append(f"(:c{i}, :l{i}, :a{i}, :g{i})")
+            # The NULL test is wrapped in CASE so SQLite can't drive the join
+            # from the skating_level index, which would rescan every unparsed
+            # row once per category; it looks up rows by category instead.
+            await conn.execute(text(
+                f"WITH parsed (category, skating_level, age_group, gender) AS (VALUES {', '.join(rows)})"
+                f" UPDATE {table} SET skating_level = parsed.skating_level,"
+                " age_group = parsed.age_group, gender = parsed.gender"
+                f" FROM parsed WHERE {table}.category = parsed.category"
+                f" AND (CASE WHEN {table}.skating_level IS NULL THEN 1 END) = 1"
+            ), params)
+            await conn.commit()
+        if categories:
+            logger.info("Backfilled categories for %d category strings in %s", len(categories), table)
+
+
+# Four bind parameters per category; stays under SQLite's historical 999 limit.
+_CATEGORY_CHUNK = 200
+
+
+async def _merge_pair_skaters(conn: AsyncConnection) -> None:
+    """Merge old-format pair skater records into the correct format.
+
+    Old format: first_name="Laurence", last_name="FOURNIER BEAUDRY / Guillaume CIZERON"
+    New format: first_name="",         last_name="Laurence FOURNIER BEAUDRY / Guillaume CIZERON"
+
+    Reassigns scores and category_results from old to new, then deletes orphans.
+    """
+    from sqlalchemy import exists
+
+    from app.models.skater import Skater
+    from app.models.score import Score
+    from app.models.category_result import CategoryResult
+
+    async with AsyncSession(bind=conn, expire_on_commit=False) as session:
+        # Find old-format pair skaters: non-empty first_name with " / " in last_name
+        result = await session.execute(
+            select(Skater).where(
+                Skater.first_name != "",
+                Skater.last_name.contains(" / "),
+            )
+        )
+        old_pairs = result.scalars().all()
+
+        merged = 0
+        for old in old_pairs:
+            correct_last = f"{old.first_name} {old.last_name}"
+            # Check if the correct-format record already exists
+            result = await session.execute(
+                select(Skater).where(
+                    Skater.first_name == "",
+                    Skater.last_name == correct_last,
+                )
+            )
+            new = result.scalar_one_or_none()
+
+            if new:
+                # Reassign scores from old to new (skip duplicates)
+                old_scores = (await session.execute(
+                    select(Score).where(Score.skater_id == old.id)
+                )).scalars().all()
+                for score in old_scores:
+                    existing = (await session.execute(
+                        select(Score).where(
+                            Score.skater_id == new.id,
+                            Score.competition_id == score.competition_id,
+                            Score.category == score.category,
+                            Score.segment == score.segment,
+                        )
+                    )).scalar_one_or_none()
+                    if existing:
+                        await session.delete(score)
+                    else:
+                        score.skater_id = new.id
+
+                # Reassign category_results from old to new (skip duplicates)
+                old_crs = (await session.execute(
+                    select(CategoryResult).where(CategoryResult.skater_id == old.id)
+                )).scalars().all()
+                for cr in old_crs:
+                    existing = (await session.execute(
+                        select(CategoryResult).where(
+                            CategoryResult.skater_id == new.id,
+                            CategoryResult.competition_id == cr.competition_id,
+                            CategoryResult.category == cr.category,
+                        )
+                    )).scalar_one_or_none()
+                    if existing:
+                        await session.delete(cr)
+                    else:
+                        cr.skater_id = new.id
+
+                # Merge metadata
+                if not new.nationality and old.nationality:
+                    new.nationality = old.nationality
+                if not new.club and old.club:
+                    new.club = old.club
+
+                await session.delete(old)
+            else:
+                # No new-format record — just fix the old one in place
+                old.last_name = correct_last
+                old.first_name = ""
+
+            merged += 1
+
+        if merged:
+            await session.flush()
+            logger.info("Merged %d old-format pair skater records", merged)
+
+        # Delete orphaned skaters (no scores and no category results, not manually created)
+        orphan_stmt = select(Skater).where(
+            ~exists(select(Score.id).where(Score.skater_id == Skater.id)),
+            ~exists(select(CategoryResult.id).where(CategoryResult.skater_id == Skater.id)),
+            Skater.manual_create != True,  # noqa: E712
+        )
+        orphans = (await session.execute(orphan_stmt)).scalars().all()
+        if orphans:
+            for orphan in orphans:
+                await session.delete(orphan)
+            await session.flush()
+            logger.info("Deleted %d orphaned skater records", len(orphans))
+        await session.commit()
+
+
+async def _backfill_score_elements(conn: AsyncConnection) -> None:
+    """Fill score_elements for enriched scores that have no element rows yet."""
+    from app.models.score import Score
+    from app.models.score_element import ScoreElement
+    from app.services.score_elements import element_rows
+
+    last_id = 0
+    filled = 0
+    while True:
+        scores = (await conn.execute(
+            select(Score.id, Score.elements)
+            .where(
+                Score.id > last_id,
+                Score.elements.isnot(None),
+                ~select(ScoreElement.id).where(ScoreElement.score_id == Score.id).exists(),
+            )
+            .order_by(Score.id)
+            .limit(_SCORE_ELEMENTS_BATCH)
+        )).all()
+        if not scores:
+            break
+        rows = [
+            {"score_id": score_id, **row}
+            for score_id, elements in scores
+            for row in element_rows(elements)
+        ]
+        if rows:
+            await conn.execute(ScoreElement.__table__.insert(), rows)
+        await conn.commit()
+        filled += len(scores)
+        last_id = scores[-1][0]
+    if filled:
+        logger.info("Backfilled score_elements for %d scores", filled)
+
+
+_SCORE_ELEMENTS_BATCH = 500
+
+
+async def _backfill_season_summaries(conn: AsyncConnection) -> None:
+    """Build skater_season_summaries for results imported before it existed."""
+    from app.models.skater import Skater
+    from app.services.season_summary import refresh_season_summaries
+
+    last_id = 0
+    built = 0
+    async with AsyncSession(bind=conn, expire_on_commit=False) as session:
+        while True:
+            skater_ids = (await session.execute(
+                select(Skater.id).where(Skater.id > last_id).order_by(Skater.id).limit(_SUMMARY_BATCH)
+            )).scalars().all()
+            if not skater_ids:
+                break
+            built += await refresh_season_summaries(session, skater_ids)
+            await session.commit()
+            last_id = skater_ids[-1]
+    if built:
+        logger.info("Built %d skater season summaries", built)
+
+
+_SUMMARY_BATCH = 200
+
+
+async def _drop_element_type_index(conn: AsyncConnection) -> None:
+    """Drop the element_type index: SQLite picked it over the season and club filters."""
+    await conn.execute(text("DROP INDEX IF EXISTS ix_score_elements_type_base"))
+
+
+async def _backfill_score_distributions(conn: AsyncConnection) -> None:
+    """Build score_distributions for results imported before it existed."""
+    from app.services.score_distribution import all_cohorts, refresh_distributions
+
+    built = 0
+    async with AsyncSession(bind=conn, expire_on_commit=False) as session:
+        cohorts = await all_cohorts(session)
+        for start in range(0, len(cohorts), _DISTRIBUTION_BATCH):
+            built += await refresh_distributions(session, cohorts[start:start + _DISTRIBUTION_BATCH])
+            await session.commit()
+    if built:
+        logger.info("Built %d score distributions", built)
+
+
+_DISTRIBUTION_BATCH = 20
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(1, "legacy_columns", _legacy_columns),
+    Migration(2, "drop_self_eval_unique", _drop_self_eval_unique),
+    Migration(3, "drop_club_expression_indexes", _drop_club_expression_indexes),
+    Migration(4, "model_indexes", _model_indexes),
+    Migration(5, "backfill_job_deadlines", _backfill_job_deadlines),
+    Migration(6, "backfill_score_club", _backfill_score_club, background=True),
+    Migration(7, "backfill_club_keys", _backfill_club_keys, background=True),
+    Migration(8, "backfill_categories", _backfill_categories, background=True),
+    Migration(9, "merge_pair_skaters", _merge_pair_skaters, background=True),
+    Migration(10, "backfill_score_elements", _backfill_score_elements, background=True),
+    Migration(11, "backfill_season_summaries", _backfill_season_summaries, background=True),
+    Migration(12, "drop_element_type_index", _drop_element_type_index),
+    Migration(13, "backfill_score_distributions", _backfill_score_distributions, background=True),
+]
+
+
+async def _applied_versions(conn: AsyncConnection) -> set[int]:
+    from app.models.schema_migration import SchemaMigration
+
+    return set((await conn.execute(select(SchemaMigration.version))).scalars().all())
+
+
+async def _record(conn: AsyncConnection, migrations: list[Migration]) -> None:
+    from app.models.schema_migration import SchemaMigration
+
+    if migrations:
+        await conn.execute(
+            SchemaMigration.__table__.insert(),
+            [{"version": m.version, "name": m.name} for m in migrations],
+        )
+
+
+async def stamp_all(conn: AsyncConnection) -> None:
+    """Record every step as applied, for a database just built by create_all."""
+    await _record(conn, [m for m in MIGRATIONS if m.version not in await _applied_versions(conn)])
+
+
+# PostgreSQL advisory lock keys
+_SCHEMA_LOCK = 4_120_001
+_BACKFILL_LOCK = 4_120_002
+
+
+@asynccontextmanager
+async def _advisory_lock(engine: AsyncEngine, key: int, *, wait: bool = True):
+    """Hold a PostgreSQL advisory lock shared by all workers; yields whether it was taken.
+
+    With ``wait=False`` the lock is only tried. The lock lives on its own
+    connection outside any transaction. Other databases yield True without
+    locking: SQLite deployments run a single worker.
+    """
+    if engine.dialect.name != "postgresql":
+        yield True
+        return
+    async with engine.connect() as conn:
+        function = "pg_advisory_lock" if wait else "pg_try_advisory_lock"
+        acquired = (await conn.execute(text(f"SELECT {function}(:key)"), {"key": key})).scalar()
+        await conn.commit()
+        acquired = wait or bool(acquired)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+                await conn.commit()
+
+
+async def run_migrations(engine: AsyncEngine) -> list[Migration]:
+    """Create missing tables and apply pending schema steps.
+
+    Returns the background steps still pending, for run_background_migrations.
+    """
+    import app.models  # noqa: F401 — ensure all models registered
+
+    async with _advisory_lock(engine, _SCHEMA_LOCK):
+        return await _run_schema_steps(engine)
+
+
+async def _run_schema_steps(engine: AsyncEngine) -> list[Migration]:
+    async with engine.begin() as conn:
+        is_new = not await conn.run_sync(
+            lambda sync_conn: inspect(sync_conn).has_table("competitions")
+        )
+        await conn.run_sync(Base.metadata.create_all)
+        if is_new:
+            await stamp_all(conn)
+            return []
+        applied = await _applied_versions(conn)
+
+    for migration in MIGRATIONS:
+        if migration.version in applied or migration.background:
+            continue
+        async with engine.begin() as conn:
+            logger.info("Applying migration %d (%s)", migration.version, migration.name)
+            await migration.apply(conn)
+            await _record(conn, [migration])
+    return [m for m in MIGRATIONS if m.background and m.version not in applied]
+
+
+async def run_background_migrations(engine: AsyncEngine, pending: list[Migration]) -> None:
+    """Apply pending background steps in order, each on its own connection.
+
+    Stops at the first failure so later steps never run on top of a missing
+    backfill; the failed step is retried at the next boot. When another
+    worker is already running the backfills this one returns immediately.
+    """
+    async with _advisory_lock(engine, _BACKFILL_LOCK, wait=False) as acquired:
+        if acquired:
+            await _run_background_steps(engine, pending)
+
+
+async def _run_background_steps(engine: AsyncEngine, pending: list[Migration]) -> None:
+    # A worker that booted while another was backfilling may hold a stale list
+    async with engine.connect() as conn:
+        applied = await _applied_versions(conn)
+    for migration in pending:
+        if migration.version in applied:
+            continue
+        try:
+            async with engine.connect() as conn:
+                logger.info("Running background migration %d (%s)", migration.version, migration.name)
+                await migration.apply(conn)
+                await _record(conn, [migration])
+                await conn.commit()
+        except Exception:
+            logger.exception("Background migration %d (%s) failed", migration.version, migration.name)
+            return
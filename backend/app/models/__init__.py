@@ -1,6 +1,7 @@
 from app.models.competition import Competition
 from app.models.skater import Skater
 from app.models.score import Score
+from app.models.score_element import ScoreElement
 from app.models.category_result import CategoryResult
 from app.models.user import User
 from app.models.user_skater import UserSkater
@@ -15,11 +16,16 @@ from app.models.job import Job
 from app.models.skater_program import SkaterProgram
 from app.models.training_mood import TrainingMood
 from app.models.self_evaluation import SelfEvaluation
+from app.models.schema_migration import SchemaMigration
+from app.models.skater_season_summary import SkaterSeasonSummary
+from app.models.data_version import DataVersion
+from app.models.score_distribution import ScoreDistribution
 
 __all__ = [
     "Competition",
     "Skater",
     "Score",
+    "ScoreElement",
     "CategoryResult",
     "User",
     "UserSkater",
@@ -34,4 +40,8 @@ __all__ = [
     "SkaterProgram",
     "TrainingMood",
     "SelfEvaluation",
+    "SchemaMigration",
+    "SkaterSeasonSummary",
+    "DataVersion",
+    "ScoreDistribution",
 ]
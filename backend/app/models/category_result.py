@@ -1,9 +1,10 @@
 from typing import Optional
 
-from sqlalchemy import ForeignKey, String, Float, Integer, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import ForeignKey, Index, String, Float, Integer, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.database import Base
+from app.services.club_key import club_key as _club_key
 
 
 class CategoryResult(Base):
@@ -20,6 +21,9 @@ class CategoryResult(Base):
             "competition_id", "skater_id", "category",
             name="uq_catresult_competition_skater_cat",
         ),
+        Index("ix_category_results_skater_competition", "skater_id", "competition_id"),
+        Index("ix_category_results_level_age_gender", "skating_level", "age_group", "gender"),
+        Index("ix_category_results_club_key", "club_key"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -39,6 +43,7 @@ class CategoryResult(Base):
     age_group: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
     gender: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
     club: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    club_key: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     competition: Mapped["Competition"] = relationship(  # noqa: F821
         "Competition", back_populates="category_results"
@@ -46,3 +51,8 @@ class CategoryResult(Base):
     skater: Mapped["Skater"] = relationship(  # noqa: F821
         "Skater", back_populates="category_results"
     )
+
+    @validates("club")
+    def _sync_club_key(self, _key: str, club: str | None) -> str | None:
+        self.club_key = _club_key(club)
+        return club
@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import String, Date, Text, JSON, Boolean, DateTime
+from sqlalchemy import String, Date, Text, JSON, Boolean, DateTime, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -9,6 +9,10 @@ from app.database import Base
 
 class Competition(Base):
     __tablename__ = "competitions"
+    __table_args__ = (
+        # Season filters, ordered by date
+        Index("ix_competitions_season_date", "season", "date"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -25,8 +29,23 @@ class Competition(Base):
     metadata_confirmed: Mapped[bool] = mapped_column(Boolean, default=False, server_default="0")
     polling_enabled: Mapped[bool] = mapped_column(Boolean, default=False, server_default="0")
     polling_activated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    last_import_log: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    team_medians: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    # Polling schedule state; see services/poll_scheduler.py.
+    schedule_dates: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    next_poll_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    last_polled_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    last_change_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    poll_quiet_streak: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    # Per-segment live state keyed by SEG page URL:
+    # {"fingerprint", "pdf_url", "finished"}; finished segments are not refetched.
+    segment_status: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    # Deferred: only the import-status and team-score paths read these; see
+    # services/raw_json.py for serving them without decoding.
+    last_import_log: Mapped[Optional[dict]] = mapped_column(
+        JSON, nullable=True, deferred=True, deferred_raiseload=True
+    )
+    team_medians: Mapped[Optional[dict]] = mapped_column(
+        JSON, nullable=True, deferred=True, deferred_raiseload=True
+    )
 
     scores: Mapped[list["Score"]] = relationship(  # noqa: F821
         "Score", back_populates="competition", cascade="all, delete-orphan"
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class DataVersion(Base):
+    """Single row whose token changes with every write to competition results.
+
+    Cached responses are only served while the token they were computed
+    under is current (see services/response_cache.py).
+    """
+
+    __tablename__ = "data_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    token: Mapped[str] = mapped_column(String(32), nullable=False)
@@ -1,24 +1,59 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Text, JSON, DateTime, Integer, ForeignKey
+from sqlalchemy import String, Text, JSON, DateTime, Integer, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
 
 
+def _default_deadline(context) -> datetime | None:
+    return context.get_current_parameters().get("created_at")
+
+
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # At most one queued job per (competition, type): backs job coalescing.
+        Index(
+            "uq_jobs_queued_competition_type",
+            "competition_id",
+            "type",
+            unique=True,
+            sqlite_where=text("status = 'queued'"),
+            postgresql_where=text("status = 'queued'"),
+        ),
+        # Job history pages are keyed on (created_at, id), optionally per status
+        # or competition.
+        Index("ix_jobs_status_created_at", "status", "created_at"),
+        Index("ix_jobs_created_at_id", "created_at", "id"),
+        Index("ix_jobs_competition_created_at", "competition_id", "created_at"),
+        # Workers look up the queued job with the earliest deadline on every poll.
+        Index("ix_jobs_status_deadline", "status", "deadline", "priority"),
+    )
 
     id: Mapped[str] = mapped_column(String(12), primary_key=True)
     type: Mapped[str] = mapped_column(String(20), nullable=False)
     trigger: Mapped[str] = mapped_column(String(10), nullable=False, default="manual")
     competition_id: Mapped[int] = mapped_column(Integer, ForeignKey("competitions.id"), nullable=False)
     status: Mapped[str] = mapped_column(String(20), nullable=False, default="queued")
+    # Priority class (0 = manual, 1 = auto, 2 = bulk) and the time by which the
+    # job should run; see job_queue._PRIORITIES.
+    priority: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+    deadline: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True, default=_default_deadline
+    )
     result: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Live progress while running ({"phase", "done", "total"}) and per-phase
+    # timings once finished ({"total_seconds", "phases": {name: {seconds, count}}}).
+    progress: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    metrics: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    claimed_by: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    lease_until: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     competition: Mapped["Competition"] = relationship("Competition", back_populates="jobs")  # noqa: F821
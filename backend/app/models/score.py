@@ -1,16 +1,23 @@
 from datetime import date
 from typing import Optional
 
-from sqlalchemy import Boolean, Date, ForeignKey, String, Float, Integer, JSON, Text, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Boolean, Date, ForeignKey, Index, String, Float, Integer, JSON, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.database import Base
+from app.models.types import JSONDocument
+from app.services.club_key import club_key as _club_key
 
 
 class Score(Base):
     __tablename__ = "scores"
     __table_args__ = (
         UniqueConstraint("competition_id", "skater_id", "category", "segment", name="uq_score_competition_skater_cat_seg"),
+        # Skater pages and per-skater analytics
+        Index("ix_scores_skater_competition", "skater_id", "competition_id"),
+        # Level / age / gender filters of the stats routes
+        Index("ix_scores_level_age_gender", "skating_level", "age_group", "gender"),
+        Index("ix_scores_club_key", "club_key"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -24,16 +31,26 @@ class Score(Base):
     technical_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     component_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     deductions: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
-    components: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    elements: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    # Heavy JSON columns are deferred: queries that need them opt in with
+    # undefer(), or select the stored text through services/raw_json.py.
+    components: Mapped[Optional[dict]] = mapped_column(
+        JSONDocument, nullable=True, deferred=True, deferred_raiseload=True
+    )
+    elements: Mapped[Optional[dict]] = mapped_column(
+        JSONDocument, nullable=True, deferred=True, deferred_raiseload=True
+    )
     event_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     pdf_path: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    raw_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    raw_data: Mapped[Optional[dict]] = mapped_column(
+        JSON, nullable=True, deferred=True, deferred_raiseload=True
+    )
     skating_level: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     age_group: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
     gender: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
     is_titular: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True, default=None)
     club: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    # Normalized club, kept in sync with ``club``; see services/club_key.py.
+    club_key: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     competition: Mapped["Competition"] = relationship(  # noqa: F821
         "Competition", back_populates="scores"
@@ -41,3 +58,12 @@ class Score(Base):
     skater: Mapped["Skater"] = relationship(  # noqa: F821
         "Skater", back_populates="scores"
     )
+    element_rows: Mapped[list["ScoreElement"]] = relationship(  # noqa: F821
+        "ScoreElement", back_populates="parent", cascade="all, delete-orphan",
+        order_by="ScoreElement.position",
+    )
+
+    @validates("club")
+    def _sync_club_key(self, _key: str, club: str | None) -> str | None:
+        self.club_key = _club_key(club)
+        return club
@@ -0,0 +1,39 @@
+from typing import Optional
+
+from sqlalchemy import Float, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.models.types import JSONDocument
+
+
+class ScoreDistribution(Base):
+    """Sorted scores of one cohort, with its quartiles precomputed.
+
+    One row per season, level, age group, gender and segment; the segment is
+    a Score.segment code for segment totals or "combined" for category
+    combined totals. Rebuilt for the cohorts an import or competition edit
+    touches (see services/score_distribution.py), so benchmarks, percentile
+    ranks and histograms read one row instead of every result of the cohort.
+    """
+
+    __tablename__ = "score_distributions"
+    __table_args__ = (
+        Index("ix_score_distributions_cohort", "skating_level", "age_group", "gender", "segment", "season"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    season: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    skating_level: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    age_group: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
+    gender: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    segment: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    count: Mapped[int] = mapped_column(Integer, nullable=False)
+    min_value: Mapped[float] = mapped_column(Float, nullable=False)
+    max_value: Mapped[float] = mapped_column(Float, nullable=False)
+    p25: Mapped[float] = mapped_column(Float, nullable=False)
+    median: Mapped[float] = mapped_column(Float, nullable=False)
+    p75: Mapped[float] = mapped_column(Float, nullable=False)
+    # Every score of the cohort, ascending
+    sorted_values: Mapped[list] = mapped_column(JSONDocument, nullable=False)
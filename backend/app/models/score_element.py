@@ -0,0 +1,52 @@
+from typing import Optional
+
+from sqlalchemy import Float, ForeignKey, Index, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.database import Base
+from app.models.types import JSONDocument
+
+
+class ScoreElement(Base):
+    """One executed element of a scored program, as read from the PDF score sheet.
+
+    Mirrors ``Score.elements`` row by row so element analytics can be
+    aggregated in SQL; filled by run_enrich (see services/score_elements.py).
+    """
+
+    __tablename__ = "score_elements"
+    __table_args__ = (
+        # Also the score_id index element mastery reaches elements through,
+        # from the season's club scores. An index on element_type would draw
+        # SQLite (without ANALYZE statistics) into reading every jump ever
+        # recorded instead.
+        UniqueConstraint("score_id", "position", name="uq_score_element_position"),
+        Index("ix_score_elements_code", "code"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    score_id: Mapped[int] = mapped_column(
+        ForeignKey("scores.id", ondelete="CASCADE"), nullable=False
+    )
+    # Order of the element in the program (1-based)
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Element code without markers, e.g. "3Lz+2T", "CCoSp4"
+    code: Mapped[str] = mapped_column(String(50), nullable=False)
+    # "jump", "spin", "step" or None (element_classifier.classify_element)
+    element_type: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    # Jump type with rotations for jumps ("3Lz"), code without level otherwise ("CCoSp")
+    base_code: Mapped[str] = mapped_column(String(50), nullable=False)
+    jump_type: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    level: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    # ISU markers as a bitmask (score_elements.MARKER_BITS) for filtering, and
+    # as parsed (positional for combos) for display.
+    markers_mask: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    markers: Mapped[Optional[list]] = mapped_column(JSONDocument, nullable=True)
+    base_value: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    goe: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    judge_goe: Mapped[Optional[list]] = mapped_column(JSONDocument, nullable=True)
+    score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+    parent: Mapped["Score"] = relationship(  # noqa: F821
+        "Score", back_populates="element_rows"
+    )
@@ -1,15 +1,17 @@
 from typing import Optional
 
-from sqlalchemy import Boolean, String, Integer, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Boolean, Index, String, Integer, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.database import Base
+from app.services.club_key import club_key as _club_key
 
 
 class Skater(Base):
     __tablename__ = "skaters"
     __table_args__ = (
         UniqueConstraint("first_name", "last_name", name="uq_skater_name"),
+        Index("ix_skaters_club_key", "club_key"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -17,6 +19,7 @@ class Skater(Base):
     last_name: Mapped[str] = mapped_column(String(255), nullable=False)
     nationality: Mapped[Optional[str]] = mapped_column(String(3), nullable=True)
     club: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    club_key: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     birth_year: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     training_tracked: Mapped[bool] = mapped_column(Boolean, default=False, server_default="0")
     manual_create: Mapped[bool] = mapped_column(Boolean, default=False, server_default="0")
@@ -31,6 +34,16 @@ class Skater(Base):
     @property
     def display_name(self) -> str:
         """Formatted display name: 'Firstname LASTNAME'."""
-        if self.first_name:
-            return f"{self.first_name} {self.last_name}"
-        return self.last_name
+        return self.format_name(self.first_name, self.last_name)
+
+    @staticmethod
+    def format_name(first_name: str | None, last_name: str) -> str:
+        """``display_name`` of selected name columns, without loading the skater."""
+        if first_name:
+            return f"{first_name} {last_name}"
+        return last_name
+
+    @validates("club")
+    def _sync_club_key(self, _key: str, club: str | None) -> str | None:
+        self.club_key = _club_key(club)
+        return club
@@ -1,13 +1,14 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Integer, JSON, String, ForeignKey, UniqueConstraint
+from sqlalchemy import DateTime, Integer, String, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.models.types import JSONDocument
 
 
 def _utcnow() -> datetime:
-    return datetime.now(timezone.utc)
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 class SkaterProgram(Base):
@@ -21,6 +22,6 @@ class SkaterProgram(Base):
         Integer, ForeignKey("skaters.id", ondelete="CASCADE"), nullable=False
     )
     segment: Mapped[str] = mapped_column(String(4), nullable=False)
-    elements: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    elements: Mapped[list] = mapped_column(JSONDocument, nullable=False, default=list)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=_utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=_utcnow, onupdate=_utcnow)
@@ -0,0 +1,60 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import Date, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.models.types import JSONDocument
+
+
+class SkaterSeasonSummary(Base):
+    """Per-skater season totals, derived from scores and category results.
+
+    One row per skater, season and category track (level, age group, gender
+    and the club the results were entered under). Rebuilt for the skaters an
+    import or merge touches (see services/season_summary.py), so the
+    dashboard, rankings and reports read a handful of rows instead of every
+    result of the season.
+    """
+
+    __tablename__ = "skater_season_summaries"
+    __table_args__ = (
+        Index("ix_skater_season_summaries_skater", "skater_id"),
+        Index("ix_skater_season_summaries_season_level", "season", "skating_level", "age_group"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    skater_id: Mapped[int] = mapped_column(
+        ForeignKey("skaters.id", ondelete="CASCADE"), nullable=False
+    )
+    season: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    skating_level: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    age_group: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
+    gender: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    club_key: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    # Category of the latest result in the track
+    category: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+
+    # Distinct competitions, segment scores, podiums and scored category results
+    competitions_entered: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    programs: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    podiums: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    results_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # First and last category combined total, in competition date order
+    first_tss: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    first_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+    last_tss: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    last_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+
+    # Best combined total, counting segment scores that have no category result
+    best_total: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    # Highest segment TSS, TES and PCS, each on its own
+    best_tss: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    best_tes: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    best_pcs: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    # {segment: {"tss", "tes", "pcs", "competition", "date"}} of the best TSS per segment
+    segment_bests: Mapped[Optional[dict]] = mapped_column(JSONDocument, nullable=True)
+    # [{"date", "value"}] combined totals in date order, for sparklines
+    progression: Mapped[Optional[list]] = mapped_column(JSONDocument, nullable=True)
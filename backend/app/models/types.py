@@ -0,0 +1,8 @@
+"""Column types shared by the models."""
+
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
+
+# Element and component documents: JSONB on PostgreSQL (parsed once at write
+# time, indexable), plain JSON text on SQLite.
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
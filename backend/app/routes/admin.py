@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from litestar import Router, post, Request
+from litestar import Router, get, post, Request
 from litestar.di import Provide
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.guards import require_admin
-from app.database import get_session, engine, Base, _bootstrap
+from app.database import get_session, engine, Base, _bootstrap, async_session_factory
+from app.migrations import stamp_all
+from app.services.club_key import club_key
+from app.services.response_cache import bump_data_version, response_cache
+from app.services.single_flight import single_flight
 
 
 @post("/reset-database")
@@ -18,8 +22,14 @@ async def reset_database(request: Request) -> dict:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
+        await stamp_all(conn)
 
     await _bootstrap()
+    # Workers that cached the empty version of the new table must drop their entries too
+    async with async_session_factory() as session:
+        await bump_data_version(session)
+        await session.commit()
+    response_cache.clear()
 
     return {"status": "ok", "message": "Database reset successfully"}
 
@@ -62,16 +72,34 @@ async def recalculate_clubs(request: Request, session: AsyncSession) -> dict:
         result = await session.execute(
             update(Skater)
             .where(Skater.id == skater_id, Skater.club != club)
-            .values(club=club)
+            .values(club=club, club_key=club_key(club))
         )
         updated += result.rowcount
 
+    await bump_data_version(session)
     await session.commit()
     return {"status": "ok", "skaters_updated": updated}
 
 
+@get("/cache")
+async def get_cache_stats(request: Request) -> dict:
+    """This worker's response cache counters and request coalescing. Admin only."""
+    require_admin(request)
+    return {**response_cache.stats(), "single_flight": single_flight.stats()}
+
+
+@post("/cache/flush")
+async def flush_cache(request: Request, session: AsyncSession) -> dict:
+    """Drop the cached dashboard and stats responses of every worker. Admin only."""
+    require_admin(request)
+    await bump_data_version(session)
+    await session.commit()
+    response_cache.clear()
+    return response_cache.stats()
+
+
 router = Router(
     path="/api/admin",
-    route_handlers=[reset_database, recalculate_clubs],
+    route_handlers=[reset_database, recalculate_clubs, get_cache_stats, flush_cache],
     dependencies={"session": Provide(get_session)},
 )
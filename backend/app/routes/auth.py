@@ -62,7 +62,7 @@ async def login(data: dict, session: AsyncSession) -> Response:
     if not user.is_active:
         raise NotAuthorizedException("Account is disabled")
 
-    user.last_login_at = datetime.now(timezone.utc)
+    user.last_login_at = datetime.now(timezone.utc).replace(tzinfo=None)
     await session.commit()
 
     access = create_access_token(user_id=user.id, role=user.role)
@@ -221,7 +221,7 @@ async def google_login(data: dict, session: AsyncSession) -> Response:
             if not user.is_active:
                 raise NotAuthorizedException("Account is disabled")
             user.google_oauth_enabled = True
-            user.last_login_at = datetime.now(timezone.utc)
+            user.last_login_at = datetime.now(timezone.utc).replace(tzinfo=None)
             await session.commit()
         else:
             domain = email.split("@")[1] if "@" in email else ""
@@ -13,6 +13,7 @@ from app.auth.guards import reject_skater_role, require_admin
 from app.config import LOGOS_DIR, GOOGLE_CLIENT_ID
 from app.database import get_session
 from app.models.app_settings import AppSettings
+from app.services.response_cache import bump_data_version
 
 
 @get("/")
@@ -59,6 +60,7 @@ async def update_config(
     if "training_enabled" in data:
         settings.training_enabled = bool(data["training_enabled"])
 
+    await bump_data_version(session)
     await session.commit()
     await session.refresh(settings)
 
@@ -5,15 +5,22 @@ from datetime import date as date_type, datetime, timezone
 from litestar import Router, get, post, delete, patch, Request
 from litestar.di import Provide
 from litestar.exceptions import NotFoundException
-from sqlalchemy import select, distinct, func
+from sqlalchemy import select, distinct
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.guards import reject_skater_role, require_admin
-from app.database import get_session
+from app.database import get_read_session, get_session
 from app.models.competition import Competition
 from app.models.category_result import CategoryResult
 from app.models.skater import Skater
 from app.models.app_settings import AppSettings
+from app.services.club_key import club_filter
+from app.services import poll_scheduler
+from app.services.raw_json import as_raw, raw_json
+from app.services.response_cache import bump_data_version
+from app.services.score_distribution import competition_cohorts, refresh_distributions
+from app.services.season_summary import competition_skater_ids, refresh_season_summaries
+from app.services.upsert import insert_ignore
 
 
 # --- DTOs ---
@@ -35,12 +42,13 @@ def competition_to_dict(c: Competition) -> dict:
         "metadata_confirmed": c.metadata_confirmed,
         "polling_enabled": c.polling_enabled,
         "polling_activated_at": c.polling_activated_at.isoformat() if c.polling_activated_at else None,
+        "next_poll_at": c.next_poll_at.isoformat() if c.next_poll_at else None,
     }
 
 
 # --- Handlers ---
 
-@get("/")
+@get("/", dependencies={"session": Provide(get_read_session)})
 async def list_competitions(
     request: Request,
     session: AsyncSession,
@@ -63,18 +71,18 @@ async def list_competitions(
     if ligue:
         stmt = stmt.where(Competition.ligue == ligue)
     if effective_club:
-        stmt = (
-            stmt
-            .join(CategoryResult, CategoryResult.competition_id == Competition.id)
+        # IN rather than JOIN + DISTINCT: PostgreSQL can't compare the JSON
+        # columns of competitions for DISTINCT.
+        stmt = stmt.where(Competition.id.in_(
+            select(CategoryResult.competition_id)
             .join(Skater, Skater.id == CategoryResult.skater_id)
-            .where(func.upper(Skater.club) == effective_club.upper())
-            .distinct()
-        )
+            .where(club_filter(effective_club, Skater.club_key))
+        ))
     result = await session.execute(stmt)
     return [competition_to_dict(c) for c in result.scalars()]
 
 
-@get("/{competition_id:int}")
+@get("/{competition_id:int}", dependencies={"session": Provide(get_read_session)})
 async def get_competition(competition_id: int, request: Request, session: AsyncSession) -> dict:
     reject_skater_role(request)
     comp = await session.get(Competition, competition_id)
@@ -105,10 +113,16 @@ async def update_competition(competition_id: int, data: dict, request: Request,
     comp = await session.get(Competition, competition_id)
     if not comp:
         raise NotFoundException(f"Competition {competition_id} not found")
+    season_changed = "season" in data and data["season"] != comp.season
+    cohorts = await competition_cohorts(session, comp.id) if season_changed else set()
     for field in ("name", "city", "country", "competition_type", "season", "ligue"):
         if field in data:
             setattr(comp, field, data[field])
     comp.metadata_confirmed = True
+    if season_changed:
+        await refresh_season_summaries(session, await competition_skater_ids(session, comp.id))
+        await refresh_distributions(session, cohorts | await competition_cohorts(session, comp.id))
+    await bump_data_version(session)
     await session.commit()
     await session.refresh(comp)
     return competition_to_dict(comp)
@@ -119,7 +133,12 @@ async def delete_competition(competition_id: int, session: AsyncSession) -> None
     comp = await session.get(Competition, competition_id)
     if not comp:
         raise NotFoundException(f"Competition {competition_id} not found")
+    skater_ids = await competition_skater_ids(session, comp.id)
+    cohorts = await competition_cohorts(session, comp.id)
     await session.delete(comp)
+    await refresh_season_summaries(session, skater_ids)
+    await refresh_distributions(session, cohorts)
+    await bump_data_version(session)
     await session.commit()
 
 
@@ -134,15 +153,17 @@ async def import_competition(competition_id: int, session: AsyncSession, force:
     return await job_queue.create_job(job_type, competition_id, trigger="manual")
 
 
-@get("/{competition_id:int}/import-status")
+@get("/{competition_id:int}/import-status", dependencies={"session": Provide(get_read_session)})
 async def get_import_status(competition_id: int, session: AsyncSession) -> dict:
     """Return the last import log for a competition."""
-    comp = await session.get(Competition, competition_id)
-    if not comp:
+    row = (await session.execute(
+        select(raw_json(Competition.last_import_log)).where(Competition.id == competition_id)
+    )).one_or_none()
+    if row is None:
         raise NotFoundException(f"Competition {competition_id} not found")
-    if comp.last_import_log is None:
+    if row[0] is None:
         return {"status": "never_imported"}
-    return comp.last_import_log
+    return as_raw(row[0])
 
 
 @post("/{competition_id:int}/enrich")
@@ -178,6 +199,7 @@ async def backfill_metadata(request: Request, session: AsyncSession) -> dict:
     result_stmt = select(Competition).where(Competition.metadata_confirmed == False)  # noqa: E712
     comps = (await session.execute(result_stmt)).scalars().all()
     updated = 0
+    season_changed: list[int] = []
 
     async with httpx.AsyncClient(
         timeout=30.0,
@@ -206,6 +228,7 @@ async def backfill_metadata(request: Request, session: AsyncSession) -> dict:
                     comp.country = meta["country"]
                 if meta["season"] and not comp.season:
                     comp.season = meta["season"]
+                    season_changed.append(comp.id)
                 if comp_info.rink and not comp.rink:
                     comp.rink = comp_info.rink
                 if meta.get("ligue") and not comp.ligue:
@@ -214,6 +237,16 @@ async def backfill_metadata(request: Request, session: AsyncSession) -> dict:
             except Exception:
                 continue
 
+    skater_ids: set[int] = set()
+    cohorts: set = set()
+    for comp_id in season_changed:
+        skater_ids |= await competition_skater_ids(session, comp_id)
+        for season, *category in await competition_cohorts(session, comp_id):
+            # The results move from the cohorts without a season
+            cohorts |= {(season, *category), (None, *category)}
+    await refresh_season_summaries(session, skater_ids)
+    await refresh_distributions(session, cohorts)
+    await bump_data_version(session)
     await session.commit()
     return {"status": "ok", "competitions_updated": updated}
 
@@ -228,26 +261,24 @@ async def bulk_import(data: dict, session: AsyncSession) -> dict:
     season: str = data.get("season", "")
     discipline: str = data.get("discipline", "")
 
-    # First pass: create any missing competitions and commit so the write
-    # transaction is closed before job_queue.create_job opens its own session
-    # (SQLite does not support concurrent writers).
-    comp_ids = []
-    for raw_url in urls:
-        url = raw_url.strip()
-        existing = await session.execute(
-            select(Competition).where(Competition.url == url)
-        )
-        comp = existing.scalar_one_or_none()
-        if not comp:
-            comp = Competition(
-                name=url, url=url,
-                season=season or None, discipline=discipline or None,
-            )
-            session.add(comp)
-            await session.flush()
-            await session.refresh(comp)
-        comp_ids.append(comp.id)
+    # First pass: create the missing competitions in one statement. URLs that
+    # already exist, or that a concurrent request inserts first, are skipped.
+    # Commit before job_queue.create_job opens its own session so the jobs
+    # don't wait on this transaction.
+    urls = [raw_url.strip() for raw_url in urls]
+    if urls:
+        await insert_ignore(session, Competition, [
+            {
+                "name": url, "url": url,
+                "season": season or None, "discipline": discipline or None,
+            }
+            for url in dict.fromkeys(urls)
+        ], conflict=["url"])
+    ids_by_url = dict((await session.execute(
+        select(Competition.url, Competition.id).where(Competition.url.in_(urls))
+    )).all())
     await session.commit()
+    comp_ids = [ids_by_url[url] for url in urls]
 
     # Second pass: submit jobs (each create_job opens its own session)
     job_ids = []
@@ -294,7 +325,7 @@ async def bulk_action(data: dict, request: Request, session: AsyncSession) -> di
     return {"job_ids": job_ids, "total": len(job_ids)}
 
 
-@get("/seasons")
+@get("/seasons", dependencies={"session": Provide(get_read_session)})
 async def list_seasons(session: AsyncSession) -> list[str]:
     result = await session.execute(
         select(distinct(Competition.season))
@@ -313,7 +344,8 @@ async def toggle_polling(competition_id: int, data: dict, request: Request, sess
     enabled = data.get("enabled", False)
     comp.polling_enabled = enabled
     if enabled:
-        comp.polling_activated_at = datetime.now(timezone.utc)
+        comp.polling_activated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        poll_scheduler.reset_schedule(comp)
     await session.commit()
     await session.refresh(comp)
     return competition_to_dict(comp)
@@ -1,20 +1,24 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import Optional
 
 from litestar import Request, Router, get
 from litestar.di import Provide
-from sqlalchemy import func, or_, select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.auth.guards import reject_skater_role
 from app.config import CLUB_NAME, CLUB_SHORT
-from app.database import get_session
+from app.database import get_read_session
 from app.models.competition import Competition
 from app.models.score import Score
 from app.models.skater import Skater
 from app.models.category_result import CategoryResult
+from app.models.skater_season_summary import SkaterSeasonSummary
+from app.services.club_key import club_filter
+from app.services.response_cache import response_cache
+from app.services.season_summary import combine_summaries
 
 
 @get("/")
@@ -24,187 +28,135 @@ async def get_dashboard(
     season: Optional[str] = None,
 ) -> dict:
     reject_skater_role(request)
-    club_name = CLUB_SHORT
-
-    # Build a base subquery: scores joined with skaters (and competitions for season filter)
-    # that belong to the club.
-
-    def _club_filter_score():
-        """Club filter for queries joining Score + Skater."""
-        return or_(
-            func.lower(Score.club) == club_name.lower(),
-            func.lower(Skater.club) == club_name.lower(),
-        )
-
-    def _club_filter_cat():
-        """Club filter for queries joining CategoryResult + Skater."""
-        return or_(
-            func.lower(CategoryResult.club) == club_name.lower(),
-            func.lower(Skater.club) == club_name.lower(),
-        )
-
-    # --- Helper: base statement selecting Score joined to Skater and Competition ---
-    def _base_stmt():
-        stmt = (
-            select(Score)
-            .join(Score.skater)
-            .join(Score.competition)
-        )
-        if club_name != "":
-            stmt = stmt.where(_club_filter_score())
-        if season is not None:
-            stmt = stmt.where(Competition.season == season)
-        return stmt
-
-    # --- active_skaters ---
-    active_skaters_stmt = (
-        select(func.count(func.distinct(Score.skater_id)))
-        .join(Score.skater)
-        .join(Score.competition)
+    return await response_cache.get_or_compute(
+        session, "dashboard", {"season": season}, lambda: _dashboard(session, season)
     )
-    if club_name != "":
-        active_skaters_stmt = active_skaters_stmt.where(_club_filter_score())
-    if season is not None:
-        active_skaters_stmt = active_skaters_stmt.where(Competition.season == season)
 
-    active_skaters_result = await session.execute(active_skaters_stmt)
-    active_skaters = active_skaters_result.scalar() or 0
 
-    # --- competitions_tracked ---
-    competitions_tracked_stmt = (
-        select(func.count(func.distinct(Score.competition_id)))
-        .join(Score.skater)
-        .join(Score.competition)
+async def _dashboard(session: AsyncSession, season: Optional[str]) -> dict:
+    club_name = CLUB_SHORT
+
+    # --- Club scores of the season: one pass for the three counts ---
+    scored_stmt = (
+        select(Score.id, Score.skater_id, Score.competition_id)
+        .join(Skater, Score.skater_id == Skater.id)
+        .join(Competition, Score.competition_id == Competition.id)
     )
     if club_name != "":
-        competitions_tracked_stmt = competitions_tracked_stmt.where(_club_filter_score())
+        scored_stmt = scored_stmt.where(club_filter(club_name, Score.club_key, Skater.club_key))
     if season is not None:
-        competitions_tracked_stmt = competitions_tracked_stmt.where(
-            Competition.season == season
+        scored_stmt = scored_stmt.where(Competition.season == season)
+    club_scores = scored_stmt.cte("club_scores")
+
+    counts = (await session.execute(
+        select(
+            func.count(func.distinct(club_scores.c.skater_id)),
+            func.count(func.distinct(club_scores.c.competition_id)),
+            func.count(club_scores.c.id),
         )
-
-    competitions_tracked_result = await session.execute(competitions_tracked_stmt)
-    competitions_tracked = competitions_tracked_result.scalar() or 0
-
-    # --- total_programs ---
-    total_programs_stmt = (
-        select(func.count(Score.id))
-        .join(Score.skater)
-        .join(Score.competition)
+    )).one()
+    active_skaters, competitions_tracked, total_programs = (value or 0 for value in counts)
+
+    # --- medals (overall_rank <= 3) and top_scores (5 best combined totals) ---
+    # Both come from the club's category results of the season: one query
+    # ranks them by combined total and keeps the rows either list needs.
+    results_stmt = (
+        select(
+            CategoryResult.id,
+            CategoryResult.skater_id,
+            CategoryResult.category,
+            CategoryResult.overall_rank,
+            CategoryResult.combined_total,
+            CategoryResult.segment_count,
+            Competition.name.label("competition_name"),
+            Competition.date.label("competition_date"),
+            func.row_number().over(
+                order_by=(CategoryResult.combined_total.desc().nullslast(), CategoryResult.id)
+            ).label("score_rank"),
+        )
+        .join(Skater, CategoryResult.skater_id == Skater.id)
+        .join(Competition, CategoryResult.competition_id == Competition.id)
     )
     if club_name != "":
-        total_programs_stmt = total_programs_stmt.where(_club_filter_score())
+        results_stmt = results_stmt.where(
+            club_filter(club_name, CategoryResult.club_key, Skater.club_key)
+        )
     if season is not None:
-        total_programs_stmt = total_programs_stmt.where(Competition.season == season)
-
-    total_programs_result = await session.execute(total_programs_stmt)
-    total_programs = total_programs_result.scalar() or 0
-
-    # --- medals (overall_rank <= 3, from category results) ---
-    medals_stmt = (
-        select(CategoryResult)
-        .options(selectinload(CategoryResult.skater), selectinload(CategoryResult.competition))
-        .join(CategoryResult.skater)
-        .join(CategoryResult.competition)
-        .where(CategoryResult.overall_rank <= 3)
-        .order_by(CategoryResult.overall_rank)
+        results_stmt = results_stmt.where(Competition.season == season)
+    club_results = results_stmt.cte("club_results")
+
+    result_rows = (await session.execute(
+        select(club_results, Skater)
+        .join(Skater, club_results.c.skater_id == Skater.id)
+        .where(or_(
+            club_results.c.overall_rank <= 3,
+            and_(club_results.c.combined_total.isnot(None), club_results.c.score_rank <= 5),
+        ))
+    )).all()
+
+    medal_rows = sorted(
+        (row for row in result_rows if row.overall_rank is not None and row.overall_rank <= 3),
+        key=lambda row: (row.overall_rank, row.id),
     )
-    if club_name != "":
-        medals_stmt = medals_stmt.where(_club_filter_cat())
-    if season is not None:
-        medals_stmt = medals_stmt.where(Competition.season == season)
-
-    medals_result = await session.execute(medals_stmt)
-    medal_rows = medals_result.scalars().all()
     medals = [
         {
-            "skater_name": cr.skater.display_name if cr.skater else None,
-            "rank": cr.overall_rank,
-            "competition_name": cr.competition.name if cr.competition else None,
-            "category": cr.category,
-            "combined_total": cr.combined_total,
-            "segment_count": cr.segment_count,
+            "skater_name": row.Skater.display_name,
+            "rank": row.overall_rank,
+            "competition_name": row.competition_name,
+            "category": row.category,
+            "combined_total": row.combined_total,
+            "segment_count": row.segment_count,
         }
-        for cr in medal_rows
+        for row in medal_rows
     ]
 
-    # --- top_scores (up to 5, highest combined_total from category results) ---
-    top_scores_stmt = (
-        select(CategoryResult)
-        .options(selectinload(CategoryResult.skater), selectinload(CategoryResult.competition))
-        .join(CategoryResult.skater)
-        .join(CategoryResult.competition)
-        .where(CategoryResult.combined_total.isnot(None))
-        .order_by(CategoryResult.combined_total.desc())
-        .limit(5)
+    top_rows = sorted(
+        (row for row in result_rows if row.combined_total is not None and row.score_rank <= 5),
+        key=lambda row: row.score_rank,
     )
-    if club_name != "":
-        top_scores_stmt = top_scores_stmt.where(_club_filter_cat())
-    if season is not None:
-        top_scores_stmt = top_scores_stmt.where(Competition.season == season)
-
-    top_scores_result = await session.execute(top_scores_stmt)
-    top_score_rows = top_scores_result.scalars().all()
     top_scores = [
         {
-            "skater_id": cr.skater_id,
-            "skater_name": cr.skater.display_name if cr.skater else None,
-            "tss": cr.combined_total,
-            "competition_name": cr.competition.name if cr.competition else None,
+            "skater_id": row.skater_id,
+            "skater_name": row.Skater.display_name,
+            "tss": row.combined_total,
+            "competition_name": row.competition_name,
             "competition_date": (
-                cr.competition.date.isoformat()
-                if cr.competition and cr.competition.date
-                else None
+                row.competition_date.isoformat() if row.competition_date else None
             ),
-            "category": cr.category,
+            "category": row.category,
         }
-        for cr in top_score_rows
+        for row in top_rows
     ]
 
     # --- most_improved (up to 3) ---
-    # Use category results (combined totals) ordered by competition date asc,
-    # compute first/last combined total per skater.
-    all_cat_stmt = (
-        select(CategoryResult)
-        .options(selectinload(CategoryResult.skater), selectinload(CategoryResult.competition))
-        .join(CategoryResult.skater)
-        .join(CategoryResult.competition)
-        .where(CategoryResult.combined_total.isnot(None))
-        .order_by(Competition.date.asc())
+    # First and last combined totals per skater, from the season summaries
+    # (one row per skater, season and category track).
+    summary_stmt = (
+        select(SkaterSeasonSummary, Skater)
+        .join(Skater, SkaterSeasonSummary.skater_id == Skater.id)
+        .where(SkaterSeasonSummary.results_count > 0)
     )
     if club_name != "":
-        all_cat_stmt = all_cat_stmt.where(_club_filter_cat())
+        summary_stmt = summary_stmt.where(
+            club_filter(club_name, SkaterSeasonSummary.club_key, Skater.club_key)
+        )
     if season is not None:
-        all_cat_stmt = all_cat_stmt.where(Competition.season == season)
+        summary_stmt = summary_stmt.where(SkaterSeasonSummary.season == season)
 
-    all_cat_result = await session.execute(all_cat_stmt)
-    all_cat_rows = all_cat_result.scalars().all()
-
-    # Group by skater_id, track first and last combined total (chronological)
-    skater_tss: dict[int, dict] = {}
-    for cr in all_cat_rows:
-        sid = cr.skater_id
-        total = cr.combined_total
-        if total is None:
-            continue
-        if sid not in skater_tss:
-            skater_tss[sid] = {
-                "skater_id": sid,
-                "skater_name": cr.skater.display_name if cr.skater else None,
-                "first_tss": total,
-                "last_tss": total,
-            }
-        else:
-            skater_tss[sid]["last_tss"] = total
+    summaries: dict[int, list[SkaterSeasonSummary]] = defaultdict(list)
+    skaters: dict[int, Skater] = {}
+    for summary, skater in (await session.execute(summary_stmt)).all():
+        summaries[skater.id].append(summary)
+        skaters[skater.id] = skater
 
     improved_list = []
-    for sid, data in skater_tss.items():
-        gain = data["last_tss"] - data["first_tss"]
+    for sid, rows in summaries.items():
+        data = combine_summaries(rows)
         improved_list.append(
             {
-                "skater_name": data["skater_name"],
+                "skater_name": skaters[sid].display_name,
                 "skater_id": sid,
-                "tss_gain": gain,
+                "tss_gain": data["last_tss"] - data["first_tss"],
                 "first_tss": data["first_tss"],
                 "last_tss": data["last_tss"],
             }
@@ -214,18 +166,14 @@ async def get_dashboard(
     most_improved = improved_list[:3]
 
     # --- recent_competitions (last 3 by date desc) ---
+    # IN rather than JOIN + DISTINCT: PostgreSQL can't compare the JSON
+    # columns of competitions for DISTINCT.
     recent_comp_stmt = (
         select(Competition)
-        .join(Score, Score.competition_id == Competition.id)
-        .join(Skater, Score.skater_id == Skater.id)
-        .distinct()
+        .where(Competition.id.in_(select(club_scores.c.competition_id)))
         .order_by(Competition.date.desc())
         .limit(3)
     )
-    if club_name != "":
-        recent_comp_stmt = recent_comp_stmt.where(_club_filter_score())
-    if season is not None:
-        recent_comp_stmt = recent_comp_stmt.where(Competition.season == season)
 
     recent_comp_result = await session.execute(recent_comp_stmt)
     recent_comp_rows = recent_comp_result.scalars().all()
@@ -256,5 +204,5 @@ async def get_dashboard(
 router = Router(
     path="/api/dashboard",
     route_handlers=[get_dashboard],
-    dependencies={"session": Provide(get_session)},
+    dependencies={"session": Provide(get_read_session)},
 )
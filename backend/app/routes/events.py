@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import AsyncIterator, Awaitable, Callable
+
+from litestar import Router, get, Request
+from litestar.exceptions import PermissionDeniedException
+from litestar.response import ServerSentEvent, ServerSentEventMessage
+from sqlalchemy import select, func
+
+import app.database as db_mod
+from app.models.notification import Notification
+from app.services.event_bus import event_bus
+
+# Comment line sent when idle so proxies don't close the connection.
+HEARTBEAT_SECONDS = 15.0
+
+
+async def _count_unread(user_id: str) -> int:
+    # Short-lived session per count: the stream stays open for hours and must
+    # not hold a pooled connection for that long.
+    async with db_mod.read_session_factory() as session:
+        stmt = (
+            select(func.count())
+            .select_from(Notification)
+            .where(Notification.user_id == user_id, Notification.is_read == False)  # noqa: E712
+        )
+        return (await session.execute(stmt)).scalar() or 0
+
+
+async def event_stream(
+    user_id: str,
+    is_admin: bool,
+    count_unread: Callable[[], Awaitable[int]],
+    heartbeat: float = HEARTBEAT_SECONDS,
+) -> AsyncIterator[ServerSentEventMessage]:
+    """Yield SSE messages for one client until it disconnects.
+
+    Events: ``job`` (partial job dict, admins only) and ``notifications``
+    (``{"count": n}``), the latter sent once on connect and again whenever the
+    user's notifications change.
+    """
+    async with event_bus.subscribe(user_id, is_admin=is_admin) as queue:
+        yield ServerSentEventMessage(
+            event="notifications", data=json.dumps({"count": await count_unread()})
+        )
+        while True:
+            try:
+                async with asyncio.timeout(heartbeat):
+                    event_type, data = await queue.get()
+            except TimeoutError:
+                yield ServerSentEventMessage(comment="keepalive")
+                continue
+            if event_type == "notifications":
+                data = {"count": await count_unread()}
+            yield ServerSentEventMessage(event=event_type, data=json.dumps(data))
+
+
+@get("/")
+async def stream_events(request: Request) -> ServerSentEvent:
+    state = request.scope.get("state", {})
+    user_id = state.get("user_id")
+    if not user_id:
+        raise PermissionDeniedException("Not authenticated")
+    is_admin = state.get("user_role") == "admin"
+    return ServerSentEvent(
+        event_stream(user_id, is_admin, lambda: _count_unread(user_id)),
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+router = Router(
+    path="/api/events",
+    route_handlers=[stream_events],
+)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from typing import Optional
+
 from litestar import Router, get, post, Request
-from litestar.exceptions import NotFoundException
+from litestar.exceptions import ClientException, NotFoundException
+from litestar.params import Parameter
 from litestar.status_codes import HTTP_400_BAD_REQUEST
 from litestar.response import Response
 
@@ -9,10 +12,32 @@ from app.auth.guards import require_admin
 from app.services.job_queue import job_queue
 
 
+MAX_PAGE_SIZE = 200
+
+
 @get("/")
-async def list_jobs(request: Request) -> list[dict]:
+async def list_jobs(
+    request: Request,
+    status: Optional[list[str]] = None,
+    type: Optional[str] = None,
+    trigger: Optional[str] = None,
+    competition_id: Optional[int] = None,
+    limit: int = Parameter(default=50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+) -> dict:
     require_admin(request)
-    return await job_queue.list_jobs()
+    try:
+        jobs, next_cursor = await job_queue.list_jobs(
+            status=status,
+            job_type=type,
+            trigger=trigger,
+            competition_id=competition_id,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError:
+        raise ClientException(detail="Invalid cursor", status_code=HTTP_400_BAD_REQUEST)
+    return {"items": jobs, "next_cursor": next_cursor}
 
 
 @get("/{job_id:str}")
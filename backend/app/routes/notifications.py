@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_session
 from app.models.notification import Notification
+from app.services.event_bus import notify_after_commit
 
 
 def _notif_to_dict(n: Notification) -> dict:
@@ -77,6 +78,7 @@ async def mark_read(notification_id: int, request: Request, session: AsyncSessio
         raise PermissionDeniedException("Not your notification")
 
     notif.is_read = True
+    notify_after_commit(session, user_id)
     await session.commit()
     return _notif_to_dict(notif)
 
@@ -94,6 +96,7 @@ async def mark_all_read(request: Request, session: AsyncSession) -> dict:
         .values(is_read=True)
     )
     result = await session.execute(stmt)
+    notify_after_commit(session, user_id)
     await session.commit()
     return {"marked": result.rowcount}
 
@@ -17,7 +17,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from jinja2 import Environment, FileSystemLoader
 
 from app.auth.guards import reject_skater_role, require_skater_access
-from app.database import get_session
+from app.database import get_read_session, get_session
 from app.services.report_data import get_skater_report_data, get_club_report_data
 
 logger = logging.getLogger(__name__)
@@ -35,7 +35,7 @@ def _load_logo_base64(logo_path: str | None) -> str | None:
     return base64.b64encode(p.read_bytes()).decode()
 
 
-@get("/skater/{skater_id:int}/pdf")
+@get("/skater/{skater_id:int}/pdf", dependencies={"session": Provide(get_read_session)})
 async def skater_report_pdf(
     skater_id: int,
     season: str,
@@ -64,7 +64,7 @@ async def skater_report_pdf(
     )
 
 
-@get("/club/pdf")
+@get("/club/pdf", dependencies={"session": Provide(get_read_session)})
 async def club_report_pdf(
     season: str,
     request: Request,
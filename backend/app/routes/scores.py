@@ -1,19 +1,109 @@
 from __future__ import annotations
 
+import base64
+import json
 from typing import Optional
 
 from litestar import Router, get
 from litestar.di import Provide
-from litestar.exceptions import NotFoundException
+from litestar.exceptions import ClientException, NotFoundException
 from litestar.params import Parameter
-from sqlalchemy import select
+from litestar.response import Response
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.config import PDF_DIR
-from app.database import get_session
+from app.database import get_read_session
+from app.models.competition import Competition
 from app.models.score import Score
+from app.models.skater import Skater
 from app.models.category_result import CategoryResult
+from app.services.raw_json import as_raw, raw_json
+
+
+MAX_PAGE_SIZE = 1000
+
+# Sort key of unranked rows, after every rank
+_NO_RANK = 2**31 - 1
+
+# Heavy JSON columns, served only when listed in ``fields``
+_SCORE_HEAVY_FIELDS = ("components", "elements")
+_SCORE_FIELDS = (
+    "id", "competition_id", "competition_name", "competition_date", "skater_id",
+    "skater_first_name", "skater_last_name", "skater_nationality", "skater_club",
+    "segment", "category", "starting_number", "rank", "total_score", "technical_score",
+    "component_score", "deductions", *_SCORE_HEAVY_FIELDS, "skating_level", "age_group",
+    "gender", "event_date", "pdf_url",
+)
+_CATEGORY_RESULT_FIELDS = (
+    "id", "competition_id", "competition_name", "competition_date", "skater_id",
+    "skater_first_name", "skater_last_name", "skater_nationality", "skater_club",
+    "category", "overall_rank", "combined_total", "segment_count", "sp_rank", "fs_rank",
+    "skating_level", "age_group", "gender",
+)
+
+
+def _parse_fields(fields: Optional[str], known: tuple[str, ...], default: tuple[str, ...]) -> tuple[str, ...]:
+    """Fields listed in a comma-separated ``fields`` parameter, or ``default``."""
+    if not fields:
+        return default
+    requested = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in requested if f not in known]
+    if unknown:
+        raise ClientException(detail=f"Unknown fields: {', '.join(unknown)}", status_code=400)
+    return requested
+
+
+def _encode_cursor(key: tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[int, str, int, int]:
+    """(competition_id, segment or category, rank, id) of the last row of a page."""
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        competition_id, group, rank, row_id = key
+        if not (isinstance(group, str) and all(type(v) is int for v in (competition_id, rank, row_id))):
+            raise ValueError(key)
+    except (ValueError, TypeError, UnicodeDecodeError):
+        raise ClientException(detail="Invalid cursor", status_code=400)
+    return competition_id, group, rank, row_id
+
+
+async def _page(
+    session: AsyncSession,
+    stmt,
+    model,
+    group_column,
+    rank_column,
+    filters: list,
+    limit: int,
+    cursor: Optional[str],
+) -> tuple[list, Optional[str], int]:
+    """One page of ``stmt`` rows in (competition, group, rank, id) order.
+
+    Pages are keyed on that order, so each one starts from the previous
+    page's last competition instead of skipping an offset. Returns the
+    rows, the cursor of the next page and the total row count, counted on
+    ``model`` alone so the count reads an index rather than the joins.
+    """
+    rank_key = func.coalesce(rank_column, _NO_RANK)
+    order = (model.competition_id, group_column, rank_key, model.id)
+    stmt = stmt.where(*filters)
+    if cursor is not None:
+        key = _decode_cursor(cursor)
+        stmt = stmt.where(model.competition_id >= key[0], tuple_(*order) > tuple_(*key))
+    rows = (await session.execute(stmt.order_by(*order).limit(limit + 1))).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = _encode_cursor((
+            last.competition_id, last.group_key,
+            _NO_RANK if last.rank_key is None else last.rank_key, last.id,
+        ))
+    total = (await session.execute(select(func.count()).select_from(model).where(*filters))).scalar_one()
+    return rows, next_cursor, total
 
 
 @get("/")
@@ -22,50 +112,82 @@ async def list_scores(
     competition_id: Optional[int] = None,
     skater_id: Optional[int] = None,
     segment: Optional[str] = None,
-) -> list[dict]:
+    fields: Optional[str] = None,
+    limit: int = Parameter(default=500, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+) -> Response[dict]:
+    """One page of scores and the ``next_cursor`` of the following one.
+
+    ``fields`` lists the fields to serve, comma-separated; by default every
+    field but the components and elements JSON. The X-Total-Count header
+    holds the number of matching scores.
+    """
+    selected = _parse_fields(
+        fields, _SCORE_FIELDS, tuple(f for f in _SCORE_FIELDS if f not in _SCORE_HEAVY_FIELDS)
+    )
+    columns = [
+        Score.id, Score.competition_id, Score.skater_id, Score.segment, Score.category,
+        Score.starting_number, Score.rank, Score.total_score, Score.technical_score,
+        Score.component_score, Score.deductions, Score.skating_level, Score.age_group,
+        Score.gender, Score.event_date, Score.pdf_path, Score.club,
+        Score.segment.label("group_key"), Score.rank.label("rank_key"),
+        Competition.name.label("competition_name"), Competition.date.label("competition_date"),
+        Skater.first_name, Skater.last_name, Skater.nationality, Skater.club.label("skater_own_club"),
+    ]
+    columns += [raw_json(getattr(Score, f)) for f in _SCORE_HEAVY_FIELDS if f in selected]
     stmt = (
-        select(Score)
-        .options(selectinload(Score.competition), selectinload(Score.skater))
-        .order_by(Score.competition_id, Score.segment, Score.rank)
+        select(*columns)
+        .join(Competition, Score.competition_id == Competition.id)
+        .join(Skater, Score.skater_id == Skater.id)
     )
+    filters = []
     if competition_id is not None:
-        stmt = stmt.where(Score.competition_id == competition_id)
+        filters.append(Score.competition_id == competition_id)
     if skater_id is not None:
-        stmt = stmt.where(Score.skater_id == skater_id)
+        filters.append(Score.skater_id == skater_id)
     if segment is not None:
-        stmt = stmt.where(Score.segment == segment.upper())
+        filters.append(Score.segment == segment.upper())
 
-    result = await session.execute(stmt)
-    scores = result.scalars().all()
-    return [_score_to_dict(s) for s in scores]
+    rows, next_cursor, total = await _page(
+        session, stmt, Score, Score.segment, Score.rank, filters, limit, cursor
+    )
+    items = []
+    for row in rows:
+        data = _score_to_dict(row)
+        items.append({f: data[f] for f in selected})
+    return Response(
+        content={"items": items, "next_cursor": next_cursor},
+        headers={"X-Total-Count": str(total)},
+    )
 
 
-def _score_to_dict(s: Score) -> dict:
+def _score_to_dict(row) -> dict:
+    """``row`` from list_scores; components and elements are the stored JSON text (see raw_json)."""
     return {
-        "id": s.id,
-        "competition_id": s.competition_id,
-        "competition_name": s.competition.name if s.competition else None,
-        "competition_date": s.competition.date.isoformat() if s.competition and s.competition.date else None,
-        "skater_id": s.skater_id,
-        "skater_first_name": s.skater.first_name if s.skater else None,
-        "skater_last_name": s.skater.last_name if s.skater else None,
-        "skater_nationality": s.skater.nationality if s.skater else None,
-        "skater_club": s.club or (s.skater.club if s.skater else None),
-        "segment": s.segment,
-        "category": s.category,
-        "starting_number": s.starting_number,
-        "rank": s.rank,
-        "total_score": s.total_score,
-        "technical_score": s.technical_score,
-        "component_score": s.component_score,
-        "deductions": s.deductions,
-        "components": s.components,
-        "elements": s.elements,
-        "skating_level": s.skating_level,
-        "age_group": s.age_group,
-        "gender": s.gender,
-        "event_date": s.event_date.isoformat() if s.event_date else None,
-        "pdf_url": _pdf_serving_url(s.pdf_path),
+        "id": row.id,
+        "competition_id": row.competition_id,
+        "competition_name": row.competition_name,
+        "competition_date": row.competition_date.isoformat() if row.competition_date else None,
+        "skater_id": row.skater_id,
+        "skater_first_name": row.first_name,
+        "skater_last_name": row.last_name,
+        "skater_nationality": row.nationality,
+        "skater_club": row.club or row.skater_own_club,
+        "segment": row.segment,
+        "category": row.category,
+        "starting_number": row.starting_number,
+        "rank": row.rank,
+        "total_score": row.total_score,
+        "technical_score": row.technical_score,
+        "component_score": row.component_score,
+        "deductions": row.deductions,
+        "components": as_raw(getattr(row, "components", None)),
+        "elements": as_raw(getattr(row, "elements", None)),
+        "skating_level": row.skating_level,
+        "age_group": row.age_group,
+        "gender": row.gender,
+        "event_date": row.event_date.isoformat() if row.event_date else None,
+        "pdf_url": _pdf_serving_url(row.pdf_path),
     }
 
 
@@ -83,10 +205,12 @@ def _pdf_serving_url(pdf_path: str | None) -> str | None:
 
 @get("/{score_id:int}/elements")
 async def get_score_elements(score_id: int, session: AsyncSession) -> list[dict]:
-    score = await session.get(Score, score_id)
-    if not score:
+    row = (await session.execute(
+        select(raw_json(Score.elements)).where(Score.id == score_id)
+    )).one_or_none()
+    if row is None:
         raise NotFoundException(f"Score {score_id} not found")
-    return score.elements or []
+    return as_raw(row[0], default=b"[]")
 
 
 @get("/category-results")
@@ -94,49 +218,71 @@ async def list_category_results(
     session: AsyncSession,
     competition_id: Optional[int] = None,
     skater_id: Optional[int] = None,
-) -> list[dict]:
+    fields: Optional[str] = None,
+    limit: int = Parameter(default=500, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+) -> Response[dict]:
+    """One page of category results; same ``fields``, cursor and count as list_scores."""
+    selected = _parse_fields(fields, _CATEGORY_RESULT_FIELDS, _CATEGORY_RESULT_FIELDS)
     stmt = (
-        select(CategoryResult)
-        .options(
-            selectinload(CategoryResult.competition),
-            selectinload(CategoryResult.skater),
+        select(
+            CategoryResult.id, CategoryResult.competition_id, CategoryResult.skater_id,
+            CategoryResult.category, CategoryResult.overall_rank, CategoryResult.combined_total,
+            CategoryResult.segment_count, CategoryResult.sp_rank, CategoryResult.fs_rank,
+            CategoryResult.skating_level, CategoryResult.age_group, CategoryResult.gender,
+            CategoryResult.club,
+            CategoryResult.category.label("group_key"), CategoryResult.overall_rank.label("rank_key"),
+            Competition.name.label("competition_name"), Competition.date.label("competition_date"),
+            Skater.first_name, Skater.last_name, Skater.nationality, Skater.club.label("skater_own_club"),
         )
-        .order_by(CategoryResult.competition_id, CategoryResult.category, CategoryResult.overall_rank)
+        .join(Competition, CategoryResult.competition_id == Competition.id)
+        .join(Skater, CategoryResult.skater_id == Skater.id)
     )
+    filters = []
     if competition_id is not None:
-        stmt = stmt.where(CategoryResult.competition_id == competition_id)
+        filters.append(CategoryResult.competition_id == competition_id)
     if skater_id is not None:
-        stmt = stmt.where(CategoryResult.skater_id == skater_id)
+        filters.append(CategoryResult.skater_id == skater_id)
 
-    result = await session.execute(stmt)
-    return [_category_result_to_dict(cr) for cr in result.scalars().all()]
+    rows, next_cursor, total = await _page(
+        session, stmt, CategoryResult, CategoryResult.category, CategoryResult.overall_rank,
+        filters, limit, cursor,
+    )
+    items = []
+    for row in rows:
+        data = _category_result_to_dict(row)
+        items.append({f: data[f] for f in selected})
+    return Response(
+        content={"items": items, "next_cursor": next_cursor},
+        headers={"X-Total-Count": str(total)},
+    )
 
 
-def _category_result_to_dict(cr: CategoryResult) -> dict:
+def _category_result_to_dict(row) -> dict:
     return {
-        "id": cr.id,
-        "competition_id": cr.competition_id,
-        "competition_name": cr.competition.name if cr.competition else None,
-        "competition_date": cr.competition.date.isoformat() if cr.competition and cr.competition.date else None,
-        "skater_id": cr.skater_id,
-        "skater_first_name": cr.skater.first_name if cr.skater else None,
-        "skater_last_name": cr.skater.last_name if cr.skater else None,
-        "skater_nationality": cr.skater.nationality if cr.skater else None,
-        "skater_club": cr.club or (cr.skater.club if cr.skater else None),
-        "category": cr.category,
-        "overall_rank": cr.overall_rank,
-        "combined_total": cr.combined_total,
-        "segment_count": cr.segment_count,
-        "sp_rank": cr.sp_rank,
-        "fs_rank": cr.fs_rank,
-        "skating_level": cr.skating_level,
-        "age_group": cr.age_group,
-        "gender": cr.gender,
+        "id": row.id,
+        "competition_id": row.competition_id,
+        "competition_name": row.competition_name,
+        "competition_date": row.competition_date.isoformat() if row.competition_date else None,
+        "skater_id": row.skater_id,
+        "skater_first_name": row.first_name,
+        "skater_last_name": row.last_name,
+        "skater_nationality": row.nationality,
+        "skater_club": row.club or row.skater_own_club,
+        "category": row.category,
+        "overall_rank": row.overall_rank,
+        "combined_total": row.combined_total,
+        "segment_count": row.segment_count,
+        "sp_rank": row.sp_rank,
+        "fs_rank": row.fs_rank,
+        "skating_level": row.skating_level,
+        "age_group": row.age_group,
+        "gender": row.gender,
     }
 
 
 router = Router(
     path="/api/scores",
     route_handlers=[list_scores, get_score_elements, list_category_results],
-    dependencies={"session": Provide(get_session)},
+    dependencies={"session": Provide(get_read_session)},
 )
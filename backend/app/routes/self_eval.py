@@ -16,6 +16,7 @@ from app.models.skater_program import SkaterProgram
 from app.models.training_mood import TrainingMood
 from app.models.self_evaluation import SelfEvaluation
 from app.models.user_skater import UserSkater
+from app.services.upsert import upsert
 
 
 async def _check_skater_own_access(request: Request, skater_id: int, session: AsyncSession) -> None:
@@ -92,27 +93,15 @@ async def upsert_program(request: Request, session: AsyncSession, data: dict) ->
     if segment not in ("SP", "FS"):
         raise PermissionDeniedException("Segment must be SP or FS")
 
-    existing = (await session.execute(
-        select(SkaterProgram).where(
-            SkaterProgram.skater_id == skater_id,
-            SkaterProgram.segment == segment,
-        )
-    )).scalar_one_or_none()
-
-    if existing:
-        existing.elements = data["elements"]
-        await session.commit()
-        await session.refresh(existing)
-        return _program_to_dict(existing)
-
-    program = SkaterProgram(
-        skater_id=skater_id,
-        segment=segment,
-        elements=data["elements"],
+    program_id = await upsert(
+        session,
+        SkaterProgram,
+        {"skater_id": skater_id, "segment": segment, "elements": data["elements"]},
+        conflict=["skater_id", "segment"],
+        update=["elements", "updated_at"],
     )
-    session.add(program)
     await session.commit()
-    await session.refresh(program)
+    program = await session.get(SkaterProgram, program_id, populate_existing=True)
     return _program_to_dict(program)
 
 
@@ -13,23 +13,29 @@ from app.auth.guards import reject_skater_role, require_admin, require_skater_ac
 from app.models.user_skater import UserSkater
 from app.models.skater_alias import SkaterAlias
 from app.config import PDF_DIR
-from app.database import get_session
+from app.database import get_read_session, get_session
 from app.models.skater import Skater
 from app.models.score import Score
+from app.models.score_element import ScoreElement
 from app.models.competition import Competition
 from app.models.category_result import CategoryResult
+from app.models.skater_season_summary import SkaterSeasonSummary
+from app.services.raw_json import as_raw, raw_json
+from app.services.response_cache import bump_data_version
+from app.services.club_key import club_filter
+from app.services.season_summary import combine_summaries, refresh_season_summaries
 
 
-@get("/")
+@get("/", dependencies={"session": Provide(get_read_session)})
 async def list_skaters(request: Request, session: AsyncSession, club: Optional[str] = None, search: Optional[str] = None, training_tracked: Optional[bool] = None) -> list[dict]:
     reject_skater_role(request)
     stmt = select(Skater)
     if club:
         stmt = stmt.where(
             or_(
-                func.lower(Skater.club) == club.lower(),
+                club_filter(club, Skater.club_key),
                 Skater.id.in_(
-                    select(Score.skater_id).where(func.lower(Score.club) == club.lower())
+                    select(Score.skater_id).where(club_filter(club, Score.club_key))
                 ),
             )
         )
@@ -45,7 +51,7 @@ async def list_skaters(request: Request, session: AsyncSession, club: Optional[s
     return [_skater_to_dict(s) for s in skaters]
 
 
-@get("/{skater_id:int}")
+@get("/{skater_id:int}", dependencies={"session": Provide(get_read_session)})
 async def get_skater(skater_id: int, request: Request, session: AsyncSession) -> dict:
     await require_skater_access(request, skater_id, session)
     skater = await session.get(Skater, skater_id)
@@ -67,7 +73,7 @@ def _skater_to_dict(s: Skater) -> dict:
     }
 
 
-@get("/{skater_id:int}/elements")
+@get("/{skater_id:int}/elements", dependencies={"session": Provide(get_read_session)})
 async def get_skater_elements(
     skater_id: int,
     request: Request,
@@ -81,44 +87,45 @@ async def get_skater_elements(
         raise NotFoundException(f"Skater {skater_id} not found")
 
     stmt = (
-        select(Score)
-        .where(Score.skater_id == skater_id)
-        .options(selectinload(Score.competition))
-        .order_by(Competition.date)
+        select(
+            ScoreElement,
+            Score.competition_id,
+            Score.segment,
+            Score.category,
+            Competition.name,
+            Competition.date,
+        )
+        .join(ScoreElement.parent)
         .join(Score.competition)
+        .where(Score.skater_id == skater_id)
+        .order_by(Competition.date, Score.id, ScoreElement.position)
     )
     if season:
         stmt = stmt.where(Competition.season == season)
+    if element_type is not None:
+        stmt = stmt.where(ScoreElement.code.istartswith(element_type, autoescape=True))
 
     result = await session.execute(stmt)
-    scores = result.scalars().all()
-
-    records = []
-    for s in scores:
-        if not s.elements:
-            continue
-        for element in s.elements:
-            name = element.get("name", "")
-            if element_type is not None and not name.lower().startswith(element_type.lower()):
-                continue
-            records.append({
-                "score_id": s.id,
-                "competition_id": s.competition_id,
-                "competition_name": s.competition.name if s.competition else None,
-                "competition_date": s.competition.date.isoformat() if s.competition and s.competition.date else None,
-                "segment": s.segment,
-                "category": s.category,
-                "element_name": name,
-                "base_value": element.get("base_value"),
-                "goe": element.get("goe"),
-                "judges": element.get("judge_goe") or element.get("judges"),
-                "total": element.get("score") or element.get("total"),
-                "markers": element.get("markers") or [],
-            })
-    return records
-
-
-@get("/{skater_id:int}/element-names")
+    return [
+        {
+            "score_id": el.score_id,
+            "competition_id": competition_id,
+            "competition_name": competition_name,
+            "competition_date": competition_date.isoformat() if competition_date else None,
+            "segment": segment,
+            "category": category,
+            "element_name": el.code,
+            "base_value": el.base_value,
+            "goe": el.goe,
+            "judges": el.judge_goe,
+            "total": el.score,
+            "markers": el.markers or [],
+        }
+        for el, competition_id, segment, category, competition_name, competition_date in result.all()
+    ]
+
+
+@get("/{skater_id:int}/element-names", dependencies={"session": Provide(get_read_session)})
 async def get_skater_element_names(
     skater_id: int,
     request: Request,
@@ -126,20 +133,17 @@ async def get_skater_element_names(
 ) -> list[str]:
     """Return distinct element names seen in competition for this skater."""
     await require_skater_access(request, skater_id, session)
-    stmt = select(Score).where(Score.skater_id == skater_id)
-    result = await session.execute(stmt)
-    names: set[str] = set()
-    for s in result.scalars().all():
-        if not s.elements:
-            continue
-        for element in s.elements:
-            name = element.get("name", "")
-            if name:
-                names.add(name)
-    return sorted(names)
-
-
-@get("/{skater_id:int}/scores")
+    stmt = (
+        select(ScoreElement.code)
+        .join(ScoreElement.parent)
+        .where(Score.skater_id == skater_id)
+        .distinct()
+        .order_by(ScoreElement.code)
+    )
+    return list((await session.execute(stmt)).scalars().all())
+
+
+@get("/{skater_id:int}/scores", dependencies={"session": Provide(get_read_session)})
 async def get_skater_scores(skater_id: int, request: Request, session: AsyncSession, season: Optional[str] = None) -> list[dict]:
     await require_skater_access(request, skater_id, session)
     skater = await session.get(Skater, skater_id)
@@ -147,7 +151,7 @@ async def get_skater_scores(skater_id: int, request: Request, session: AsyncSess
         raise NotFoundException(f"Skater {skater_id} not found")
 
     stmt = (
-        select(Score)
+        select(Score, raw_json(Score.components), raw_json(Score.elements))
         .where(Score.skater_id == skater_id)
         .join(Score.competition)
         .options(selectinload(Score.competition))
@@ -157,7 +161,6 @@ async def get_skater_scores(skater_id: int, request: Request, session: AsyncSess
         stmt = stmt.where(Competition.season == season)
 
     result = await session.execute(stmt)
-    scores = result.scalars().all()
     return [
         {
             "id": s.id,
@@ -172,8 +175,8 @@ async def get_skater_scores(skater_id: int, request: Request, session: AsyncSess
             "technical_score": s.technical_score,
             "component_score": s.component_score,
             "deductions": s.deductions,
-            "components": s.components,
-            "elements": s.elements,
+            "components": as_raw(components),
+            "elements": as_raw(elements),
             "skating_level": s.skating_level,
             "age_group": s.age_group,
             "gender": s.gender,
@@ -181,7 +184,7 @@ async def get_skater_scores(skater_id: int, request: Request, session: AsyncSess
             "pdf_url": _pdf_serving_url(s.pdf_path),
             "skater_club": s.club or (skater.club if skater else None),
         }
-        for s in scores
+        for s, components, elements in result.all()
     ]
 
 
@@ -197,7 +200,7 @@ def _pdf_serving_url(pdf_path: str | None) -> str | None:
         return None
 
 
-@get("/{skater_id:int}/category-results")
+@get("/{skater_id:int}/category-results", dependencies={"session": Provide(get_read_session)})
 async def get_skater_category_results(skater_id: int, request: Request, session: AsyncSession, season: Optional[str] = None) -> list[dict]:
     await require_skater_access(request, skater_id, session)
     skater = await session.get(Skater, skater_id)
@@ -236,7 +239,7 @@ async def get_skater_category_results(skater_id: int, request: Request, session:
     ]
 
 
-@get("/{skater_id:int}/seasons")
+@get("/{skater_id:int}/seasons", dependencies={"session": Provide(get_read_session)})
 async def get_skater_seasons(skater_id: int, request: Request, session: AsyncSession) -> list[str]:
     await require_skater_access(request, skater_id, session)
     skater = await session.get(Skater, skater_id)
@@ -258,6 +261,33 @@ async def get_skater_seasons(skater_id: int, request: Request, session: AsyncSes
     return [row[0] for row in result.all()]
 
 
+@get("/{skater_id:int}/season-summary", dependencies={"session": Provide(get_read_session)})
+async def get_skater_season_summary(skater_id: int, request: Request, session: AsyncSession, season: Optional[str] = None) -> dict:
+    """Totals over the skater's season (or career), from skater_season_summaries."""
+    await require_skater_access(request, skater_id, session)
+    skater = await session.get(Skater, skater_id)
+    if not skater:
+        raise NotFoundException(f"Skater {skater_id} not found")
+
+    stmt = select(SkaterSeasonSummary).where(SkaterSeasonSummary.skater_id == skater_id)
+    if season:
+        stmt = stmt.where(SkaterSeasonSummary.season == season)
+    summary = combine_summaries((await session.execute(stmt)).scalars().all())
+    return {
+        "skater_id": skater_id,
+        "season": season,
+        "competitions_entered": summary["competitions_entered"],
+        "programs": summary["programs"],
+        "podiums": summary["podiums"],
+        "best_total": summary["best_total"],
+        "best_tss": summary["best_tss"],
+        "best_tes": summary["best_tes"],
+        "best_pcs": summary["best_pcs"],
+        "first_tss": summary["first_tss"],
+        "last_tss": summary["last_tss"],
+    }
+
+
 @post("/merge", status_code=200)
 async def merge_skaters(request: Request, session: AsyncSession, data: dict) -> dict:
     require_admin(request)
@@ -368,6 +398,8 @@ async def merge_skaters(request: Request, session: AsyncSession, data: dict) ->
         # 7. Delete source
         await session.delete(source)
 
+    await refresh_season_summaries(session, [target.id, *source_ids])
+    await bump_data_version(session)
     await session.commit()
     return {"merged": len(sources), "aliases_created": aliases_created}
 
@@ -393,6 +425,7 @@ async def update_skater(skater_id: int, request: Request, session: AsyncSession,
             if field in data:
                 setattr(skater, field, data[field])
 
+    await bump_data_version(session)
     await session.commit()
     await session.refresh(skater)
     return _skater_to_dict(skater)
@@ -464,7 +497,7 @@ router = Router(
     path="/api/skaters",
     route_handlers=[
         list_skaters, get_skater, get_skater_elements, get_skater_element_names, get_skater_scores,
-        get_skater_category_results, get_skater_seasons, merge_skaters,
+        get_skater_category_results, get_skater_seasons, get_skater_season_summary, merge_skaters,
         update_skater, create_skater, clear_training_data,
     ],
     dependencies={"session": Provide(get_session)},
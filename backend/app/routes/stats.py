@@ -1,24 +1,38 @@
 """Club-level statistics endpoints."""
 
-import statistics
 from collections import defaultdict
 from typing import Optional
 
 from litestar import Request, Router, get
 from litestar.di import Provide
-from sqlalchemy import func, select
+from litestar.exceptions import ClientException
+from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.auth.guards import reject_skater_role
-from app.database import get_session
+from app.database import get_read_session
 from app.models.app_settings import AppSettings
 from app.models.category_result import CategoryResult
 from app.models.competition import Competition
 from app.models.score import Score
+from app.models.score_element import ScoreElement
 from app.models.skater import Skater
-from app.services.element_classifier import classify_element, extract_jump_type, extract_level
-from app.services.competition_analysis import compute_competition_club_analysis
+from app.models.skater_season_summary import SkaterSeasonSummary
+from app.services.club_key import club_filter
+from app.services.competition_analysis import (
+    compute_competition_club_analysis,
+    compute_season_club_analysis,
+)
+from app.services.response_cache import response_cache
+from app.services.score_distribution import (
+    COMBINED,
+    histogram,
+    load_distribution,
+    merged_values,
+    percentile_rank,
+    quartiles,
+)
+from app.services.season_summary import COMBINED_COLUMNS, combine_summaries
 
 
 async def _get_club_short(session: AsyncSession, club: Optional[str]) -> Optional[str]:
@@ -46,60 +60,63 @@ async def progression_ranking(
     gender: Optional[str] = None,
 ) -> list[dict]:
     reject_skater_role(request)
+    params = {"season": season, "club": club, "skating_level": skating_level,
+              "age_group": age_group, "gender": gender}
+    return await response_cache.get_or_compute(
+        session, "stats.progression_ranking", params,
+        lambda: _progression_ranking(session, **params),
+    )
+
+
+async def _progression_ranking(
+    session: AsyncSession,
+    season: Optional[str],
+    club: Optional[str],
+    skating_level: Optional[str],
+    age_group: Optional[str],
+    gender: Optional[str],
+) -> list[dict]:
     club_short = await _get_club_short(session, club)
     if not season:
         season = await _get_current_season(session)
 
     stmt = (
-        select(CategoryResult)
-        .join(CategoryResult.competition)
-        .join(CategoryResult.skater)
-        .options(selectinload(CategoryResult.skater), selectinload(CategoryResult.competition))
-        .where(CategoryResult.combined_total.isnot(None))
-        .order_by(Competition.date.asc())
+        select(*COMBINED_COLUMNS, SkaterSeasonSummary.progression, Skater.first_name, Skater.last_name)
+        .join(Skater, SkaterSeasonSummary.skater_id == Skater.id)
+        .where(SkaterSeasonSummary.results_count > 0)
     )
 
     if season:
-        stmt = stmt.where(Competition.season == season)
+        stmt = stmt.where(SkaterSeasonSummary.season == season)
     if club_short:
-        stmt = stmt.where(func.upper(Skater.club) == club_short.upper())
+        stmt = stmt.where(club_filter(club_short, Skater.club_key))
     if skating_level:
-        stmt = stmt.where(CategoryResult.skating_level == skating_level)
+        stmt = stmt.where(SkaterSeasonSummary.skating_level == skating_level)
     if age_group:
-        stmt = stmt.where(CategoryResult.age_group == age_group)
+        stmt = stmt.where(SkaterSeasonSummary.age_group == age_group)
     if gender:
-        stmt = stmt.where(CategoryResult.gender == gender)
-
-    result = await session.execute(stmt)
-    rows = result.scalars().all()
+        stmt = stmt.where(SkaterSeasonSummary.gender == gender)
 
     groups: dict[tuple, list] = defaultdict(list)
-    for cr in rows:
-        key = (cr.skater_id, cr.skating_level, cr.age_group)
-        groups[key].append(cr)
+    names: dict[int, str] = {}
+    for row in (await session.execute(stmt)).all():
+        groups[(row.skater_id, row.skating_level, row.age_group)].append(row)
+        names[row.skater_id] = f"{row.first_name} {row.last_name}"
 
     ranking = []
-    for (skater_id, level, age), entries in groups.items():
-        first = entries[0]
-        last = entries[-1]
-        skater = first.skater
+    for (skater_id, level, age), summaries in groups.items():
+        data = combine_summaries(summaries)
         ranking.append({
             "skater_id": skater_id,
-            "skater_name": f"{skater.first_name} {skater.last_name}",
+            "skater_name": names[skater_id],
             "skating_level": level,
             "age_group": age,
-            "gender": first.gender,
-            "first_tss": first.combined_total,
-            "last_tss": last.combined_total,
-            "tss_gain": round(last.combined_total - first.combined_total, 2) if len(entries) >= 2 else 0.0,
-            "competitions_count": len(entries),
-            "sparkline": [
-                {
-                    "date": e.competition.date if e.competition else None,
-                    "value": e.combined_total,
-                }
-                for e in entries
-            ],
+            "gender": data["gender"],
+            "first_tss": data["first_tss"],
+            "last_tss": data["last_tss"],
+            "tss_gain": round(data["last_tss"] - data["first_tss"], 2) if data["results_count"] >= 2 else 0.0,
+            "competitions_count": data["results_count"],
+            "sparkline": data["progression"],
         })
 
     ranking.sort(key=lambda x: (-x["tss_gain"], -x["last_tss"]))
@@ -116,43 +133,68 @@ async def benchmarks(
     season: Optional[str] = None,
 ) -> dict:
     reject_skater_role(request)
-    stmt = (
-        select(CategoryResult.combined_total)
-        .join(CategoryResult.competition)
-        .where(
-            CategoryResult.combined_total.isnot(None),
-            CategoryResult.skating_level == skating_level,
-            CategoryResult.age_group == age_group,
-            CategoryResult.gender == gender,
-        )
+    params = {"skating_level": skating_level, "age_group": age_group, "gender": gender, "season": season}
+    return await response_cache.get_or_compute(
+        session, "stats.benchmarks", params, lambda: _benchmarks(session, **params)
     )
-    if season:
-        stmt = stmt.where(Competition.season == season)
-
-    result = await session.execute(stmt)
-    totals = sorted([row[0] for row in result.all()])
-
-    if not totals:
-        return {
-            "skating_level": skating_level,
-            "age_group": age_group,
-            "gender": gender,
-            "data_points": 0,
-            "min": None, "max": None, "median": None, "p25": None, "p75": None,
+
+
+async def _benchmarks(
+    session: AsyncSession,
+    skating_level: str,
+    age_group: str,
+    gender: str,
+    season: Optional[str],
+) -> dict:
+    rows = await load_distribution(session, skating_level, age_group, gender, season)
+    if len(rows) == 1:
+        row = rows[0]
+        stats = {
+            "data_points": row.count, "min": row.min_value, "max": row.max_value,
+            "median": row.median, "p25": row.p25, "p75": row.p75,
         }
+    else:
+        stats = quartiles(merged_values(rows))
+    return {"skating_level": skating_level, "age_group": age_group, "gender": gender, **stats}
 
-    n = len(totals)
-    return {
-        "skating_level": skating_level,
-        "age_group": age_group,
-        "gender": gender,
-        "data_points": n,
-        "min": totals[0],
-        "max": totals[-1],
-        "median": round(statistics.median(totals), 2),
-        "p25": round(statistics.quantiles(totals, n=4)[0], 2) if n >= 2 else totals[0],
-        "p75": round(statistics.quantiles(totals, n=4)[2], 2) if n >= 2 else totals[-1],
-    }
+
+@get("/percentile")
+async def percentile(
+    request: Request,
+    session: AsyncSession,
+    skating_level: str,
+    age_group: str,
+    gender: str,
+    score: float,
+    season: Optional[str] = None,
+    segment: str = COMBINED,
+) -> dict:
+    """Percentile rank of ``score`` among the cohort's totals (``segment``: SP, FS... or combined)."""
+    reject_skater_role(request)
+    values = merged_values(
+        await load_distribution(session, skating_level, age_group, gender, season, segment)
+    )
+    return {"score": score, "data_points": len(values), "percentile": percentile_rank(values, score)}
+
+
+@get("/histogram")
+async def score_histogram(
+    request: Request,
+    session: AsyncSession,
+    skating_level: str,
+    age_group: str,
+    gender: str,
+    season: Optional[str] = None,
+    segment: str = COMBINED,
+    bins: int = 10,
+) -> dict:
+    reject_skater_role(request)
+    if not 1 <= bins <= 50:
+        raise ClientException(detail="bins doit être compris entre 1 et 50", status_code=400)
+    values = merged_values(
+        await load_distribution(session, skating_level, age_group, gender, season, segment)
+    )
+    return {"data_points": len(values), "bins": histogram(values, bins)}
 
 
 @get("/element-mastery")
@@ -166,65 +208,76 @@ async def element_mastery(
     gender: Optional[str] = None,
 ) -> dict:
     reject_skater_role(request)
+    params = {"season": season, "club": club, "skating_level": skating_level,
+              "age_group": age_group, "gender": gender}
+    return await response_cache.get_or_compute(
+        session, "stats.element_mastery", params, lambda: _element_mastery(session, **params)
+    )
+
+
+async def _element_mastery(
+    session: AsyncSession,
+    season: Optional[str],
+    club: Optional[str],
+    skating_level: Optional[str],
+    age_group: Optional[str],
+    gender: Optional[str],
+) -> dict:
     club_short = await _get_club_short(session, club)
     if not season:
         season = await _get_current_season(session)
 
-    stmt = (
-        select(Score)
-        .join(Score.competition)
-        .join(Score.skater)
-        .where(Score.elements.isnot(None))
-    )
-    if season:
-        stmt = stmt.where(Competition.season == season)
-    if club_short:
-        stmt = stmt.where(func.upper(Skater.club) == club_short.upper())
-    if skating_level:
-        stmt = stmt.where(Score.skating_level == skating_level)
-    if age_group:
-        stmt = stmt.where(Score.age_group == age_group)
-    if gender:
-        stmt = stmt.where(Score.gender == gender)
-
-    result = await session.execute(stmt)
-    scores = result.scalars().all()
+    def _filtered(stmt):
+        stmt = stmt.join(ScoreElement.parent).join(Score.competition).join(Score.skater)
+        if season:
+            stmt = stmt.where(Competition.season == season)
+        if club_short:
+            stmt = stmt.where(club_filter(club_short, Skater.club_key))
+        if skating_level:
+            stmt = stmt.where(Score.skating_level == skating_level)
+        if age_group:
+            stmt = stmt.where(Score.age_group == age_group)
+        if gender:
+            stmt = stmt.where(Score.gender == gender)
+        return stmt
+
+    goe = func.coalesce(ScoreElement.goe, 0)
+    jump_rows = (await session.execute(_filtered(
+        select(
+            ScoreElement.base_code,
+            func.count(),
+            func.sum(case((goe > 0, 1), else_=0)),
+            func.sum(case((goe < 0, 1), else_=0)),
+            func.sum(goe),
+        )
+        # base_code is the jump type; rows whose type couldn't be parsed
+        # carry their raw code there and are left out.
+        .where(ScoreElement.element_type == "jump", ScoreElement.jump_type.isnot(None))
+        .group_by(ScoreElement.base_code)
+    ))).all()
+    level_rows = (await session.execute(_filtered(
+        select(
+            ScoreElement.element_type,
+            ScoreElement.base_code,
+            ScoreElement.level,
+            func.count(),
+            func.sum(goe),
+        )
+        .where(ScoreElement.element_type.in_(("spin", "step")))
+        .group_by(ScoreElement.element_type, ScoreElement.base_code, ScoreElement.level)
+    ))).all()
 
-    jump_stats: dict[str, dict] = defaultdict(lambda: {"attempts": 0, "positive": 0, "negative": 0, "neutral": 0, "goe_sum": 0.0})
+    jump_stats = {
+        jt: {"attempts": n, "positive": pos, "negative": neg, "neutral": n - pos - neg, "goe_sum": goe_sum}
+        for jt, n, pos, neg, goe_sum in jump_rows
+    }
     spin_stats: dict[str, dict] = defaultdict(lambda: {"attempts": 0, "levels": defaultdict(int), "goe_sum": 0.0})
     step_stats: dict[str, dict] = defaultdict(lambda: {"attempts": 0, "levels": defaultdict(int), "goe_sum": 0.0})
-
-    for score in scores:
-        if not score.elements:
-            continue
-        for el in score.elements:
-            name = el.get("name", "")
-            goe = el.get("goe", 0) or 0
-            el_type = classify_element(name)
-
-            if el_type == "jump":
-                jt = extract_jump_type(name)
-                if jt:
-                    jump_stats[jt]["attempts"] += 1
-                    jump_stats[jt]["goe_sum"] += goe
-                    if goe > 0:
-                        jump_stats[jt]["positive"] += 1
-                    elif goe < 0:
-                        jump_stats[jt]["negative"] += 1
-                    else:
-                        jump_stats[jt]["neutral"] += 1
-            elif el_type == "spin":
-                base = name.rstrip("0123456789B")
-                level = extract_level(name)
-                spin_stats[base]["attempts"] += 1
-                spin_stats[base]["levels"][str(level)] += 1
-                spin_stats[base]["goe_sum"] += goe
-            elif el_type == "step":
-                base = name.rstrip("0123456789B")
-                level = extract_level(name)
-                step_stats[base]["attempts"] += 1
-                step_stats[base]["levels"][str(level)] += 1
-                step_stats[base]["goe_sum"] += goe
+    for el_type, base, level, n, goe_sum in level_rows:
+        stats = (spin_stats if el_type == "spin" else step_stats)[base]
+        stats["attempts"] += n
+        stats["levels"][f"{level:g}"] += n
+        stats["goe_sum"] += goe_sum
 
     jump_order = ["1A", "1T", "1S", "1Lo", "1F", "1Lz", "2T", "2S", "2Lo", "2F", "2Lz", "2A", "3T", "3S", "3Lo", "3F", "3Lz", "3A", "4T", "4S", "4Lo", "4F", "4Lz", "4A"]
     jump_order_map = {j: i for i, j in enumerate(jump_order)}
@@ -270,14 +323,45 @@ async def competition_club_analysis(
     club: Optional[str] = None,
 ) -> dict:
     reject_skater_role(request)
+    return await response_cache.get_or_compute(
+        session, "stats.competition_club_analysis", {"competition_id": competition_id, "club": club},
+        lambda: _competition_club_analysis(session, competition_id, club),
+    )
+
+
+async def _competition_club_analysis(session: AsyncSession, competition_id: int, club: Optional[str]) -> dict:
     club_short = await _get_club_short(session, club)
     if not club_short:
         return {"error": "No club configured"}
     return await compute_competition_club_analysis(session, competition_id, club_short)
 
 
+@get("/season-club-analysis")
+async def season_club_analysis(
+    request: Request,
+    session: AsyncSession,
+    season: Optional[str] = None,
+    club: Optional[str] = None,
+) -> list[dict]:
+    reject_skater_role(request)
+    return await response_cache.get_or_compute(
+        session, "stats.season_club_analysis", {"season": season, "club": club},
+        lambda: _season_club_analysis(session, season, club),
+    )
+
+
+async def _season_club_analysis(session: AsyncSession, season: Optional[str], club: Optional[str]) -> list[dict]:
+    club_short = await _get_club_short(session, club)
+    if not club_short:
+        return []
+    return await compute_season_club_analysis(session, season or await _get_current_season(session), club_short)
+
+
 router = Router(
     path="/api/stats",
-    route_handlers=[progression_ranking, benchmarks, element_mastery, competition_club_analysis],
-    dependencies={"session": Provide(get_session)},
+    route_handlers=[
+        progression_ranking, benchmarks, percentile, score_histogram,
+        element_mastery, competition_club_analysis, season_club_analysis,
+    ],
+    dependencies={"session": Provide(get_read_session)},
 )
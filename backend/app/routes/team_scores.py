@@ -4,31 +4,43 @@ from litestar import Router, get, put, Request
 from litestar.di import Provide
 from litestar.exceptions import NotFoundException, ClientException
 from sqlalchemy import select
+from sqlalchemy.orm import undefer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.guards import require_admin
-from app.database import get_session
+from app.database import get_read_session, get_session
 from app.models.app_settings import AppSettings
 from app.models.competition import Competition
 from app.models.score import Score
+from app.services.response_cache import bump_data_version, current_data_version
+from app.services.single_flight import single_flight
 from app.services.team_scoring import get_team_scores, auto_init_titular, DEFAULT_MEDIANS
 
 
+# Writable session: get_team_scores fills in missing titular flags first.
 @get("/{competition_id:int}/team-scores")
 async def get_competition_team_scores(
     competition_id: int, session: AsyncSession
 ) -> dict:
-    result = await get_team_scores(session, competition_id)
+    # Titular and median edits bump the version: requests made after one
+    # never share a computation started before it.
+    version = await current_data_version(session)
+    result = await single_flight.run(
+        "team-scores", (version, competition_id), lambda: get_team_scores(session, competition_id)
+    )
     if result is None:
         raise NotFoundException("Compétition introuvable ou pas de type France Clubs")
     return result
 
 
-@get("/{competition_id:int}/team-medians")
+@get("/{competition_id:int}/team-medians", dependencies={"session": Provide(get_read_session)})
 async def get_competition_medians(
     competition_id: int, session: AsyncSession
 ) -> dict:
-    comp = await session.get(Competition, competition_id)
+    comp = await session.get(
+        Competition, competition_id,
+        options=[undefer(Competition.team_medians)], populate_existing=True,
+    )
     if not comp:
         raise NotFoundException("Compétition introuvable")
 
@@ -55,11 +67,12 @@ async def update_competition_medians(
         raise ClientException(detail="Format de médianes invalide", status_code=400)
 
     comp.team_medians = medians
+    await bump_data_version(session)
     await session.commit()
     return {"medians": comp.team_medians, "source": "competition"}
 
 
-@get("/default-team-medians")
+@get("/default-team-medians", dependencies={"session": Provide(get_read_session)})
 async def get_default_medians(request: Request, session: AsyncSession) -> dict:
     require_admin(request)
     result = await session.execute(select(AppSettings).limit(1))
@@ -84,6 +97,7 @@ async def update_default_medians(
         raise ClientException(detail="Format de médianes invalide", status_code=400)
 
     settings.default_team_medians = medians
+    await bump_data_version(session)
     await session.commit()
     return {"medians": settings.default_team_medians}
 
@@ -104,6 +118,7 @@ async def update_titular_status(
         raise ClientException(detail="is_titular doit etre un booleen", status_code=400)
 
     score.is_titular = is_titular
+    await bump_data_version(session)
     await session.commit()
     return {"score_id": score.id, "is_titular": score.is_titular}
 
@@ -131,6 +146,7 @@ async def reset_titular_status(
 
     # Re-run auto-init
     await auto_init_titular(session, competition_id)
+    await bump_data_version(session)
     await session.commit()
     return {"reset": True, "count": len(scores)}
 
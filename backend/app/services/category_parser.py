@@ -2,6 +2,7 @@
 
 import logging
 import re
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -42,9 +43,18 @@ def parse_category(raw: str | None) -> dict:
     Returns {"skating_level": ..., "age_group": ..., "gender": ...}
     with None for any field that cannot be determined.
     """
-    if not raw:
-        return {"skating_level": None, "age_group": None, "gender": None}
+    skating_level, age_group, gender = _parse(raw) if raw else (None, None, None)
+    return {
+        "skating_level": skating_level,
+        "age_group": age_group,
+        "gender": gender,
+    }
+
 
+# A season has a few hundred distinct category strings across hundreds of
+# thousands of rows, so imports and backfills mostly hit the cache.
+@lru_cache(maxsize=4096)
+def _parse(raw: str) -> tuple[str | None, str | None, str | None]:
     skating_level = None
     for pattern, level in _LEVEL_RULES:
         if pattern.search(raw):
@@ -67,8 +77,4 @@ def parse_category(raw: str | None) -> dict:
     gender_match = _GENDER_PATTERN.search(raw)
     gender = gender_match.group(1).capitalize() if gender_match else None
 
-    return {
-        "skating_level": skating_level,
-        "age_group": age_group,
-        "gender": gender,
-    }
+    return skating_level, age_group, gender
@@ -0,0 +1,37 @@
+"""
+Canonical club keys.
+
+Club names are compared on a normalized key (accents stripped, case folded,
+whitespace collapsed) stored next to each ``club`` column, so club filters are
+plain indexed equality instead of lower()/upper() over every row.
+"""
+
+from __future__ import annotations
+
+import unicodedata
+
+from sqlalchemy import or_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def club_key(club: str | None) -> str | None:
+    """Return the comparison key for a club name, or None if there is none."""
+    if not club:
+        return None
+    stripped = "".join(
+        c for c in unicodedata.normalize("NFD", club)
+        if unicodedata.category(c) != "Mn"
+    )
+    key = " ".join(stripped.casefold().split())
+    return key or None
+
+
+def club_filter(club: str, *key_columns) -> ColumnElement[bool]:
+    """Condition matching ``club`` on any of the given ``club_key`` columns.
+
+    e.g. ``club_filter(name, Score.club_key, Skater.club_key)`` keeps rows
+    where either the score or the skater belongs to the club.
+    """
+    key = club_key(club)
+    conditions = [column == key for column in key_columns]
+    return conditions[0] if len(conditions) == 1 else or_(*conditions)
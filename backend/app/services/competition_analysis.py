@@ -2,12 +2,17 @@
 
 from collections import defaultdict
 
-from sqlalchemy import func, select
+from collections.abc import Iterable
+from typing import Optional
+
+from sqlalchemy import Select, and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.category_result import CategoryResult
 from app.models.competition import Competition
+from app.models.skater import Skater
+from app.services.club_key import club_filter
 
 
 def compute_club_challenge_points(rank: int, total_in_category: int) -> dict:
@@ -25,6 +30,68 @@ def compute_club_challenge_points(rank: int, total_in_category: int) -> dict:
     return {"base": base, "podium": podium, "total": base + podium}
 
 
+async def personal_best_results(
+    session: AsyncSession,
+    competition_ids: Iterable[int],
+    skater_ids: Iterable[int] | Select,
+) -> set[tuple[int, int, str]]:
+    """Category results of ``competition_ids`` beating the skater's prior best.
+
+    A result is a personal best when its combined total beats the skater's
+    best combined total in the same category at a competition held on an
+    earlier date. Prior bests come from one windowed query: the best total
+    per skater, category and date, then the maximum over the earlier dates.
+    Results without a prior best, or at a competition without a date, are
+    never personal bests.
+
+    Returns (competition_id, skater_id, category) tuples.
+    """
+    if not isinstance(skater_ids, Select):
+        skater_ids = list(skater_ids)
+        if not skater_ids:
+            return set()
+    per_day = (
+        select(
+            CategoryResult.skater_id,
+            CategoryResult.category,
+            Competition.date,
+            func.max(CategoryResult.combined_total).label("day_best"),
+        )
+        .join(Competition, CategoryResult.competition_id == Competition.id)
+        .where(
+            CategoryResult.skater_id.in_(skater_ids),
+            CategoryResult.combined_total.isnot(None),
+            Competition.date.isnot(None),
+        )
+        .group_by(CategoryResult.skater_id, CategoryResult.category, Competition.date)
+        .subquery()
+    )
+    prior = select(
+        per_day.c.skater_id,
+        per_day.c.category,
+        per_day.c.date,
+        func.max(per_day.c.day_best).over(
+            partition_by=(per_day.c.skater_id, per_day.c.category),
+            order_by=per_day.c.date,
+            rows=(None, -1),
+        ).label("prior_best"),
+    ).subquery()
+    rows = await session.execute(
+        select(CategoryResult.competition_id, CategoryResult.skater_id, CategoryResult.category)
+        .join(Competition, CategoryResult.competition_id == Competition.id)
+        .join(prior, and_(
+            prior.c.skater_id == CategoryResult.skater_id,
+            prior.c.category == CategoryResult.category,
+            prior.c.date == Competition.date,
+        ))
+        .where(
+            CategoryResult.competition_id.in_(list(competition_ids)),
+            CategoryResult.combined_total > prior.c.prior_best,
+        )
+    )
+    return {tuple(row) for row in rows.all()}
+
+
 async def compute_competition_club_analysis(
     session: AsyncSession,
     competition_id: int,
@@ -107,23 +174,10 @@ async def compute_competition_club_analysis(
     club_skater_ids = {cr.skater_id for cr in club_results}
 
     # PB detection
-    pb_skater_ids: set[int] = set()
-    for cr in club_results:
-        prior_stmt = (
-            select(func.max(CategoryResult.combined_total))
-            .join(CategoryResult.competition)
-            .where(
-                CategoryResult.skater_id == cr.skater_id,
-                CategoryResult.category == cr.category,
-                CategoryResult.competition_id != competition_id,
-                Competition.date < competition.date,
-                CategoryResult.combined_total.isnot(None),
-            )
-        )
-        prior_result = await session.execute(prior_stmt)
-        prev_best = prior_result.scalar()
-        if prev_best is not None and cr.combined_total is not None and cr.combined_total > prev_best:
-            pb_skater_ids.add(cr.skater_id)
+    pb_skater_ids = {
+        skater_id
+        for _, skater_id, _ in await personal_best_results(session, [competition_id], club_skater_ids)
+    }
 
     # Medals
     medals = []
@@ -186,3 +240,67 @@ async def compute_competition_club_analysis(
         "categories": categories,
         "results": results,
     }
+
+
+async def compute_season_club_analysis(
+    session: AsyncSession,
+    season: Optional[str],
+    club: str,
+) -> list[dict]:
+    """Club KPIs of every competition of a season, for the competitions list.
+
+    Same KPIs as ``compute_competition_club_analysis``, from three queries
+    whatever the number of competitions: the competitions, their category
+    results as plain columns, and the personal bests of the club skaters.
+    """
+    comps = (await session.execute(
+        select(Competition).where(Competition.season == season).order_by(Competition.date, Competition.id)
+    )).scalars().all()
+    if not comps:
+        return []
+
+    rows = (await session.execute(
+        select(
+            CategoryResult.competition_id,
+            CategoryResult.skater_id,
+            CategoryResult.category,
+            CategoryResult.overall_rank,
+            Skater.club,
+        )
+        .join(Skater, CategoryResult.skater_id == Skater.id)
+        .join(Competition, CategoryResult.competition_id == Competition.id)
+        .where(Competition.season == season)
+    )).all()
+
+    club_upper = club.upper()
+    by_competition: dict[int, list] = defaultdict(list)
+    for row in rows:
+        by_competition[row.competition_id].append(row)
+
+    club_skaters = select(Skater.id).where(club_filter(club, Skater.club_key))
+    pb_results = await personal_best_results(session, [c.id for c in comps], club_skaters)
+
+    overview = []
+    for comp in comps:
+        comp_rows = by_competition.get(comp.id, [])
+        club_rows = [r for r in comp_rows if (r.club or "").upper() == club_upper]
+        club_categories = {r.category for r in club_rows}
+        pb_skater_ids = {
+            r.skater_id for r in club_rows if (comp.id, r.skater_id, r.category) in pb_results
+        }
+        overview.append({
+            "competition": {
+                "id": comp.id,
+                "name": comp.name,
+                "date": comp.date.isoformat() if comp.date else None,
+                "season": comp.season,
+            },
+            "kpis": {
+                "skaters_entered": len({r.skater_id for r in club_rows}),
+                "total_medals": sum(1 for r in club_rows if r.overall_rank and r.overall_rank <= 3),
+                "personal_bests": len(pb_skater_ids),
+                "categories_entered": len(club_categories),
+                "categories_total": len({r.category for r in comp_rows}),
+            },
+        })
+    return overview
@@ -0,0 +1,92 @@
+"""
+In-process fan-out of server events (job updates, notification counts) to the
+SSE stream in app/routes/events.py.
+
+Events only reach subscribers connected to the process that published them.
+With several worker processes, a job claimed elsewhere is not streamed here;
+clients keep a slow fallback poll for that case.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+_NOTIFY_USERS_KEY = "event_bus_notify_users"
+
+
+@dataclass(eq=False)
+class Subscriber:
+    user_id: str
+    is_admin: bool
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=100))
+
+
+class EventBus:
+    def __init__(self) -> None:
+        self._subscribers: set[Subscriber] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: str, *, is_admin: bool) -> AsyncIterator[asyncio.Queue]:
+        """Register a subscriber; yields its queue of (event_type, data) tuples."""
+        sub = Subscriber(user_id=user_id, is_admin=is_admin)
+        self._subscribers.add(sub)
+        try:
+            yield sub.queue
+        finally:
+            self._subscribers.discard(sub)
+
+    def publish(
+        self,
+        event_type: str,
+        data: dict,
+        *,
+        user_id: str | None = None,
+        admin_only: bool = False,
+    ) -> None:
+        """Queue an event for matching subscribers. Never blocks.
+
+        A subscriber that falls behind loses its oldest events rather than
+        stalling the publisher.
+        """
+        for sub in list(self._subscribers):
+            if user_id is not None and sub.user_id != user_id:
+                continue
+            if admin_only and not sub.is_admin:
+                continue
+            if sub.queue.full():
+                sub.queue.get_nowait()
+            sub.queue.put_nowait((event_type, data))
+
+
+def notify_after_commit(session: AsyncSession | Session, user_id: str) -> None:
+    """Publish a notifications event for ``user_id`` once ``session`` commits."""
+    sync_session = session.sync_session if isinstance(session, AsyncSession) else session
+    sync_session.info.setdefault(_NOTIFY_USERS_KEY, set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed_notifications(session: Session) -> None:
+    for user_id in session.info.pop(_NOTIFY_USERS_KEY, ()):
+        event_bus.publish("notifications", {}, user_id=user_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back_notifications(session: Session, previous_transaction) -> None:
+    # A rolled-back savepoint doesn't undo changes the outer transaction commits.
+    if not previous_transaction.nested:
+        session.info.pop(_NOTIFY_USERS_KEY, None)
+
+
+# Singleton instance
+event_bus = EventBus()
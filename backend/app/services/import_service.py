@@ -5,6 +5,7 @@ from datetime import date as date_type, datetime, timezone
 
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from app.models.competition import Competition
 from app.models.skater import Skater
@@ -14,8 +15,15 @@ from app.models.skater_alias import SkaterAlias
 from app.services.scraper_factory import get_scraper
 from app.services.downloader import download_pdfs, url_to_slug
 from app.services.parser import parse_elements, extract_segment_code
+from app.services.response_cache import bump_data_version
 from app.services.name_parser import parse_skater_name
 from app.services.category_parser import parse_category
+from app.services.club_key import club_key
+from app.services.score_elements import replace_score_elements
+from app.services.score_distribution import competition_cohorts, refresh_distributions
+from app.services.season_summary import refresh_season_summaries
+from app.services.upsert import insert_ignore
+from app.services import job_metrics, poll_scheduler
 
 
 def _normalize_couple_club(club: str | None, first_name: str, last_name: str) -> str | None:
@@ -78,14 +86,16 @@ async def _get_or_create_skater(
             skater = await session.get(Skater, alias.skater_id)
 
     if not skater:
-        skater = Skater(
-            first_name=first_name,
-            last_name=last_name,
-            nationality=nationality,
-            club=club,
-        )
-        session.add(skater)
-        await session.flush()
+        # Imports running in other workers may create the same skater at the
+        # same moment; the (first_name, last_name) constraint picks one row.
+        await insert_ignore(session, Skater, {
+            "first_name": first_name,
+            "last_name": last_name,
+            "nationality": nationality,
+            "club": club,
+            "club_key": club_key(club),
+        }, conflict=["first_name", "last_name"])
+        skater = (await session.execute(stmt)).scalar_one()
     else:
         if not skater.nationality and nationality:
             skater.nationality = nationality
@@ -115,14 +125,58 @@ def _orphan_skater_query():
     )
 
 
+def _finished_segment_urls(segment_status: dict | None) -> set[str]:
+    return {url for url, st in (segment_status or {}).items() if st.get("finished")}
+
+
+def _update_segment_status(previous: dict | None, events: list) -> dict:
+    """Fold one scrape's SEG pages into the per-segment live state.
+
+    A segment is finished once all starters are ranked, its protocol PDF is
+    linked, and neither the results nor the PDF link changed since the
+    previous poll. Segments that were not fetched keep their state; segments
+    gone from the index are dropped.
+    """
+    previous = previous or {}
+    status = {}
+    for event in events:
+        if not event.seg_url:
+            continue
+        prev = previous.get(event.seg_url)
+        if not event.fetched:
+            if prev is not None:
+                status[event.seg_url] = prev
+            continue
+        unchanged = (
+            prev is not None
+            and prev.get("fingerprint") == event.fingerprint
+            and prev.get("pdf_url") == event.pdf_url
+        )
+        status[event.seg_url] = {
+            "fingerprint": event.fingerprint,
+            "pdf_url": event.pdf_url,
+            "finished": event.finished and unchanged,
+        }
+    return status
+
+
 async def run_import(session: AsyncSession, competition_id: int, force: bool = False) -> dict:
     """Import competition results. Returns the import result dict."""
     comp = await session.get(Competition, competition_id)
     if not comp:
         raise ValueError(f"Competition {competition_id} not found")
+    # Cohorts the results leave if the reimport changes categories or the season
+    cohorts_before = await competition_cohorts(session, comp.id)
+    season_before = comp.season
 
+    # Live mode: segments seen finished and unchanged on two polls are not
+    # refetched. A forced reimport fetches everything again.
+    skip_seg_urls = set() if force else _finished_segment_urls(comp.segment_status)
     scraper = get_scraper(comp.url)
-    events, results, cat_results, comp_info, index_html = await scraper.scrape(comp.url)
+    events, results, cat_results, comp_info, index_html = await scraper.scrape(
+        comp.url, skip_seg_urls=skip_seg_urls
+    )
+    comp.segment_status = _update_segment_status(comp.segment_status, events)
 
     if comp_info.name and (comp.name == comp.url or not comp.name or comp.name == "index.htm"):
         comp.name = comp_info.name
@@ -133,11 +187,12 @@ async def run_import(session: AsyncSession, competition_id: int, force: bool = F
 
     # Detect metadata from URL + HTML content
     from app.services.competition_metadata import detect_metadata
-    meta = detect_metadata(
-        comp.url, index_html,
-        scraped_city=comp_info.city,
-        scraped_country=comp_info.country,
-    )
+    with job_metrics.phase("parse"):
+        meta = detect_metadata(
+            comp.url, index_html,
+            scraped_city=comp_info.city,
+            scraped_country=comp_info.country,
+        )
     # Always fill in ligue and date_end if missing (even if metadata confirmed)
     if meta.get("ligue") and not comp.ligue:
         comp.ligue = meta["ligue"]
@@ -160,25 +215,43 @@ async def run_import(session: AsyncSession, competition_id: int, force: bool = F
     end = comp.date_end or comp.date
     if end and end >= today and not comp.polling_enabled:
         comp.polling_enabled = True
-        comp.polling_activated_at = datetime.now(timezone.utc)
+        comp.polling_activated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        poll_scheduler.reset_schedule(comp)
+
+    # Segment dates from the Time Schedule drive the polling frequency
+    schedule_dates = sorted({e.event_date for e in events if e.event_date})
+    if schedule_dates:
+        comp.schedule_dates = schedule_dates
 
     imported = 0
     skipped = 0
     cat_imported = 0
     cat_skipped = 0
+    ranks_changed = 0
+    results_changed = 0
     errors = []
 
+    rows_total = len(results) + len(cat_results)
+    rows_done = 0
+    touched_skaters: set[int] = set()
+
     for r in results:
+        rows_done += 1
+        await job_metrics.progress("write", rows_done, rows_total)
         try:
-            skater = await _get_or_create_skater(session, r.name, r.nationality, r.club, comp.date)
-            existing = await session.execute(
-                select(Score).where(
-                    Score.competition_id == comp.id,
-                    Score.skater_id == skater.id,
-                    Score.category == r.category,
-                    Score.segment == r.segment,
-                )
+            with job_metrics.phase("match", items=1):
+                skater = await _get_or_create_skater(session, r.name, r.nationality, r.club, comp.date)
+            touched_skaters.add(skater.id)
+            existing_stmt = select(Score).where(
+                Score.competition_id == comp.id,
+                Score.skater_id == skater.id,
+                Score.category == r.category,
+                Score.segment == r.segment,
             )
+            if force:
+                # Reimports compare components; polls never read them.
+                existing_stmt = existing_stmt.options(undefer(Score.components))
+            existing = await session.execute(existing_stmt)
             existing_score = existing.scalar_one_or_none()
             if existing_score:
                 if force:
@@ -208,6 +281,7 @@ async def run_import(session: AsyncSession, competition_id: int, force: bool = F
                     # Update rank (may change as more skaters complete the segment)
                     if r.rank is not None and existing_score.rank != r.rank:
                         existing_score.rank = r.rank
+                        ranks_changed += 1
                 skipped += 1
                 continue
             score = Score(
@@ -236,8 +310,12 @@ async def run_import(session: AsyncSession, competition_id: int, force: bool = F
             errors.append({"skater": r.name, "error": str(e)})
 
     for cr in cat_results:
+        rows_done += 1
+        await job_metrics.progress("write", rows_done, rows_total)
         try:
-            skater = await _get_or_create_skater(session, cr.name, cr.nationality, cr.club, comp.date)
+            with job_metrics.phase("match", items=1):
+                skater = await _get_or_create_skater(session, cr.name, cr.nationality, cr.club, comp.date)
+            touched_skaters.add(skater.id)
             existing = await session.execute(
                 select(CategoryResult).where(
                     CategoryResult.competition_id == comp.id,
@@ -248,6 +326,11 @@ async def run_import(session: AsyncSession, competition_id: int, force: bool = F
             existing_cr = existing.scalar_one_or_none()
             if existing_cr:
                 # Update ranks and totals (change as competition progresses)
+                if (
+                    cr.combined_total is not None and cr.combined_total != existing_cr.combined_total
+                    or cr.overall_rank is not None and cr.overall_rank != existing_cr.overall_rank
+                ):
+                    results_changed += 1
                 if cr.overall_rank is not None:
                     existing_cr.overall_rank = cr.overall_rank
                 if cr.combined_total is not None:
@@ -291,6 +374,7 @@ async def run_import(session: AsyncSession, competition_id: int, force: bool = F
     import_log = {
         "status": status,
         "events_found": len(events),
+        "segments_skipped": sum(1 for e in events if e.seg_url in skip_seg_urls),
         "scores_imported": imported,
         "scores_skipped": skipped,
         "category_results_imported": cat_imported,
@@ -298,13 +382,26 @@ async def run_import(session: AsyncSession, competition_id: int, force: bool = F
         "errors": errors,
     }
     comp.last_import_log = import_log
+    if imported or cat_imported or ranks_changed:
+        comp.last_change_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
     # Notify admins when a polled competition gets new results
     if comp.polling_enabled and (imported > 0 or cat_imported > 0):
         from app.services.notification_service import notify_competition_update
         await notify_competition_update(session, comp, import_log)
 
-    await session.commit()
+    # Inserts and updates are flushed here; time matching skaters is charged to "match".
+    with job_metrics.phase("write", items=rows_total):
+        await refresh_season_summaries(session, touched_skaters)
+        if force or imported or cat_imported or results_changed or comp.season != season_before:
+            await refresh_distributions(
+                session, cohorts_before | await competition_cohorts(session, comp.id)
+            )
+        # Polls that find nothing new keep the cached dashboard and stats
+        if (force or imported or cat_imported or ranks_changed or results_changed
+                or comp.season != season_before):
+            await bump_data_version(session)
+        await session.commit()
 
     # Clean up orphaned skaters (no scores and no category results)
     orphan_stmt = _orphan_skater_query()
@@ -327,22 +424,24 @@ async def run_enrich(session: AsyncSession, competition_id: int, force: bool = F
         raise ValueError(f"Competition {competition_id} not found")
 
     scraper = get_scraper(comp.url)
-    events, _, _, _, _ = await scraper.scrape(comp.url)
+    events, _, _, _, _ = await scraper.scrape(comp.url, index_only=True)
     pdf_urls = [e.pdf_url for e in events if e.pdf_url]
 
     if not pdf_urls:
         return {"competition_id": competition_id, "pdfs_downloaded": 0, "scores_enriched": 0, "errors": []}
 
     slug = url_to_slug(comp.url)
-    pdf_paths = await download_pdfs(pdf_urls, slug)
+    with job_metrics.phase("fetch", items=len(pdf_urls)):
+        pdf_paths = await download_pdfs(pdf_urls, slug)
 
     enriched = 0
     unmatched = []
     errors = []
 
-    for pdf_path in pdf_paths:
+    for done, pdf_path in enumerate(pdf_paths, start=1):
         try:
-            parsed = parse_elements(pdf_path)
+            with job_metrics.phase("parse", items=1):
+                parsed = parse_elements(pdf_path)
             for entry in parsed:
                 skater_name = entry["skater_name"]
                 elements = entry["elements"]
@@ -356,11 +455,13 @@ async def run_enrich(session: AsyncSession, competition_id: int, force: bool = F
                         Skater.first_name == pdf_first,
                         Skater.last_name == pdf_last,
                     )
+                    .options(undefer(Score.elements), undefer(Score.components))
                 )
                 if seg_code:
                     stmt = stmt.where(Score.segment == seg_code)
-                result = await session.execute(stmt)
-                scores = result.scalars().all()
+                with job_metrics.phase("match", items=1):
+                    result = await session.execute(stmt)
+                    scores = result.scalars().all()
                 # Build enriched components dict from PDF data
                 pdf_components = entry.get("components")
                 enriched_components = None
@@ -375,6 +476,7 @@ async def run_enrich(session: AsyncSession, competition_id: int, force: bool = F
                         if not score.elements or force:
                             score.elements = elements
                             score.pdf_path = str(pdf_path)
+                            await replace_score_elements(session, score)
                             enriched += 1
                         if enriched_components and (not score.components or force or isinstance(next(iter(score.components.values()), None), (int, float))):
                             score.components = enriched_components
@@ -382,8 +484,11 @@ async def run_enrich(session: AsyncSession, competition_id: int, force: bool = F
                     unmatched.append(skater_name)
         except Exception as e:
             errors.append({"file": str(pdf_path), "error": str(e)})
+        await job_metrics.progress("parse", done, len(pdf_paths))
 
-    await session.commit()
+    with job_metrics.phase("write", items=enriched):
+        await bump_data_version(session)
+        await session.commit()
     return {
         "competition_id": competition_id,
         "pdfs_downloaded": len(pdf_paths),
@@ -0,0 +1,118 @@
+"""
+Per-phase timing and live progress for background jobs.
+
+The job queue installs a JobMetrics for each job it runs; import, enrich and
+the scrapers record into it through the module-level helpers, which are no-ops
+outside a job (tests, scripts).
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Iterator
+
+ProgressCallback = Callable[[dict], Awaitable[None]]
+
+_current: ContextVar[JobMetrics | None] = ContextVar("job_metrics", default=None)
+
+
+class JobMetrics:
+    """Accumulates phase durations and counts, and forwards progress updates.
+
+    Phases nest: time spent in an inner phase is charged to it and not to the
+    enclosing one, so the durations of all phases add up to the measured time.
+    Progress updates are throttled to one per ``progress_interval`` seconds,
+    except the last update of a phase, which is always forwarded.
+    """
+
+    def __init__(
+        self,
+        on_progress: ProgressCallback | None = None,
+        *,
+        progress_interval: float = 1.0,
+    ) -> None:
+        self._on_progress = on_progress
+        self._progress_interval = progress_interval
+        self._last_progress = 0.0
+        self._phases: dict[str, dict] = {}
+        self._stack: list[list] = []  # [name, start, time spent in children]
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        frame = [name, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[1]
+            entry = self._entry(name)
+            entry["seconds"] += elapsed - frame[2]
+            if self._stack:
+                self._stack[-1][2] += elapsed
+
+    def count(self, name: str, n: int = 1) -> None:
+        self._entry(name)["count"] += n
+
+    async def progress(self, phase: str, done: int, total: int) -> None:
+        if self._on_progress is None:
+            return
+        now = time.perf_counter()
+        if done < total and now - self._last_progress < self._progress_interval:
+            return
+        self._last_progress = now
+        await self._on_progress({"phase": phase, "done": done, "total": total})
+
+    def to_dict(self) -> dict:
+        return {
+            "total_seconds": round(time.perf_counter() - self._started, 3),
+            "phases": {
+                name: {"seconds": round(p["seconds"], 3), "count": p["count"]}
+                for name, p in self._phases.items()
+            },
+        }
+
+    def _entry(self, name: str) -> dict:
+        return self._phases.setdefault(name, {"seconds": 0.0, "count": 0})
+
+
+def current_metrics() -> JobMetrics | None:
+    return _current.get()
+
+
+@contextmanager
+def use_metrics(metrics: JobMetrics) -> Iterator[JobMetrics]:
+    """Make ``metrics`` the recorder for the current task."""
+    token = _current.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def phase(name: str, items: int = 0) -> Iterator[None]:
+    """Time a block as ``name``, adding ``items`` to the phase's counter."""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    with metrics.phase(name):
+        yield
+    if items:
+        metrics.count(name, items)
+
+
+def count(name: str, n: int = 1) -> None:
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.count(name, n)
+
+
+async def progress(phase_name: str, done: int, total: int) -> None:
+    metrics = _current.get()
+    if metrics is not None:
+        await metrics.progress(phase_name, done, total)
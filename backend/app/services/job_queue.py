@@ -1,27 +1,100 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import logging
+import os
+import socket
 import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from typing import Any, Callable, Awaitable
 
-from sqlalchemy import select, delete
+from sqlalchemy import and_, case, select, delete, update, or_, exists
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased, joinedload
 
+from app.config import JOB_LEASE_SECONDS, JOB_POLL_INTERVAL
 from app.models.job import Job
+from app.services.event_bus import event_bus
+from app.services.job_metrics import JobMetrics, use_metrics
 
+logger = logging.getLogger(__name__)
 
-class JobQueue:
-    """Async job queue with DB persistence. Processes one job at a time."""
 
-    def __init__(self) -> None:
-        self._queue: asyncio.Queue[str] = asyncio.Queue()
+# Queued job types that satisfy a request for the given type. A reimport does
+# everything an import does, so it absorbs import requests.
+_COALESCE_TYPES: dict[str, tuple[str, ...]] = {
+    "import": ("import", "reimport"),
+    "reimport": ("reimport", "import"),
+}
+
+
+# Priority class per trigger (lower runs first) and the head start it gets.
+# A job's deadline is created_at plus its class delay and workers claim the
+# earliest deadline, so a lower class overtakes newer higher-priority jobs
+# once it has waited that long and never starves.
+_PRIORITIES: dict[str, tuple[int, timedelta]] = {
+    "manual": (0, timedelta(0)),
+    "auto": (1, timedelta(minutes=10)),
+    "bulk": (2, timedelta(minutes=30)),
+}
+_DEFAULT_PRIORITY = _PRIORITIES["auto"]
+
+
+def _utcnow() -> datetime:
+    """Naive UTC timestamp, comparable with values read back from the DB."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _encode_cursor(job: Job) -> str:
+    raw = f"{job.created_at.isoformat()}|{job.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, job_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), job_id
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from exc
+
+
+def _default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class JobQueue:
+    """Job queue backed by the jobs table. Each worker runs one job at a time.
+
+    The table is the source of truth: workers claim queued rows with a single
+    atomic UPDATE and hold a lease on them, renewed by a heartbeat while the
+    job runs. Any number of processes can share the queue, and jobs still
+    queued when a process stops are picked up by the next worker to poll.
+    """
+
+    def __init__(
+        self,
+        *,
+        worker_id: str | None = None,
+        lease_seconds: int = JOB_LEASE_SECONDS,
+        poll_interval: float = JOB_POLL_INTERVAL,
+    ) -> None:
+        self.worker_id = worker_id or _default_worker_id()
+        self._lease = timedelta(seconds=lease_seconds)
+        self._poll_interval = poll_interval
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._stopping = False
         self._handler: Callable[[dict], Awaitable[Any]] | None = None
         self._worker_task: asyncio.Task | None = None
         self._session_factory: Callable | None = None
         self._owns_session = True  # True = create & commit/close sessions; False = use shared session
+        # Latest unsaved progress per running job, and the task saving it
+        self._pending_progress: dict[str, dict] = {}
+        self._progress_writers: dict[str, asyncio.Task] = {}
 
     def set_session_factory(self, factory: Callable, *, owns_session: bool = True) -> None:
         self._session_factory = factory
@@ -43,32 +116,106 @@ class JobQueue:
     async def create_job(
         self, job_type: str, competition_id: int, trigger: str = "manual"
     ) -> dict:
-        job_id = uuid.uuid4().hex[:12]
-        now = datetime.now(timezone.utc)
-
+        """Queue a job, or return an equivalent job that is still queued.
+
+        A queued job of the same type and competition is reused as-is. Since a
+        reimport is a superset of an import, a queued reimport absorbs a new
+        import request, and a new reimport request upgrades a queued import.
+        Concurrent callers are serialized by the partial unique index on queued
+        (competition_id, type) rows: the loser of the race gets the winner's job.
+        """
         async with self._session_scope() as session:
-            job = Job(
-                id=job_id,
-                type=job_type,
-                trigger=trigger,
-                competition_id=competition_id,
-                status="queued",
-                created_at=now,
-            )
-            session.add(job)
+            job = await self._coalesce(session, job_type, competition_id, trigger)
+            created = job is None
+            if created:
+                job = await self._insert_job(session, job_type, competition_id, trigger)
+                if job is None:
+                    # Lost an insert race; the concurrent job is queued by now.
+                    created = False
+                    job = await self._coalesce(session, job_type, competition_id, trigger)
+            response = self._job_fields(job)
+
+        if created:
+            self._idle.clear()
+            self._wakeup.set()
+        self._publish(response)
+
+        return response
+
+    async def _coalesce(
+        self, session: AsyncSession, job_type: str, competition_id: int, trigger: str
+    ) -> Job | None:
+        """Return a queued job that satisfies the request, upgrading it if needed.
+
+        A reimport request upgrades a queued import, and a request from a more
+        urgent trigger promotes the queued job to that priority.
+        """
+        existing = await self._find_coalescable(session, job_type, competition_id)
+        if existing is None:
+            return None
+
+        values = {}
+        if job_type == "reimport" and existing.type == "import":
+            values["type"] = "reimport"
+        priority, delay = _PRIORITIES.get(trigger, _DEFAULT_PRIORITY)
+        if priority < existing.priority:
+            values["priority"] = priority
+            values["deadline"] = min(existing.deadline or _utcnow(), _utcnow() + delay)
+        if not values:
+            return existing
+
+        # Conditional update: a worker may have claimed the job meanwhile.
+        result = await session.execute(
+            update(Job)
+            .where(Job.id == existing.id, Job.status == "queued")
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            return None
+        await session.refresh(existing)
+        return existing
 
-        self._queue.put_nowait(job_id)
+    @staticmethod
+    async def _insert_job(
+        session: AsyncSession, job_type: str, competition_id: int, trigger: str
+    ) -> Job | None:
+        """Insert a queued job, or return None if an equivalent one already exists."""
+        now = _utcnow()
+        priority, delay = _PRIORITIES.get(trigger, _DEFAULT_PRIORITY)
+        job = Job(
+            id=uuid.uuid4().hex[:12],
+            type=job_type,
+            trigger=trigger,
+            competition_id=competition_id,
+            status="queued",
+            priority=priority,
+            deadline=now + delay,
+            created_at=now,
+        )
+        try:
+            async with session.begin_nested():
+                session.add(job)
+        except IntegrityError:
+            return None
+        return job
 
-        return {
-            "id": job_id,
-            "type": job_type,
-            "trigger": trigger,
-            "competition_id": competition_id,
-            "status": "queued",
-            "result": None,
-            "error": None,
-            "created_at": now.isoformat(),
-        }
+    @staticmethod
+    async def _find_coalescable(
+        session: AsyncSession, job_type: str, competition_id: int
+    ) -> Job | None:
+        types = _COALESCE_TYPES.get(job_type, (job_type,))
+        stmt = (
+            select(Job)
+            .where(
+                Job.competition_id == competition_id,
+                Job.status == "queued",
+                Job.type.in_(types),
+            )
+            .order_by(case((Job.type == job_type, 0), else_=1), Job.created_at)
+            .limit(1)
+        )
+        return (await session.execute(stmt)).scalar_one_or_none()
 
     async def get_job(self, job_id: str) -> dict | None:
         async with self._session_scope() as session:
@@ -76,6 +223,7 @@ class JobQueue:
                 select(Job)
                 .options(joinedload(Job.competition))
                 .where(Job.id == job_id)
+                .execution_options(populate_existing=True)
             )
             result = await session.execute(stmt)
             job = result.unique().scalar_one_or_none()
@@ -83,51 +231,84 @@ class JobQueue:
                 return None
             return self._job_to_dict(job)
 
-    async def list_jobs(self) -> list[dict]:
-        async with self._session_scope() as session:
-            stmt = (
-                select(Job)
-                .options(joinedload(Job.competition))
-                .order_by(Job.created_at.desc())
+    async def list_jobs(
+        self,
+        *,
+        status: list[str] | None = None,
+        job_type: str | None = None,
+        trigger: str | None = None,
+        competition_id: int | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """Return one page of jobs, newest first, and the cursor of the next page.
+
+        Pages are keyed on (created_at, id) so each one costs an index range
+        scan however deep the history goes. Raises ValueError on a malformed
+        cursor.
+        """
+        stmt = select(Job).options(joinedload(Job.competition))
+        if status:
+            stmt = stmt.where(Job.status.in_(status))
+        if job_type is not None:
+            stmt = stmt.where(Job.type == job_type)
+        if trigger is not None:
+            stmt = stmt.where(Job.trigger == trigger)
+        if competition_id is not None:
+            stmt = stmt.where(Job.competition_id == competition_id)
+        if cursor is not None:
+            created_at, job_id = _decode_cursor(cursor)
+            stmt = stmt.where(
+                or_(
+                    Job.created_at < created_at,
+                    and_(Job.created_at == created_at, Job.id < job_id),
+                )
             )
+        stmt = (
+            stmt.order_by(Job.created_at.desc(), Job.id.desc())
+            .limit(limit + 1)
+            .execution_options(populate_existing=True)
+        )
+
+        async with self._session_scope() as session:
             result = await session.execute(stmt)
-            jobs = result.unique().scalars().all()
-            return [self._job_to_dict(j) for j in jobs]
+            jobs = list(result.unique().scalars().all())
+            next_cursor = None
+            if len(jobs) > limit:
+                jobs = jobs[:limit]
+                next_cursor = _encode_cursor(jobs[-1])
+            return [self._job_to_dict(j) for j in jobs], next_cursor
 
     async def cancel_job(self, job_id: str) -> bool:
         async with self._session_scope() as session:
-            job = await session.get(Job, job_id)
-            if job is None or job.status != "queued":
+            # Conditional update: a worker may claim the job concurrently.
+            result = await session.execute(
+                update(Job)
+                .where(Job.id == job_id, Job.status == "queued")
+                .values(status="cancelled", completed_at=_utcnow())
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount != 1:
                 return False
-            job.status = "cancelled"
-            job.completed_at = datetime.now(timezone.utc)
-
-        # Remove from in-memory queue if present
-        try:
-            new_queue: asyncio.Queue[str] = asyncio.Queue()
-            while not self._queue.empty():
-                item = self._queue.get_nowait()
-                if item != job_id:
-                    new_queue.put_nowait(item)
-                self._queue.task_done()
-            self._queue = new_queue
-        except asyncio.QueueEmpty:
-            pass
-
+        self._publish({"id": job_id, "status": "cancelled"})
         return True
 
     async def cleanup(self, days: int = 7) -> int:
-        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=days)
+        cutoff = _utcnow() - timedelta(days=days)
         deleted = 0
 
         async with self._session_scope() as session:
-            # Mark stale running jobs as failed
-            stmt = select(Job).where(Job.status == "running")
+            # Mark running jobs whose worker is gone as failed. Jobs holding a
+            # live lease belong to another process and are left alone.
+            stmt = select(Job).where(
+                Job.status == "running",
+                or_(Job.lease_until.is_(None), Job.lease_until < _utcnow()),
+            )
             result = await session.execute(stmt)
             for job in result.scalars().all():
                 job.status = "failed"
                 job.error = "Server restarted during execution"
-                job.completed_at = datetime.now(timezone.utc)
+                job.completed_at = _utcnow()
 
             # Delete old completed/failed/cancelled jobs
             stmt = (
@@ -144,66 +325,290 @@ class JobQueue:
         self._handler = handler
 
     async def start_worker(self) -> None:
+        self._stopping = False
         self._worker_task = asyncio.create_task(self._run_worker())
 
-    async def stop_worker(self) -> None:
-        if self._worker_task:
+    async def stop_worker(self, grace: float = 5.0) -> None:
+        """Stop the worker, letting a running job finish within ``grace`` seconds."""
+        if not self._worker_task:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        done, _ = await asyncio.wait({self._worker_task}, timeout=grace)
+        if not done:
             self._worker_task.cancel()
             try:
                 await self._worker_task
             except asyncio.CancelledError:
                 pass
+        self._worker_task = None
+
+    async def join(self) -> None:
+        """Wait until the worker has found the queue empty."""
+        await self._idle.wait()
 
     async def _run_worker(self) -> None:
-        while True:
-            job_id = await self._queue.get()
-
-            async with self._session_scope() as session:
-                job = await session.get(Job, job_id)
-                if not job or not self._handler or job.status != "queued":
-                    self._queue.task_done()
-                    continue
-
-                # Mark as running
-                job.status = "running"
-                job.started_at = datetime.now(timezone.utc)
-
-            # Build dict for handler
-            job_dict = {
-                "id": job_id,
-                "type": job.type,
-                "competition_id": job.competition_id,
-                "status": "running",
-            }
+        while not self._stopping:
+            # Clear before claiming so a create_job racing with the claim
+            # still wakes the next idle wait.
+            self._wakeup.clear()
+            try:
+                await self._reap_expired()
+                job = await self._claim_next() if self._handler else None
+            except Exception:
+                logger.exception("Job worker %s failed to claim a job", self.worker_id)
+                job = None
+
+            if job is None:
+                self._idle.set()
+                await self._wait_for_work()
+                continue
+
+            self._idle.clear()
+            await self._execute(job)
+
+    async def _wait_for_work(self) -> None:
+        """Sleep until a local create_job wakes us, or the poll interval elapses."""
+        try:
+            async with asyncio.timeout(self._poll_interval):
+                await self._wakeup.wait()
+        except TimeoutError:
+            pass
 
+    async def _claim_next(self) -> dict | None:
+        """Atomically claim the queued job with the earliest deadline.
+
+        The pick and the claim are one UPDATE statement, so concurrent workers
+        never claim the same row, and on SQLite the write lock is taken up
+        front instead of upgrading from a read. On PostgreSQL the pick skips
+        rows another worker is claiming instead of waiting for it. Jobs for a
+        competition that already has a running job are passed over, so two
+        workers never import and enrich the same competition at once. Returns
+        the handler dict for the claimed job, or None if nothing is claimable.
+        """
+        running = aliased(Job)
+        next_queued = (
+            select(Job.id)
+            .where(
+                Job.status == "queued",
+                ~exists().where(
+                    running.competition_id == Job.competition_id,
+                    running.status == "running",
+                ),
+            )
+            .order_by(Job.deadline, Job.priority, Job.created_at, Job.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        now = _utcnow()
+        async with self._session_scope() as session:
+            row = (await session.execute(
+                update(Job)
+                .where(Job.id == next_queued, Job.status == "queued")
+                .values(
+                    status="running",
+                    started_at=now,
+                    claimed_by=self.worker_id,
+                    lease_until=now + self._lease,
+                    heartbeat_at=now,
+                )
+                .returning(Job.id, Job.type, Job.competition_id)
+                .execution_options(synchronize_session=False)
+            )).one_or_none()
+        if row is None:
+            return None
+        self._publish({
+            "id": row.id,
+            "type": row.type,
+            "competition_id": row.competition_id,
+            "status": "running",
+            "started_at": now.isoformat(),
+        })
+        return {
+            "id": row.id,
+            "type": row.type,
+            "competition_id": row.competition_id,
+            "status": "running",
+        }
+
+    async def _reap_expired(self) -> int:
+        """Fail running jobs whose worker stopped renewing its lease.
+
+        A read-only probe runs first so idle polls never open a write
+        transaction.
+        """
+        expired = (Job.status == "running", Job.lease_until < _utcnow())
+        async with self._session_scope() as session:
+            if not (await session.execute(select(exists().where(*expired)))).scalar():
+                return 0
+        async with self._session_scope() as session:
+            result = await session.execute(
+                update(Job)
+                .where(*expired)
+                .values(
+                    status="failed",
+                    error="Worker lease expired during execution",
+                    completed_at=_utcnow(),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            reaped = result.rowcount
+        if reaped:
+            logger.warning("Reaped %d job(s) with expired leases", reaped)
+        return reaped
+
+    async def _renew_lease(self, job_id: str) -> None:
+        now = _utcnow()
+        async with self._session_scope() as session:
+            await session.execute(
+                update(Job)
+                .where(
+                    Job.id == job_id,
+                    Job.status == "running",
+                    Job.claimed_by == self.worker_id,
+                )
+                .values(heartbeat_at=now, lease_until=now + self._lease)
+                .execution_options(synchronize_session=False)
+            )
+
+    async def _heartbeat(self, job_id: str) -> None:
+        """Renew the lease on a running job until cancelled."""
+        interval = max(self._lease.total_seconds() / 3, 1)
+        while True:
+            await asyncio.sleep(interval)
             try:
+                await self._renew_lease(job_id)
+            except Exception:
+                logger.exception("Failed to renew lease for job %s", job_id)
+
+    async def _execute(self, job_dict: dict) -> None:
+        job_id = job_dict["id"]
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        metrics = JobMetrics(on_progress=lambda p: self._record_progress(job_id, p))
+        try:
+            with use_metrics(metrics):
                 result = await self._handler(job_dict)
-                async with self._session_scope() as session:
-                    job = await session.get(Job, job_id)
-                    job.status = "completed"
-                    job.result = result
-                    job.completed_at = datetime.now(timezone.utc)
-            except Exception as e:
-                async with self._session_scope() as session:
-                    job = await session.get(Job, job_id)
-                    job.status = "failed"
-                    job.error = str(e)
-                    job.completed_at = datetime.now(timezone.utc)
-            finally:
-                self._queue.task_done()
+            status, error = "completed", None
+        except Exception as e:
+            result, status, error = None, "failed", str(e)
+        finally:
+            heartbeat.cancel()
+            try:
+                await heartbeat
+            except asyncio.CancelledError:
+                pass
+            # The handler's transaction is over, so the last progress write
+            # goes through before the job is marked finished.
+            writer = self._progress_writers.get(job_id)
+            if writer is not None:
+                await writer
+
+        timings = metrics.to_dict()
+        logger.info(
+            "Job %s (%s, competition %s) %s in %.1fs: %s",
+            job_id, job_dict["type"], job_dict["competition_id"], status,
+            timings["total_seconds"], timings["phases"],
+        )
+        try:
+            await self._finish(job_id, status, result, error, timings)
+        except Exception:
+            # The lease will expire and the reaper marks the job failed.
+            logger.exception("Failed to record %s status for job %s", status, job_id)
+
+    async def _record_progress(self, job_id: str, progress: dict) -> None:
+        """Publish live progress and store it on the job without blocking the job.
+
+        The handler may hold the SQLite write lock (an import between its
+        first flush and its commit), so the row is written by a background
+        task; progress reported meanwhile replaces the value waiting to be
+        written. Failures never interrupt the job.
+        """
+        self._publish({"id": job_id, "status": "running", "progress": progress})
+        self._pending_progress[job_id] = progress
+        if not self._owns_session:
+            # A shared (test) session can't be used from two tasks at once
+            await self._write_progress(job_id)
+        elif job_id not in self._progress_writers:
+            self._progress_writers[job_id] = asyncio.create_task(self._write_progress(job_id))
+
+    async def _write_progress(self, job_id: str) -> None:
+        try:
+            while (progress := self._pending_progress.pop(job_id, None)) is not None:
+                try:
+                    async with self._session_scope() as session:
+                        await session.execute(
+                            update(Job)
+                            .where(Job.id == job_id, Job.claimed_by == self.worker_id)
+                            .values(progress=progress)
+                            .execution_options(synchronize_session=False)
+                        )
+                except Exception:
+                    logger.warning("Failed to record progress for job %s", job_id, exc_info=True)
+        finally:
+            self._progress_writers.pop(job_id, None)
+
+    async def _finish(
+        self, job_id: str, status: str, result: Any, error: str | None, metrics: dict | None = None
+    ) -> None:
+        completed_at = _utcnow()
+        async with self._session_scope() as session:
+            updated = await session.execute(
+                update(Job)
+                .where(
+                    Job.id == job_id,
+                    Job.status == "running",
+                    Job.claimed_by == self.worker_id,
+                )
+                .values(
+                    status=status,
+                    result=result,
+                    error=error,
+                    metrics=metrics,
+                    completed_at=completed_at,
+                    lease_until=None,
+                )
+                .execution_options(synchronize_session=False)
+            )
+        if updated.rowcount != 1:
+            # Reaped after the lease expired; keep the recorded failure.
+            logger.warning("Lost lease on job %s before it finished", job_id)
+            return
+        self._publish({
+            "id": job_id,
+            "status": status,
+            "result": result,
+            "error": error,
+            "metrics": metrics,
+            "completed_at": completed_at.isoformat(),
+        })
 
     @staticmethod
-    def _job_to_dict(job: Job) -> dict:
+    def _publish(job_update: dict) -> None:
+        """Stream a job state change to connected admins (see routes/events.py)."""
+        event_bus.publish("job", job_update, admin_only=True)
+
+    @staticmethod
+    def _job_fields(job: Job) -> dict:
         return {
             "id": job.id,
             "type": job.type,
             "trigger": job.trigger,
             "competition_id": job.competition_id,
-            "competition_name": job.competition.name if job.competition else None,
             "status": job.status,
+            "priority": job.priority,
             "result": job.result,
             "error": job.error,
             "created_at": job.created_at.isoformat() if job.created_at else None,
+        }
+
+    @classmethod
+    def _job_to_dict(cls, job: Job) -> dict:
+        return {
+            **cls._job_fields(job),
+            "competition_name": job.competition.name if job.competition else None,
+            "progress": job.progress,
+            "metrics": job.metrics,
             "started_at": job.started_at.isoformat() if job.started_at else None,
             "completed_at": job.completed_at.isoformat() if job.completed_at else None,
         }
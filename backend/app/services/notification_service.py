@@ -11,6 +11,7 @@ from app.models.user_skater import UserSkater
 from app.models.skater import Skater
 from app.models.app_settings import AppSettings
 from app.services.email_service import send_email, get_smtp_config
+from app.services.event_bus import notify_after_commit
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -94,6 +95,7 @@ async def notify_competition_update(
             link=link,
         )
         session.add(notif)
+        notify_after_commit(session, admin.id)
 
         if admin.email_notifications and smtp_cfg:
             app_url = f"{app_base_url}{link}" if app_base_url else ""
@@ -140,6 +142,7 @@ async def notify_review(session: AsyncSession, review, app_base_url: str = "") -
             link=link,
         )
         session.add(notif)
+        notify_after_commit(session, user.id)
 
         if user.email_notifications and smtp_cfg:
             app_url = f"{app_base_url}{link}" if app_base_url else ""
@@ -193,6 +196,7 @@ async def notify_incident(session: AsyncSession, incident, app_base_url: str = "
             link=link,
         )
         session.add(notif)
+        notify_after_commit(session, user.id)
 
         if user.email_notifications and smtp_cfg:
             app_url = f"{app_base_url}{link}" if app_base_url else ""
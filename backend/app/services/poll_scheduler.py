@@ -0,0 +1,111 @@
+"""
+Adaptive polling schedule for competitions with polling enabled.
+
+A competition is polled every POLL_ACTIVE_INTERVAL_MINUTES on days when one of
+its segments is scheduled (Time Schedule dates collected at import, or the
+competition's date range when the schedule is unknown). On other days the
+interval doubles after each poll that found nothing new, up to
+POLL_MAX_INTERVAL_HOURS, and never runs past the start of the next scheduled
+day. Once the schedule is over and no change was seen for
+POLL_STOP_AFTER_HOURS, polling is switched off.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import date, datetime, time, timedelta, timezone
+
+from app.config import (
+    POLL_ACTIVE_INTERVAL_MINUTES,
+    POLL_JITTER,
+    POLL_MAX_INTERVAL_HOURS,
+    POLL_QUIET_INTERVAL_MINUTES,
+    POLL_STOP_AFTER_HOURS,
+)
+
+ACTIVE_INTERVAL = timedelta(minutes=POLL_ACTIVE_INTERVAL_MINUTES)
+QUIET_INTERVAL = timedelta(minutes=POLL_QUIET_INTERVAL_MINUTES)
+MAX_INTERVAL = timedelta(hours=POLL_MAX_INTERVAL_HOURS)
+STOP_AFTER = timedelta(hours=POLL_STOP_AFTER_HOURS)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _naive(dt: datetime | None) -> datetime | None:
+    if dt is not None and dt.tzinfo is not None:
+        return dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def scheduled_days(comp) -> list[date]:
+    """Days on which the competition has segments, sorted."""
+    if comp.schedule_dates:
+        return sorted(date.fromisoformat(d) for d in comp.schedule_dates)
+    if comp.date:
+        end = comp.date_end or comp.date
+        return [comp.date + timedelta(days=i) for i in range((end - comp.date).days + 1)]
+    return []
+
+
+def is_active_day(comp, day: date) -> bool:
+    return day in scheduled_days(comp)
+
+
+def _next_scheduled_day(comp, after: date) -> date | None:
+    return next((d for d in scheduled_days(comp) if d > after), None)
+
+
+def next_poll_delay(comp, now: datetime) -> timedelta:
+    """Delay until the next poll, before jitter."""
+    today = now.date()
+    if is_active_day(comp, today):
+        return ACTIVE_INTERVAL
+    # Exponent capped so the multiplication can't overflow timedelta.
+    delay = min(QUIET_INTERVAL * (2 ** min(comp.poll_quiet_streak or 0, 16)), MAX_INTERVAL)
+    upcoming = _next_scheduled_day(comp, today)
+    if upcoming is not None:
+        until_day_starts = datetime.combine(upcoming, time.min) - now
+        delay = max(min(delay, until_day_starts), ACTIVE_INTERVAL)
+    return delay
+
+
+def record_poll(comp, now: datetime | None = None, rng: random.Random | None = None) -> None:
+    """Update ``comp``'s schedule state after submitting a poll at ``now``.
+
+    Whether the previous poll found anything is read from ``last_change_at``,
+    which the import stamps when it adds or updates results.
+    """
+    now = now or _utcnow()
+    rng = rng or random
+    last_change = _naive(comp.last_change_at)
+    last_polled = _naive(comp.last_polled_at)
+    streak = comp.poll_quiet_streak or 0
+    if last_change is not None and (last_polled is None or last_change > last_polled):
+        streak = 0
+    elif last_polled is not None:
+        streak += 1
+    comp.poll_quiet_streak = streak
+
+    delay = next_poll_delay(comp, now)
+    comp.last_polled_at = now
+    comp.next_poll_at = now + delay * rng.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+
+
+def reset_schedule(comp) -> None:
+    """Poll at the next tick and start backoff from scratch (polling (re)enabled)."""
+    comp.next_poll_at = None
+    comp.poll_quiet_streak = 0
+
+
+def should_stop_polling(comp, now: datetime | None = None) -> bool:
+    """True once no scheduled day remains and nothing changed for STOP_AFTER."""
+    now = now or _utcnow()
+    days = scheduled_days(comp)
+    if not days or days[-1] >= now.date():
+        return False
+    last_activity = _naive(comp.last_change_at) or _naive(comp.polling_activated_at)
+    if last_activity is None:
+        return False
+    return now - last_activity > STOP_AFTER
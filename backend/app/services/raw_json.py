@@ -0,0 +1,29 @@
+"""
+Serve JSON columns without decoding them.
+
+Endpoints that return a JSON column unchanged select its stored text with
+``raw_json(column)`` and wrap it with ``as_raw``; msgspec then copies the
+bytes into the response as-is, skipping the decode/re-encode round trip.
+"""
+
+from __future__ import annotations
+
+import msgspec
+from sqlalchemy import Text, cast
+from sqlalchemy.sql.elements import Label
+
+
+def raw_json(column) -> Label:
+    """Select ``column``'s stored JSON text instead of the decoded value.
+
+    A real CAST rather than a type coercion: asyncpg decodes json/jsonb
+    results itself, so PostgreSQL must send the value as text.
+    """
+    return cast(column, Text).label(column.key)
+
+
+def as_raw(text: str | None, default: bytes = b"null") -> msgspec.Raw:
+    """Embed stored JSON text in a response; SQL NULL or JSON null gives ``default``."""
+    if text is None or text == "null":
+        return msgspec.Raw(default)
+    return msgspec.Raw(text.encode())
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import or_, select, func
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.models.competition import Competition
 from app.models.score import Score
+from app.models.score_element import ScoreElement
 from app.models.skater import Skater
 from app.models.category_result import CategoryResult
+from app.models.skater_season_summary import SkaterSeasonSummary
+from app.services.club_key import club_filter
+from app.services.season_summary import COMBINED_COLUMNS, combine_summaries
 from app.models.app_settings import AppSettings
 from app.config import CLUB_NAME, CLUB_SHORT
 
@@ -97,7 +101,7 @@ async def get_skater_report_data(
                 "date": comp_date,
             }
 
-    element_summary = _compute_element_summary([score for score, _, _ in rows])
+    element_summary = await _compute_element_summary(session, skater_id, season)
 
     return SkaterReportData(
         skater_name=skater_name,
@@ -110,23 +114,27 @@ async def get_skater_report_data(
     )
 
 
-def _compute_element_summary(scores: list[Score]) -> Optional[ElementSummary]:
-    element_data: dict[str, list[float]] = {}
-    for score in scores:
-        if not score.elements:
-            continue
-        elements_list = score.elements if isinstance(score.elements, list) else score.elements.get("elements", [])
-        for el in elements_list:
-            name = el.get("name", "")
-            goe = el.get("goe")
-            if name and goe is not None:
-                element_data.setdefault(name, []).append(float(goe))
-    if not element_data:
-        return None
+async def _compute_element_summary(
+    session: AsyncSession, skater_id: int, season: str
+) -> Optional[ElementSummary]:
+    stmt = (
+        select(ScoreElement.code, func.count(ScoreElement.goe), func.avg(ScoreElement.goe))
+        .join(ScoreElement.parent)
+        .join(Score.competition)
+        .where(
+            Score.skater_id == skater_id,
+            Competition.season == season,
+            ScoreElement.goe.isnot(None),
+        )
+        .group_by(ScoreElement.code)
+        .order_by(ScoreElement.code)
+    )
     stats = [
-        ElementStats(name=name, attempts=len(goes), avg_goe=round(sum(goes) / len(goes), 2))
-        for name, goes in element_data.items()
+        ElementStats(name=name, attempts=attempts, avg_goe=round(avg_goe, 2))
+        for name, attempts, avg_goe in (await session.execute(stmt)).all()
     ]
+    if not stats:
+        return None
     most_attempted = sorted(stats, key=lambda s: s.attempts, reverse=True)[:5]
     best_goe = sorted([s for s in stats if s.attempts >= 2], key=lambda s: s.avg_goe, reverse=True)[:5]
     return ElementSummary(most_attempted=most_attempted, best_goe=best_goe, total_elements_tracked=sum(s.attempts for s in stats))
@@ -153,16 +161,19 @@ async def get_club_report_data(
     club_short = CLUB_SHORT or club_name
     club_logo = settings.logo_path if settings else None
 
-    club_skaters_stmt = select(Skater).where(
+    club_skaters_stmt = select(Skater.id, Skater.first_name, Skater.last_name).where(
         or_(
-            func.lower(Skater.club) == club_short.lower(),
+            club_filter(club_short, Skater.club_key),
             Skater.id.in_(
-                select(Score.skater_id).where(func.lower(Score.club) == club_short.lower())
+                select(Score.skater_id).where(club_filter(club_short, Score.club_key))
             ),
         )
     )
-    club_skaters = (await session.execute(club_skaters_stmt)).scalars().all()
-    club_skater_ids = [s.id for s in club_skaters]
+    club_skaters = {
+        row.id: Skater.format_name(row.first_name, row.last_name)
+        for row in (await session.execute(club_skaters_stmt)).all()
+    }
+    club_skater_ids = list(club_skaters)
 
     if not club_skater_ids:
         return ClubReportData(
@@ -172,78 +183,65 @@ async def get_club_report_data(
             skaters_summary=[], medals=[], most_improved=[],
         )
 
-    scores_stmt = (
-        select(Score, Competition.name, Competition.date)
+    summary_rows = (await session.execute(
+        select(*COMBINED_COLUMNS).where(
+            SkaterSeasonSummary.skater_id.in_(club_skater_ids),
+            SkaterSeasonSummary.season == season,
+        )
+    )).all()
+    competitions_tracked = (await session.execute(
+        select(func.count(func.distinct(Score.competition_id)))
         .join(Competition, Score.competition_id == Competition.id)
         .where(Score.skater_id.in_(club_skater_ids), Competition.season == season)
-        .order_by(Competition.date)
-    )
-    score_rows = (await session.execute(scores_stmt)).all()
-
-    cr_stmt = (
-        select(CategoryResult)
+    )).scalar() or 0
+
+    medal_rows = (await session.execute(
+        select(
+            CategoryResult.skater_id,
+            CategoryResult.category,
+            CategoryResult.overall_rank,
+            Competition.name,
+            Competition.date,
+        )
         .join(Competition, CategoryResult.competition_id == Competition.id)
-        .options(selectinload(CategoryResult.competition), selectinload(CategoryResult.skater))
-        .where(CategoryResult.skater_id.in_(club_skater_ids), Competition.season == season)
+        .where(
+            CategoryResult.skater_id.in_(club_skater_ids),
+            Competition.season == season,
+            CategoryResult.overall_rank <= 3,
+        )
         .order_by(Competition.date)
-    )
-    cat_results = (await session.execute(cr_stmt)).scalars().all()
-
-    active_ids = set()
-    comp_ids = set()
-    for score, comp_name, comp_date in score_rows:
-        active_ids.add(score.skater_id)
-        comp_ids.add(score.competition_id)
-
-    medals_list = []
-    podium_count = 0
-    for cr in cat_results:
-        if cr.overall_rank and cr.overall_rank <= 3:
-            podium_count += 1
-            medals_list.append({
-                "skater_name": cr.skater.display_name,
-                "competition_name": cr.competition.name,
-                "competition_date": cr.competition.date,
-                "category": cr.category,
-                "rank": cr.overall_rank,
-            })
-
-    skater_map: dict[int, dict] = {}
-    for score, comp_name, comp_date in score_rows:
-        sid = score.skater_id
-        if sid not in skater_map:
-            sk = next(s for s in club_skaters if s.id == sid)
-            skater_map[sid] = {
-                "name": sk.display_name, "category": score.category, "comp_ids": set(),
-                "best_tss": 0.0, "best_tes": 0.0, "best_pcs": 0.0,
-                "first_tss": None, "first_date": None, "last_tss": None, "last_date": None,
-            }
-        entry = skater_map[sid]
-        entry["comp_ids"].add(score.competition_id)
-        entry["category"] = score.category
-        tss = score.total_score or 0
-        tes = score.technical_score or 0
-        pcs = score.component_score or 0
-        if tss > entry["best_tss"]: entry["best_tss"] = tss
-        if tes > entry["best_tes"]: entry["best_tes"] = tes
-        if pcs > entry["best_pcs"]: entry["best_pcs"] = pcs
-        score_date = comp_date or score.event_date
-        if entry["first_date"] is None or (score_date and score_date < entry["first_date"]):
-            entry["first_date"] = score_date
-            entry["first_tss"] = tss
-        if entry["last_date"] is None or (score_date and score_date > entry["last_date"]):
-            entry["last_date"] = score_date
-            entry["last_tss"] = tss
+    )).all()
+    medals_list = [
+        {
+            "skater_name": club_skaters[row.skater_id],
+            "competition_name": row.name,
+            "competition_date": row.date,
+            "category": row.category,
+            "rank": row.overall_rank,
+        }
+        for row in medal_rows
+        if row.overall_rank
+    ]
+
+    by_skater: dict[int, list] = defaultdict(list)
+    for row in summary_rows:
+        by_skater[row.skater_id].append(row)
+    skater_map = {
+        sid: {"name": club_skaters[sid], **combine_summaries(rows)}
+        for sid, rows in by_skater.items()
+    }
+    active = [v for v in skater_map.values() if v["programs"]]
 
     skaters_summary = sorted([
-        {"name": v["name"], "category": v["category"], "competitions_entered": len(v["comp_ids"]),
-         "best_tss": v["best_tss"], "best_tes": v["best_tes"], "best_pcs": v["best_pcs"]}
-        for v in skater_map.values()
+        {"name": v["name"], "category": v["category"], "competitions_entered": v["competitions_entered"],
+         "best_tss": v["best_tss"] or 0.0, "best_tes": v["best_tes"] or 0.0, "best_pcs": v["best_pcs"] or 0.0}
+        for v in active
     ], key=lambda x: x["name"])
 
+    # Progress between the first and last combined totals of the season
     improvements = []
     for v in skater_map.values():
-        if v["first_tss"] is not None and v["last_tss"] is not None and v["first_date"] != v["last_date"]:
+        if v["results_count"] >= 2 and v["first_date"] != v["last_date"]:
             delta = v["last_tss"] - v["first_tss"]
             improvements.append({"name": v["name"], "category": v["category"],
                                  "first_tss": v["first_tss"], "last_tss": v["last_tss"], "delta": round(delta, 2)})
@@ -252,7 +250,8 @@ async def get_club_report_data(
     return ClubReportData(
         club_name=club_name, club_logo_path=club_logo, season=season,
         generated_at=datetime.now().strftime("%d/%m/%Y %H:%M"),
-        stats={"active_skaters": len(active_ids), "competitions_tracked": len(comp_ids),
-               "total_programs": len(score_rows), "total_podiums": podium_count},
+        stats={"active_skaters": len(active), "competitions_tracked": competitions_tracked,
+               "total_programs": sum(v["programs"] for v in active),
+               "total_podiums": sum(v["podiums"] for v in skater_map.values())},
         skaters_summary=skaters_summary, medals=medals_list, most_improved=most_improved,
     )
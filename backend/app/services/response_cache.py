@@ -0,0 +1,94 @@
+"""
+In-process cache of the dashboard and stats responses.
+
+These endpoints aggregate whole seasons, but their data only changes when
+results are written: an import or enrich, a skater merge, a titular change,
+club settings. Each such write replaces the token in the data_version table
+(bump_data_version) in the same transaction. A cached request reads the
+token first, one primary-key row, and entries computed under an older token
+are dropped, so responses are never staler than the last commit, even when
+the write happened in another worker process.
+
+Entries are keyed by route and query parameters; beyond ``max_entries`` the
+least recently used is evicted. Concurrent misses of one entry share a
+single computation (services/single_flight.py).
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import RESPONSE_CACHE_SIZE
+from app.models.data_version import DataVersion
+from app.services.single_flight import single_flight
+from app.services.upsert import upsert
+
+
+async def current_data_version(session: AsyncSession) -> str | None:
+    return (await session.execute(select(DataVersion.token).where(DataVersion.id == 1))).scalar()
+
+
+async def bump_data_version(session: AsyncSession) -> None:
+    """Invalidate cached responses in every worker once ``session`` commits."""
+    await upsert(session, DataVersion, {"id": 1, "token": uuid.uuid4().hex}, conflict=["id"], update=["token"])
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+        self._version: str | None = None
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_compute(
+        self,
+        session: AsyncSession,
+        route: str,
+        params: dict,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached response for ``route`` and ``params``, or compute it.
+
+        ``session`` is the request's session, which ``compute`` reads with:
+        the data it sees is at least as new as the version read here.
+        """
+        version = await current_data_version(session)
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+        key = (route, tuple(sorted(params.items())))
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        self.misses += 1
+        value = await single_flight.run(route, (version, key[1]), compute)
+        # Another request may have seen a newer version meanwhile
+        if self._version == version:
+            self._entries[key] = value
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._version = None
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "version": self._version,
+        }
+
+
+response_cache = ResponseCache(RESPONSE_CACHE_SIZE)
@@ -0,0 +1,190 @@
+"""
+Score distributions per cohort (the score_distributions table).
+
+Benchmarks, percentile ranks and histograms all need the sorted scores of a
+cohort: one season, level, age group and gender, for one segment or for
+the category combined total. Rather than fetching and sorting them on each
+request, they read a row holding the sorted scores and their quartiles,
+which is rebuilt for the cohorts whose results change, in the same
+transaction as the change (import, competition delete or season edit).
+"""
+
+from __future__ import annotations
+
+import heapq
+import statistics
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from typing import Optional
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.category_result import CategoryResult
+from app.models.competition import Competition
+from app.models.score import Score
+from app.models.score_distribution import ScoreDistribution
+
+# Segment key of the category combined totals
+COMBINED = "combined"
+
+# (season, skating_level, age_group, gender)
+Cohort = tuple[Optional[str], Optional[str], Optional[str], Optional[str]]
+
+
+def _eq(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def quartiles(values: list[float]) -> dict:
+    """Min, max, median and quartiles of ``values``, sorted ascending."""
+    n = len(values)
+    if not n:
+        return {"data_points": 0, "min": None, "max": None, "median": None, "p25": None, "p75": None}
+    quarters = statistics.quantiles(values, n=4) if n >= 2 else None
+    return {
+        "data_points": n,
+        "min": values[0],
+        "max": values[-1],
+        "median": round(statistics.median(values), 2),
+        "p25": round(quarters[0], 2) if quarters else values[0],
+        "p75": round(quarters[2], 2) if quarters else values[-1],
+    }
+
+
+def percentile_rank(values: list[float], score: float) -> Optional[float]:
+    """Share of ``values`` below ``score``, counting ties as half, in percent."""
+    if not values:
+        return None
+    below = bisect_left(values, score)
+    ties = bisect_right(values, score) - below
+    return round((below + ties / 2) / len(values) * 100, 1)
+
+
+def histogram(values: list[float], bins: int) -> list[dict]:
+    """Counts of ``values`` in ``bins`` equal-width bins from min to max."""
+    if not values:
+        return []
+    low, high = values[0], values[-1]
+    if low == high:
+        return [{"lower": low, "upper": high, "count": len(values)}]
+    width = (high - low) / bins
+    result = []
+    for i in range(bins):
+        lower = low + i * width
+        upper = high if i == bins - 1 else low + (i + 1) * width
+        # Each bin holds [lower, upper), the last one also its upper bound
+        end = bisect_right(values, upper) if i == bins - 1 else bisect_left(values, upper)
+        result.append({"lower": round(lower, 2), "upper": round(upper, 2),
+                       "count": end - bisect_left(values, lower)})
+    return result
+
+
+def _cohorts(model):
+    return (
+        select(Competition.season, model.skating_level, model.age_group, model.gender)
+        .join(Competition, model.competition_id == Competition.id)
+    )
+
+
+async def competition_cohorts(session: AsyncSession, competition_id: int) -> set[Cohort]:
+    """Cohorts with a score or category result in the competition."""
+    rows = await session.execute(
+        _cohorts(Score).where(Score.competition_id == competition_id)
+        .union(_cohorts(CategoryResult).where(CategoryResult.competition_id == competition_id))
+    )
+    return {tuple(row) for row in rows.all()}
+
+
+async def all_cohorts(session: AsyncSession) -> list[Cohort]:
+    rows = await session.execute(_cohorts(Score).union(_cohorts(CategoryResult)))
+    return [tuple(row) for row in rows.all()]
+
+
+async def refresh_distributions(session: AsyncSession, cohorts: Iterable[Cohort]) -> int:
+    """Rebuild the distribution rows of ``cohorts`` from their results.
+
+    Pending changes are flushed first. Returns the number of rows written.
+    """
+    written = 0
+    for cohort in set(cohorts):
+        season, level, age_group, gender = cohort
+        rows = await _build_rows(session, cohort)
+        await session.execute(
+            delete(ScoreDistribution).where(
+                _eq(ScoreDistribution.season, season),
+                _eq(ScoreDistribution.skating_level, level),
+                _eq(ScoreDistribution.age_group, age_group),
+                _eq(ScoreDistribution.gender, gender),
+            )
+        )
+        if rows:
+            await session.execute(insert(ScoreDistribution), rows)
+        written += len(rows)
+    return written
+
+
+async def _build_rows(session: AsyncSession, cohort: Cohort) -> list[dict]:
+    season, level, age_group, gender = cohort
+
+    def _filtered(stmt, model):
+        return stmt.join(Competition, model.competition_id == Competition.id).where(
+            _eq(Competition.season, season),
+            _eq(model.skating_level, level),
+            _eq(model.age_group, age_group),
+            _eq(model.gender, gender),
+        )
+
+    by_segment: dict[str, list[float]] = {}
+    combined = (await session.execute(_filtered(
+        select(CategoryResult.combined_total).where(CategoryResult.combined_total.isnot(None)),
+        CategoryResult,
+    ))).scalars().all()
+    if combined:
+        by_segment[COMBINED] = list(combined)
+    segment_rows = (await session.execute(_filtered(
+        select(Score.segment, Score.total_score).where(Score.total_score.isnot(None)),
+        Score,
+    ))).all()
+    for segment, total in segment_rows:
+        by_segment.setdefault(segment, []).append(total)
+
+    rows = []
+    for segment, values in by_segment.items():
+        values.sort()
+        stats = quartiles(values)
+        rows.append({
+            "season": season, "skating_level": level, "age_group": age_group, "gender": gender,
+            "segment": segment, "count": stats["data_points"],
+            "min_value": stats["min"], "max_value": stats["max"],
+            "p25": stats["p25"], "median": stats["median"], "p75": stats["p75"],
+            "sorted_values": values,
+        })
+    return rows
+
+
+async def load_distribution(
+    session: AsyncSession,
+    skating_level: str,
+    age_group: str,
+    gender: str,
+    season: Optional[str] = None,
+    segment: str = COMBINED,
+) -> list[ScoreDistribution]:
+    """Distribution rows of a cohort: one per season, or the season's only row."""
+    stmt = select(ScoreDistribution).where(
+        ScoreDistribution.skating_level == skating_level,
+        ScoreDistribution.age_group == age_group,
+        ScoreDistribution.gender == gender,
+        ScoreDistribution.segment == segment,
+    )
+    if season:
+        stmt = stmt.where(ScoreDistribution.season == season)
+    return list((await session.execute(stmt)).scalars().all())
+
+
+def merged_values(rows: list[ScoreDistribution]) -> list[float]:
+    """Sorted scores of several distribution rows, e.g. every season of a cohort."""
+    if len(rows) == 1:
+        return rows[0].sorted_values
+    return list(heapq.merge(*(row.sorted_values for row in rows)))
@@ -0,0 +1,76 @@
+"""
+Normalized element rows (the score_elements table) derived from Score.elements.
+
+run_enrich stores the PDF element list on the score as JSON and mirrors it
+here, one row per element, classified once at write time so element
+analytics can filter and aggregate in SQL.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.score import Score
+from app.models.score_element import ScoreElement
+from app.services.element_classifier import classify_element, extract_jump_type, extract_level
+
+# Bit per ISU marker in ScoreElement.markers_mask
+MARKER_BITS = {"<": 1, "<<": 2, "q": 4, "e": 8, "!": 16, "*": 32, "x": 64, "b": 128, "F": 256}
+
+
+def markers_mask(markers: list[str] | None) -> int:
+    """Bitmask of the markers in ``markers``; the "+" combo placeholder is ignored."""
+    mask = 0
+    for marker in markers or []:
+        mask |= MARKER_BITS.get(marker, 0)
+    return mask
+
+
+def _base_code(code: str, element_type: str | None, jump_type: str | None) -> str:
+    if element_type == "jump" and jump_type:
+        return jump_type
+    if element_type in ("spin", "step"):
+        return code.rstrip("0123456789B")
+    return code
+
+
+def element_rows(elements: list | dict | None) -> list[dict]:
+    """Column values for the score_elements rows of one score's element list."""
+    if isinstance(elements, dict):
+        elements = elements.get("elements", [])
+    rows = []
+    for position, element in enumerate(elements or [], start=1):
+        code = element.get("name") or ""
+        if not code:
+            continue
+        element_type = classify_element(code)
+        jump_type = extract_jump_type(code) if element_type == "jump" else None
+        score = element.get("score")
+        rows.append({
+            "position": position,
+            "code": code,
+            "element_type": element_type,
+            "base_code": _base_code(code, element_type, jump_type),
+            "jump_type": jump_type,
+            "level": extract_level(code),
+            "markers_mask": markers_mask(element.get("markers")),
+            "markers": element.get("markers") or [],
+            "base_value": element.get("base_value"),
+            "goe": element.get("goe"),
+            "judge_goe": element.get("judge_goe") or element.get("judges"),
+            "score": score if score is not None else element.get("total"),
+        })
+    return rows
+
+
+async def replace_score_elements(session: AsyncSession, score: Score) -> int:
+    """Rewrite the score_elements rows of ``score`` from ``score.elements``.
+
+    ``score`` must have an id (flushed). Returns the number of rows written.
+    """
+    await session.execute(delete(ScoreElement).where(ScoreElement.score_id == score.id))
+    rows = element_rows(score.elements)
+    if rows:
+        await session.execute(insert(ScoreElement), [{"score_id": score.id, **row} for row in rows])
+    return len(rows)
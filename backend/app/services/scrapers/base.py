@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Collection
 
 from app.services.site_scraper import ScrapedCategory, ScrapedCompetitionInfo, ScrapedEvent, ScrapedResult, ScrapedCategoryResult
 
@@ -14,4 +15,10 @@ class BaseScraper(ABC):
     def parse_seg_page(self, html: str, category: str, segment: str) -> list[ScrapedResult]: ...
 
     @abstractmethod
-    async def scrape(self, url: str) -> tuple[list[ScrapedEvent], list[ScrapedResult], list[ScrapedCategoryResult], ScrapedCompetitionInfo, str]: ...
+    async def scrape(
+        self,
+        url: str,
+        *,
+        skip_seg_urls: Collection[str] = (),
+        index_only: bool = False,
+    ) -> tuple[list[ScrapedEvent], list[ScrapedResult], list[ScrapedCategoryResult], ScrapedCompetitionInfo, str]: ...
@@ -1,15 +1,31 @@
+from typing import Collection
+
 from app.services.scrapers.base import BaseScraper
-from app.services.site_scraper import ScrapedEvent, ScrapedResult
+from app.services.site_scraper import (
+    ScrapedCategoryResult,
+    ScrapedCompetitionInfo,
+    ScrapedEvent,
+    ScrapedResult,
+)
 
 
 class SwissTimingScraper(BaseScraper):
     """Stub — not yet implemented."""
 
+    def parse_competition_info(self, html: str) -> ScrapedCompetitionInfo:
+        raise NotImplementedError
+
     def parse_index(self, html: str, base_url: str) -> list[ScrapedEvent]:
         raise NotImplementedError("Swiss Timing scraper not yet implemented")
 
     def parse_seg_page(self, html: str, category: str, segment: str) -> list[ScrapedResult]:
         raise NotImplementedError
 
-    async def scrape(self, url: str) -> tuple[list[ScrapedEvent], list[ScrapedResult]]:
+    async def scrape(
+        self,
+        url: str,
+        *,
+        skip_seg_urls: Collection[str] = (),
+        index_only: bool = False,
+    ) -> tuple[list[ScrapedEvent], list[ScrapedResult], list[ScrapedCategoryResult], ScrapedCompetitionInfo, str]:
         raise NotImplementedError
@@ -0,0 +1,224 @@
+"""
+Per-skater season summaries (the skater_season_summaries table).
+
+The dashboard, progression ranking, club report and skater analytics all
+need the same per-skater figures: first and last combined total, best
+scores, podiums and competitions entered. Rather than rescanning every
+result of the season on each request, they read these rows, which are
+rebuilt for the skaters whose results change, in the same transaction as
+the change (import, merge, competition delete or season edit).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.category_result import CategoryResult
+from app.models.competition import Competition
+from app.models.score import Score
+from app.models.skater_season_summary import SkaterSeasonSummary
+
+# Skater ids per IN (...) list; stays under SQLite's historical 999 limit.
+_SKATER_CHUNK = 500
+
+
+def date_order(value: date | str | None) -> tuple[bool, date | str]:
+    """Sort key placing undated results first, as SQLite orders NULL dates."""
+    return (value is not None, value or "")
+
+
+async def refresh_season_summaries(session: AsyncSession, skater_ids: Iterable[int]) -> int:
+    """Rebuild every summary row of ``skater_ids`` from their results.
+
+    Pending changes are flushed first. Skaters left without results lose
+    their rows. Returns the number of rows written.
+    """
+    ids = sorted(set(skater_ids))
+    written = 0
+    for start in range(0, len(ids), _SKATER_CHUNK):
+        chunk = ids[start:start + _SKATER_CHUNK]
+        rows = await _build_rows(session, chunk)
+        await session.execute(
+            delete(SkaterSeasonSummary).where(SkaterSeasonSummary.skater_id.in_(chunk))
+        )
+        if rows:
+            await session.execute(insert(SkaterSeasonSummary), rows)
+        written += len(rows)
+    return written
+
+
+async def competition_skater_ids(session: AsyncSession, competition_id: int) -> set[int]:
+    """Skaters with a score or category result in the competition."""
+    ids = await session.execute(
+        select(Score.skater_id).where(Score.competition_id == competition_id)
+        .union(select(CategoryResult.skater_id).where(CategoryResult.competition_id == competition_id))
+    )
+    return set(ids.scalars().all())
+
+
+def _new_track(key: tuple) -> dict:
+    skater_id, season, level, age_group, gender, club_key = key
+    return {
+        "skater_id": skater_id, "season": season, "skating_level": level,
+        "age_group": age_group, "gender": gender, "club_key": club_key,
+        "category": None, "category_date": None, "competitions": set(),
+        "competitions_entered": 0, "programs": 0, "podiums": 0, "results_count": 0,
+        "first_tss": None, "first_date": None, "last_tss": None, "last_date": None,
+        "best_total": None, "best_tss": None, "best_tes": None, "best_pcs": None,
+        "segment_bests": {}, "progression": [],
+    }
+
+
+def _max(current: float | None, value: float | None) -> float | None:
+    if value is None:
+        return current
+    return value if current is None or value > current else current
+
+
+async def _build_rows(session: AsyncSession, skater_ids: list[int]) -> list[dict]:
+    score_rows = (await session.execute(
+        select(
+            Score.skater_id, Competition.season, Score.skating_level, Score.age_group,
+            Score.gender, Score.club_key, Score.category, Score.competition_id, Score.segment,
+            Score.total_score, Score.technical_score, Score.component_score,
+            Competition.name, Competition.date,
+        )
+        .join(Competition, Score.competition_id == Competition.id)
+        .where(Score.skater_id.in_(skater_ids))
+        .order_by(Score.id)
+    )).all()
+    result_rows = (await session.execute(
+        select(
+            CategoryResult.skater_id, Competition.season, CategoryResult.skating_level,
+            CategoryResult.age_group, CategoryResult.gender, CategoryResult.club_key,
+            CategoryResult.category, CategoryResult.competition_id,
+            CategoryResult.combined_total, CategoryResult.overall_rank, Competition.date,
+        )
+        .join(Competition, CategoryResult.competition_id == Competition.id)
+        .where(CategoryResult.skater_id.in_(skater_ids))
+        .order_by(CategoryResult.id)
+    )).all()
+
+    tracks: dict[tuple, dict] = {}
+
+    def _track(row) -> dict:
+        key = tuple(row[:6])
+        if key not in tracks:
+            tracks[key] = _new_track(key)
+        return tracks[key]
+
+    def _see_category(track: dict, category: str | None, when: date | None) -> None:
+        if track["category_date"] is None or date_order(when) >= date_order(track["category_date"]):
+            track["category"], track["category_date"] = category, when
+
+    # Segment scores with a category result are already counted in its total
+    with_result = {(r.skater_id, r.competition_id, r.category) for r in result_rows}
+
+    for r in sorted(result_rows, key=lambda r: date_order(r.date)):
+        track = _track(r)
+        track["competitions"].add(r.competition_id)
+        _see_category(track, r.category, r.date)
+        if r.overall_rank and r.overall_rank <= 3:
+            track["podiums"] += 1
+        if r.combined_total is None:
+            continue
+        track["results_count"] += 1
+        track["best_total"] = _max(track["best_total"], r.combined_total)
+        track["progression"].append({
+            "date": r.date.isoformat() if r.date else None,
+            "value": r.combined_total,
+        })
+        if track["results_count"] == 1:
+            track["first_tss"], track["first_date"] = r.combined_total, r.date
+        track["last_tss"], track["last_date"] = r.combined_total, r.date
+
+    for r in sorted(score_rows, key=lambda r: date_order(r.date)):
+        track = _track(r)
+        track["competitions"].add(r.competition_id)
+        track["programs"] += 1
+        _see_category(track, r.category, r.date)
+        if (r.skater_id, r.competition_id, r.category) not in with_result:
+            track["best_total"] = _max(track["best_total"], r.total_score)
+        track["best_tss"] = _max(track["best_tss"], r.total_score)
+        track["best_tes"] = _max(track["best_tes"], r.technical_score)
+        track["best_pcs"] = _max(track["best_pcs"], r.component_score)
+        best = track["segment_bests"].get(r.segment)
+        if best is None or (r.total_score or 0) > (best["tss"] or 0):
+            track["segment_bests"][r.segment] = {
+                "tss": r.total_score,
+                "tes": r.technical_score,
+                "pcs": r.component_score,
+                "competition": r.name,
+                "date": r.date.isoformat() if r.date else None,
+            }
+
+    rows = []
+    for track in tracks.values():
+        track["competitions_entered"] = len(track.pop("competitions"))
+        del track["category_date"]
+        rows.append(track)
+    return rows
+
+
+# Columns read by combine_summaries: readers select these rather than whole
+# SkaterSeasonSummary entities, which the ORM would track for no use. Add
+# SkaterSeasonSummary.progression when the sparkline points are needed.
+COMBINED_COLUMNS = (
+    SkaterSeasonSummary.skater_id,
+    SkaterSeasonSummary.skating_level,
+    SkaterSeasonSummary.age_group,
+    SkaterSeasonSummary.gender,
+    SkaterSeasonSummary.category,
+    SkaterSeasonSummary.competitions_entered,
+    SkaterSeasonSummary.programs,
+    SkaterSeasonSummary.podiums,
+    SkaterSeasonSummary.results_count,
+    SkaterSeasonSummary.first_tss,
+    SkaterSeasonSummary.first_date,
+    SkaterSeasonSummary.last_tss,
+    SkaterSeasonSummary.last_date,
+    SkaterSeasonSummary.best_total,
+    SkaterSeasonSummary.best_tss,
+    SkaterSeasonSummary.best_tes,
+    SkaterSeasonSummary.best_pcs,
+)
+
+
+def combine_summaries(rows: Iterable[SkaterSeasonSummary]) -> dict:
+    """Fold several summary rows of one skater (seasons, tracks) into one.
+
+    ``rows`` are entities or rows of ``COMBINED_COLUMNS``, with or without
+    the progression column.
+    """
+    combined = {
+        "competitions_entered": 0, "programs": 0, "podiums": 0, "results_count": 0,
+        "first_tss": None, "first_date": None, "last_tss": None, "last_date": None,
+        "best_total": None, "best_tss": None, "best_tes": None, "best_pcs": None,
+        "category": None, "gender": None, "progression": [],
+    }
+    first = last = latest = None
+    for row in rows:
+        if latest is None or date_order(row.last_date) >= date_order(latest.last_date):
+            latest = row
+        for field in ("competitions_entered", "programs", "podiums", "results_count"):
+            combined[field] += getattr(row, field)
+        for field in ("best_total", "best_tss", "best_tes", "best_pcs"):
+            combined[field] = _max(combined[field], getattr(row, field))
+        combined["progression"].extend(getattr(row, "progression", None) or [])
+        if not row.results_count:
+            continue
+        if first is None or date_order(row.first_date) < date_order(first.first_date):
+            first = row
+        if last is None or date_order(row.last_date) >= date_order(last.last_date):
+            last = row
+    if latest is not None:
+        combined.update(category=latest.category, gender=latest.gender)
+    if first is not None:
+        combined.update(first_tss=first.first_tss, first_date=first.first_date, gender=first.gender)
+        combined.update(last_tss=last.last_tss, last_date=last.last_date)
+    combined["progression"].sort(key=lambda point: date_order(point["date"]))
+    return combined
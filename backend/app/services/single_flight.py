@@ -0,0 +1,84 @@
+"""
+Request coalescing for the analytical endpoints.
+
+Right after a competition, the club opens the dashboard, stats and team
+scores at once, and each identical request would run the same season-wide
+queries. SingleFlight lets the first request (the leader) compute while the
+identical requests that arrive meanwhile await its result instead of
+running their own copy. Nothing is kept once the leader finishes: caching
+is the response cache's job (services/response_cache.py), which calls this
+on its misses.
+
+Keys must include everything the result depends on, including the data
+version, so a request never joins a computation that started before a
+write it has already seen committed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class _LeaderAbandoned(Exception):
+    """The leader was cancelled (client gone); a waiter takes over."""
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+        self._waiting: Counter[tuple] = Counter()
+        self.computations = 0
+        self.coalesced = 0
+        self.peak_waiters = 0
+        self._coalesced_by_route: Counter[str] = Counter()
+
+    async def run(self, route: str, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Return ``compute()``, sharing one call among concurrent callers of ``(route, key)``.
+
+        An exception raised by the leader is raised in its waiters too.
+        """
+        flight_key = (route, key)
+        while flight_key in self._in_flight:
+            self.coalesced += 1
+            self._coalesced_by_route[route] += 1
+            self._waiting[flight_key] += 1
+            self.peak_waiters = max(self.peak_waiters, self._waiting[flight_key])
+            try:
+                return await asyncio.shield(self._in_flight[flight_key])
+            except _LeaderAbandoned:
+                continue
+            finally:
+                self._waiting[flight_key] -= 1
+                if not self._waiting[flight_key]:
+                    del self._waiting[flight_key]
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[flight_key] = future
+        self.computations += 1
+        try:
+            value = await compute()
+        except BaseException as exc:
+            future.set_exception(
+                _LeaderAbandoned() if isinstance(exc, asyncio.CancelledError) else exc
+            )
+            # Mark it retrieved: without waiters nobody else awaits the future
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[flight_key]
+        future.set_result(value)
+        return value
+
+    def stats(self) -> dict:
+        return {
+            "computations": self.computations,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+            "peak_waiters": self.peak_waiters,
+            "coalesced_by_route": dict(self._coalesced_by_route),
+        }
+
+
+single_flight = SingleFlight()
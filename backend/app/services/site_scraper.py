@@ -4,16 +4,19 @@ Site scraper for FS Manager (Swiss Timing) competition result websites.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
 import unicodedata
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Collection
 from urllib.parse import urljoin
 
 import httpx
 from bs4 import BeautifulSoup, Tag
 
+from app.services import job_metrics
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,6 +32,11 @@ class ScrapedEvent:
     seg_url: str | None = None   # URL to SEG detail page
     pdf_url: str | None = None   # URL to judges scores PDF
     event_date: str | None = None  # ISO format YYYY-MM-DD (from Time Schedule)
+    # Set by scrape() when the SEG page was fetched: whether every starter is
+    # ranked and the protocol PDF is linked, and a digest of the parsed results.
+    fetched: bool = False
+    finished: bool = False
+    fingerprint: str | None = None
 
 @dataclass
 class ScrapedCategory:
@@ -525,9 +533,19 @@ class FSManagerScraper:
             segment_count=segment_count,
         )
 
-    async def scrape(self, url: str) -> tuple[list[ScrapedEvent], list[ScrapedResult], list[ScrapedCategoryResult], ScrapedCompetitionInfo, str]:
+    async def scrape(
+        self,
+        url: str,
+        *,
+        skip_seg_urls: Collection[str] = (),
+        index_only: bool = False,
+    ) -> tuple[list[ScrapedEvent], list[ScrapedResult], list[ScrapedCategoryResult], ScrapedCompetitionInfo, str]:
         """Full scrape: fetch index, discover events, fetch all SEG and CAT pages.
 
+        SEG pages listed in ``skip_seg_urls`` (segments known to be finished)
+        are not fetched, nor are the CAT pages of categories whose segments are
+        all skipped. ``index_only`` fetches just the index page.
+
         Returns:
             A tuple of (events, segment_results, category_results, competition_info, index_html).
         """
@@ -535,23 +553,42 @@ class FSManagerScraper:
             timeout=30.0,
             headers={"User-Agent": "Mozilla/5.0 (compatible; skating-analyzer/1.0)"},
         ) as client:
-            index_html = await _fetch(url, client)
+            with job_metrics.phase("fetch", items=1):
+                index_html = await _fetch(url, client)
             if not index_html:
                 return [], [], [], ScrapedCompetitionInfo(), ""
 
-            comp_info = self.parse_competition_info(index_html)
-            events, categories = self.parse_index(index_html, url)
+            with job_metrics.phase("parse", items=1):
+                comp_info = self.parse_competition_info(index_html)
+                events, categories = self.parse_index(index_html, url)
+            if index_only:
+                return events, [], [], comp_info, index_html
+
             all_results: list[ScrapedResult] = []
             all_cat_results: list[ScrapedCategoryResult] = []
 
-            for event in events:
-                if not event.seg_url:
-                    continue
-                seg_html = await _fetch(event.seg_url, client)
+            skip = set(skip_seg_urls)
+            seg_events = [e for e in events if e.seg_url and e.seg_url not in skip]
+            live_categories = {e.category for e in seg_events}
+            skipped_categories = {e.category for e in events if e.seg_url in skip} - live_categories
+            cat_pages = [c for c in categories if c.cat_url and c.category not in skipped_categories]
+            pages_total = 1 + len(seg_events) + len(cat_pages)
+            pages_done = 1
+            await job_metrics.progress("fetch", pages_done, pages_total)
+
+            for event in seg_events:
+                with job_metrics.phase("fetch", items=1):
+                    seg_html = await _fetch(event.seg_url, client)
+                pages_done += 1
+                await job_metrics.progress("fetch", pages_done, pages_total)
                 if not seg_html:
                     logger.warning("Failed to fetch %s", event.seg_url)
                     continue
-                results = self.parse_seg_page(seg_html, event.category, event.segment)
+                with job_metrics.phase("parse", items=1):
+                    results = self.parse_seg_page(seg_html, event.category, event.segment)
+                event.fetched = True
+                event.finished = bool(results) and bool(event.pdf_url) and all(r.rank is not None for r in results)
+                event.fingerprint = _results_fingerprint(results)
                 # Propagate event_date from the index page to each result
                 if event.event_date:
                     for r in results:
@@ -559,15 +596,17 @@ class FSManagerScraper:
                             r.event_date = event.event_date
                 all_results.extend(results)
 
-            for cat in categories:
-                if not cat.cat_url:
-                    continue
-                cat_html = await _fetch(cat.cat_url, client)
+            for cat in cat_pages:
+                with job_metrics.phase("fetch", items=1):
+                    cat_html = await _fetch(cat.cat_url, client)
+                pages_done += 1
+                await job_metrics.progress("fetch", pages_done, pages_total)
                 if not cat_html:
                     logger.warning("Failed to fetch %s", cat.cat_url)
                     continue
                 segment_count = len(cat.segments) if cat.segments else 1
-                cat_results = self.parse_cat_page(cat_html, cat.category, segment_count)
+                with job_metrics.phase("parse", items=1):
+                    cat_results = self.parse_cat_page(cat_html, cat.category, segment_count)
                 all_cat_results.extend(cat_results)
 
             return events, all_results, all_cat_results, comp_info, index_html
@@ -584,6 +623,15 @@ def normalize_name(name: str) -> str:
     return " ".join(name.split())
 
 
+def _results_fingerprint(results: list[ScrapedResult]) -> str:
+    """Digest of the scores on a SEG page, to tell whether it changed between polls."""
+    rows = sorted(
+        f"{r.name}|{r.rank}|{r.total_score}|{r.technical_score}|{r.component_score}|{r.deductions}"
+        for r in results
+    )
+    return hashlib.sha1("\n".join(rows).encode()).hexdigest()
+
+
 def _strip_accents(text: str) -> str:
     return "".join(
         c for c in unicodedata.normalize("NFD", text)
@@ -22,7 +22,7 @@ from collections import defaultdict
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 
 from app.models.competition import Competition
 from app.models.score import Score
@@ -439,7 +439,10 @@ async def get_team_scores(session: AsyncSession, competition_id: int) -> dict |
 
     Returns None if competition is not france_clubs type.
     """
-    comp = await session.get(Competition, competition_id)
+    comp = await session.get(
+        Competition, competition_id,
+        options=[undefer(Competition.team_medians)], populate_existing=True,
+    )
     if not comp or comp.competition_type != "france_clubs":
         return None
 
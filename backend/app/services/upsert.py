@@ -0,0 +1,56 @@
+"""
+Dialect-aware INSERT ... ON CONFLICT.
+
+Several workers may write the same natural key at once (two imports creating
+the same skater, two bulk imports of one URL). Instead of a SELECT followed
+by an INSERT, these writes use the database's own conflict handling, which
+SQLite and PostgreSQL spell the same way but SQLAlchemy exposes per dialect.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.sql.dml import Insert
+
+_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def dialect_insert(bind: AsyncSession | AsyncConnection, model) -> Insert:
+    """INSERT for ``model`` supporting ``on_conflict_do_*`` on ``bind``'s dialect."""
+    dialect = bind.dialect if isinstance(bind, AsyncConnection) else bind.get_bind().dialect
+    try:
+        insert = _INSERTS[dialect.name]
+    except KeyError:
+        raise NotImplementedError(f"No upsert support for {dialect.name}") from None
+    return insert(model)
+
+
+async def insert_ignore(
+    bind: AsyncSession | AsyncConnection,
+    model,
+    rows: dict | list[dict],
+    conflict: list[str],
+) -> None:
+    """Insert ``rows``, skipping any that collide on the ``conflict`` columns."""
+    stmt = dialect_insert(bind, model).on_conflict_do_nothing(index_elements=conflict)
+    await bind.execute(stmt, rows)
+
+
+async def upsert(
+    bind: AsyncSession | AsyncConnection,
+    model,
+    values: dict,
+    conflict: list[str],
+    update: list[str],
+):
+    """Insert ``values``, or update the ``update`` columns of the row it collides with.
+
+    Returns the id of the inserted or updated row.
+    """
+    stmt = dialect_insert(bind, model).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=conflict,
+        set_={column: stmt.excluded[column] for column in update},
+    ).returning(model.id)
+    return (await bind.execute(stmt)).scalar_one()
@@ -0,0 +1,173 @@
+"""
+Benchmark: dashboard latency while an import is writing to the database.
+
+Seeds a throwaway SQLite database, then requests GET /api/dashboard/ in a loop
+while a background thread keeps rewriting import-sized batches of scores.
+It runs once with the SQLite pragma profile (WAL, busy_timeout, ...) and
+once with SQLite defaults, and prints both latency distributions.
+
+Usage: python scripts/bench_dashboard_during_import.py [--requests 200] [--competitions 40]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+ELEMENTS = [
+    {"name": name, "base_value": 3.3, "goe": 0.5, "judges": [1, 0, 1, 1, 0], "score": 3.8, "info": ""}
+    for name in ("3T", "2A", "3S+2T", "FCSp4", "StSq3", "3Lo", "2A+2T", "LSp4", "ChSq1", "3F", "CCoSp4")
+]
+
+
+async def _seed(competitions: int, skaters: int) -> None:
+    import app.models  # noqa: F401
+    from app.database import Base, engine
+    from app.models.competition import Competition
+    from app.models.score import Score
+    from app.models.skater import Skater
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(Skater.__table__.insert(), [
+            {"first_name": f"Skater{i}", "last_name": f"BENCH{i}", "club": f"Club {i % 20}"}
+            for i in range(skaters)
+        ])
+        await conn.execute(Competition.__table__.insert(), [
+            {"name": f"Competition {c}", "url": f"http://bench/{c}", "season": "2025-2026"}
+            for c in range(competitions)
+        ])
+        await conn.execute(Score.__table__.insert(), [
+            {
+                "competition_id": c + 1,
+                "skater_id": s + 1,
+                "segment": "FS",
+                "category": f"R{s % 3 + 1} Novice Femme",
+                "rank": s % 30 + 1,
+                "total_score": 40.0 + (s * 7 + c) % 50,
+                "technical_score": 20.0 + (s + c) % 25,
+                "component_score": 20.0 + (s * 3 + c) % 25,
+                "club": f"Club {s % 20}",
+                # Enriched scores carry their element details (~1 KB)
+                "elements": ELEMENTS,
+            }
+            for c in range(competitions)
+            for s in range(c % 5, skaters, 5)
+        ])
+
+
+def _import_writer(db_path: str, stop: threading.Event, batch: int, hold: float) -> int:
+    """Rewrite batches of scores, like a reimport running in another worker.
+
+    Rows are updated rather than inserted so the dashboard reads the same
+    amount of data throughout the run. Uses a plain sqlite3 connection in a
+    thread so the writer doesn't share the event loop with the timed requests.
+    """
+    conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    total = conn.execute("SELECT max(id) FROM scores").fetchone()[0]
+    batches = 0
+    while not stop.is_set():
+        first = (batches * batch) % total
+        conn.execute("BEGIN")
+        conn.execute(
+            "UPDATE scores SET total_score = total_score + 0.01, rank = rank WHERE id > ? AND id <= ?",
+            (first, first + batch),
+        )
+        # An import keeps its transaction open while it matches skaters.
+        time.sleep(hold)
+        conn.execute("COMMIT")
+        batches += 1
+    conn.close()
+    return batches
+
+
+async def _run_child(args) -> dict:
+    from httpx import ASGITransport, AsyncClient
+
+    from app.auth.tokens import create_access_token
+    from app.main import app
+
+    await _seed(args.competitions, args.skaters)
+    headers = {"Authorization": f"Bearer {create_access_token(user_id='bench', role='admin')}"}
+    latencies: list[float] = []
+    errors = 0
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        await client.get("/api/dashboard/", headers=headers)  # warm-up
+        stop = threading.Event()
+        db_path = os.environ["DATABASE_URL"].split("///", 1)[1]
+        writer = asyncio.get_running_loop().run_in_executor(
+            None, _import_writer, db_path, stop, args.batch, args.hold
+        )
+        for _ in range(args.requests):
+            start = time.perf_counter()
+            resp = await client.get("/api/dashboard/", headers=headers)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if resp.status_code != 200:
+                errors += 1
+        stop.set()
+        batches = await writer
+
+    latencies.sort()
+    return {
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "max": latencies[-1],
+        "errors": errors,
+        "import_batches": batches,
+    }
+
+
+def _spawn(args, pragmas: bool) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}",
+            "SQLITE_PRAGMAS": "1" if pragmas else "0",
+            "CLUB_SHORT": "",
+        }
+        cmd = [sys.executable, __file__, "--child", *sys.argv[1:]]
+        out = subprocess.run(cmd, env=env, cwd=BACKEND_DIR, capture_output=True, text=True)
+        if out.returncode != 0:
+            sys.exit(out.stderr)
+        return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--competitions", type=int, default=40)
+    parser.add_argument("--skaters", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=5000, help="scores rewritten per import commit")
+    parser.add_argument("--hold", type=float, default=0.2, help="seconds each import transaction stays open")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        sys.path.insert(0, str(BACKEND_DIR))
+        print(json.dumps(asyncio.run(_run_child(args))))
+        return
+
+    print(f"{'profile':<16}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}{'errors':>8}{'imports':>9}")
+    for label, pragmas in (("sqlite defaults", False), ("pragma profile", True)):
+        r = _spawn(args, pragmas)
+        print(
+            f"{label:<16}{r['p50']:>10.1f}{r['p95']:>10.1f}{r['max']:>10.1f}"
+            f"{r['errors']:>8}{r['import_batches']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Benchmark: dashboard query plan on a synthetic five-season database.
+
+Seeds a throwaway SQLite database with five seasons of competitions, scores
+and category results, then times the dashboard computation for the latest
+season and for all seasons. It compares two versions:
+
+- the previous version: three COUNT DISTINCT queries, then medals and top
+  scores loaded as ORM rows with selectinload;
+- the current version: one aggregate over a club-scores CTE, plus one
+  windowed query for medals and top scores.
+
+The response cache is bypassed, so both columns measure a cache miss.
+
+Usage: python scripts/bench_dashboard_queries.py [--seasons 5] [--skaters 1500] [--runs 30]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+async def _seed(seasons: int, competitions: int, skaters: int) -> list[str]:
+    import app.models  # noqa: F401
+    from app.database import Base, engine
+    from app.models.category_result import CategoryResult
+    from app.models.competition import Competition
+    from app.models.score import Score
+    from app.models.skater import Skater
+    from app.services.club_key import club_key
+
+    season_names = [f"{2021 + s}-{2022 + s}" for s in range(seasons)]
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(Skater.__table__.insert(), [
+            {"first_name": f"Skater{i}", "last_name": f"BENCH{i}",
+             "club": f"Club {i % 20}", "club_key": club_key(f"Club {i % 20}")}
+            for i in range(skaters)
+        ])
+        comps = []
+        for s, season in enumerate(season_names):
+            for c in range(competitions):
+                comps.append({
+                    "name": f"Competition {season} {c}", "url": f"http://bench/{s}/{c}",
+                    "season": season, "date": date(2021 + s, 10 + c % 3, 1 + c % 28),
+                })
+        await conn.execute(Competition.__table__.insert(), comps)
+
+        scores, results = [], []
+        for comp_id in range(1, len(comps) + 1):
+            for sk in range(comp_id % 4, skaters, 4):
+                club = f"Club {sk % 20}"
+                common = {
+                    "competition_id": comp_id, "skater_id": sk + 1,
+                    "category": f"R{sk % 3 + 1} Novice Femme", "club": club, "club_key": club_key(club),
+                    "skating_level": f"R{sk % 3 + 1}", "age_group": "Novice", "gender": "Femme",
+                }
+                for segment in ("SP", "FS"):
+                    scores.append({**common, "segment": segment, "rank": sk % 30 + 1,
+                                   "total_score": 30.0 + (sk * 7 + comp_id) % 40})
+                results.append({**common, "overall_rank": sk % 30 + 1, "segment_count": 2,
+                                "combined_total": 60.0 + (sk * 7 + comp_id) % 80})
+        for start in range(0, len(scores), 5000):
+            await conn.execute(Score.__table__.insert(), scores[start:start + 5000])
+        for start in range(0, len(results), 5000):
+            await conn.execute(CategoryResult.__table__.insert(), results[start:start + 5000])
+    return season_names
+
+
+async def _previous_queries(session, season, club_name):
+    """The dashboard queries as run before the CTE rewrite."""
+    from sqlalchemy import func, select
+    from sqlalchemy.orm import selectinload
+
+    from app.models.category_result import CategoryResult
+    from app.models.competition import Competition
+    from app.models.score import Score
+    from app.models.skater import Skater
+    from app.services.club_key import club_filter
+    from app.models.skater_season_summary import SkaterSeasonSummary
+
+    def _scores(column):
+        stmt = select(column).join(Score.skater).join(Score.competition)
+        stmt = stmt.where(club_filter(club_name, Score.club_key, Skater.club_key))
+        return stmt.where(Competition.season == season) if season else stmt
+
+    counts = [
+        (await session.execute(_scores(func.count(func.distinct(Score.skater_id))))).scalar(),
+        (await session.execute(_scores(func.count(func.distinct(Score.competition_id))))).scalar(),
+        (await session.execute(_scores(func.count(Score.id)))).scalar(),
+    ]
+
+    def _results(*where, order, limit=None):
+        stmt = (
+            select(CategoryResult)
+            .options(selectinload(CategoryResult.skater), selectinload(CategoryResult.competition))
+            .join(CategoryResult.skater).join(CategoryResult.competition)
+            .where(*where, club_filter(club_name, CategoryResult.club_key, Skater.club_key))
+            .order_by(order).limit(limit)
+        )
+        return stmt.where(Competition.season == season) if season else stmt
+
+    medals = (await session.execute(
+        _results(CategoryResult.overall_rank <= 3, order=CategoryResult.overall_rank)
+    )).scalars().all()
+    top = (await session.execute(
+        _results(CategoryResult.combined_total.isnot(None),
+                 order=CategoryResult.combined_total.desc(), limit=5)
+    )).scalars().all()
+
+    # Unchanged by the rewrite, run the same way by both versions
+    summaries = select(SkaterSeasonSummary, Skater).join(
+        Skater, SkaterSeasonSummary.skater_id == Skater.id
+    ).where(
+        SkaterSeasonSummary.results_count > 0,
+        club_filter(club_name, SkaterSeasonSummary.club_key, Skater.club_key),
+    )
+    if season:
+        summaries = summaries.where(SkaterSeasonSummary.season == season)
+    await session.execute(summaries)
+    scored = select(Score.competition_id).join(Skater, Score.skater_id == Skater.id).where(
+        club_filter(club_name, Score.club_key, Skater.club_key)
+    )
+    recent = select(Competition).where(Competition.id.in_(scored)).order_by(Competition.date.desc()).limit(3)
+    if season:
+        recent = recent.where(Competition.season == season)
+    await session.execute(recent)
+    return counts, [cr.skater.display_name for cr in medals], [cr.combined_total for cr in top]
+
+
+async def _run(args) -> None:
+    from sqlalchemy import event
+
+    from app.database import async_session_factory, engine
+    from app.routes import dashboard
+
+    season_names = await _seed(args.seasons, args.competitions, args.skaters)
+    statements = 0
+
+    def _count(*_):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _count)
+
+    async def _time(fn) -> tuple[float, float, int]:
+        nonlocal statements
+        latencies = []
+        for _ in range(args.runs):
+            async with async_session_factory() as session:
+                statements = 0
+                start = time.perf_counter()
+                await fn(session)
+                latencies.append((time.perf_counter() - start) * 1000)
+        latencies.sort()
+        return statistics.median(latencies), latencies[int(len(latencies) * 0.95) - 1], statements
+
+    print(f"{args.seasons} seasons, {args.competitions} competitions each, {args.skaters} skaters")
+    print(f"{'season':<12}{'version':<10}{'p50 ms':>10}{'p95 ms':>10}{'queries':>9}")
+    for season in (season_names[-1], None):
+        for label, fn in (
+            ("previous", lambda s: _previous_queries(s, season, dashboard.CLUB_SHORT)),
+            ("current", lambda s: dashboard._dashboard(s, season)),
+        ):
+            p50, p95, queries = await _time(fn)
+            print(f"{season or 'all':<12}{label:<10}{p50:>10.1f}{p95:>10.1f}{queries:>9}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seasons", type=int, default=5)
+    parser.add_argument("--competitions", type=int, default=12, help="competitions per season")
+    parser.add_argument("--skaters", type=int, default=1500)
+    parser.add_argument("--runs", type=int, default=30)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        os.environ["CLUB_SHORT"] = "Club 3"
+        sys.path.insert(0, str(BACKEND_DIR))
+        asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark: /api/stats/element-mastery on a synthetic multi-season database.
+
+Seeds a throwaway SQLite database with several seasons of enriched scores
+(segment scores with their score_elements rows), then times the element
+mastery aggregation for the whole club, each season in turn, bypassing the
+response cache. It also times the same aggregation filtered by level.
+
+Usage: python scripts/bench_element_mastery.py [--seasons 5] [--skaters 3000] [--runs 30]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+PROGRAM = [
+    ("2A", -0.5), ("3T+2T", 0.4), ("3S", 0.0), ("FCSp3", 0.3), ("StSq2", 0.2),
+    ("3Lo", -1.2), ("2Lz+2Lo", 0.1), ("LSp4", 0.6), ("ChSq1", 0.5), ("3F", 0.0), ("CCoSp4", 0.4),
+]
+
+
+async def _seed(seasons: int, competitions: int, skaters: int) -> tuple[list[str], int]:
+    import app.models  # noqa: F401
+    from app.database import Base, engine
+    from app.models.app_settings import AppSettings
+    from app.models.competition import Competition
+    from app.models.score import Score
+    from app.models.score_element import ScoreElement
+    from app.models.skater import Skater
+    from app.services.club_key import club_key
+    from app.services.score_elements import element_rows
+
+    elements = [
+        {"name": code, "base_value": 3.0, "goe": goe, "judges": [1, 0, 1], "score": 3.0 + goe, "info": ""}
+        for code, goe in PROGRAM
+    ]
+    template = element_rows(elements)
+    season_names = [f"{2021 + s}-{2022 + s}" for s in range(seasons)]
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(AppSettings.__table__.insert(), [{
+            "club_name": "Club 3", "club_short": "Club 3", "current_season": season_names[-1],
+        }])
+        await conn.execute(Skater.__table__.insert(), [
+            {"first_name": f"Skater{i}", "last_name": f"BENCH{i}",
+             "club": f"Club {i % 20}", "club_key": club_key(f"Club {i % 20}")}
+            for i in range(skaters)
+        ])
+        await conn.execute(Competition.__table__.insert(), [
+            {"name": f"Competition {season} {c}", "url": f"http://bench/{season}/{c}", "season": season}
+            for season in season_names
+            for c in range(competitions)
+        ])
+        score_id = 0
+        scores, element_batch = [], []
+        for comp_id in range(1, seasons * competitions + 1):
+            for sk in range(comp_id % 4, skaters, 4):
+                score_id += 1
+                club = f"Club {sk % 20}"
+                scores.append({
+                    "id": score_id, "competition_id": comp_id, "skater_id": sk + 1, "segment": "FS",
+                    "category": f"R{sk % 3 + 1} Novice Femme", "club": club, "club_key": club_key(club),
+                    "skating_level": f"R{sk % 3 + 1}", "age_group": "Novice", "gender": "Femme",
+                    "total_score": 50.0,
+                })
+                element_batch.extend({**row, "score_id": score_id} for row in template)
+                if len(element_batch) >= 20000:
+                    await conn.execute(Score.__table__.insert(), scores)
+                    await conn.execute(ScoreElement.__table__.insert(), element_batch)
+                    scores, element_batch = [], []
+        if scores:
+            await conn.execute(Score.__table__.insert(), scores)
+            await conn.execute(ScoreElement.__table__.insert(), element_batch)
+    return season_names, score_id * len(template)
+
+
+async def _run(args) -> None:
+    from app.database import async_session_factory
+    from app.routes import stats
+
+    season_names, element_count = await _seed(args.seasons, args.competitions, args.skaters)
+
+    async def _time(**filters) -> tuple[float, float]:
+        latencies = []
+        for _ in range(args.runs):
+            async with async_session_factory() as session:
+                start = time.perf_counter()
+                await stats._element_mastery(
+                    session, filters.get("season"), None, filters.get("skating_level"), None, None
+                )
+                latencies.append((time.perf_counter() - start) * 1000)
+        latencies.sort()
+        return statistics.median(latencies), latencies[int(len(latencies) * 0.95) - 1]
+
+    print(f"{args.seasons} seasons, {args.competitions} competitions each, "
+          f"{args.skaters} skaters, {element_count} elements")
+    print(f"{'season':<12}{'level':<8}{'p50 ms':>10}{'p95 ms':>10}")
+    for season in season_names:
+        p50, p95 = await _time(season=season)
+        print(f"{season:<12}{'all':<8}{p50:>10.1f}{p95:>10.1f}")
+    p50, p95 = await _time(season=season_names[-1], skating_level="R2")
+    print(f"{season_names[-1]:<12}{'R2':<8}{p50:>10.1f}{p95:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seasons", type=int, default=5)
+    parser.add_argument("--competitions", type=int, default=12, help="competitions per season")
+    parser.add_argument("--skaters", type=int, default=3000)
+    parser.add_argument("--runs", type=int, default=30)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        sys.path.insert(0, str(BACKEND_DIR))
+        asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+Benchmark: memory allocated by the club report and progression ranking.
+
+Seeds a throwaway SQLite database with one season of competitions, scores,
+category results and season summaries, then measures, with tracemalloc,
+the peak memory allocated while building the club report data and the
+progression ranking of one club. It compares two versions:
+
+- the previous version: whole SkaterSeasonSummary, Skater, CategoryResult
+  and Competition entities, the latter two through selectinload;
+- the current version: rows of the selected columns only.
+
+Each version runs a few times before measuring, so SQL compilation caches
+are warm, and the response cache is bypassed. It also prints the median
+latency of each version, timed without tracemalloc.
+
+Usage: python scripts/bench_report_allocations.py [--skaters 1200] [--competitions 12] [--runs 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+SEASON = "2025-2026"
+CLUB = "Club 1"
+
+
+async def _seed(competitions: int, skaters: int) -> None:
+    import app.models  # noqa: F401
+    from app.database import Base, async_session_factory, engine
+    from app.models.app_settings import AppSettings
+    from app.models.category_result import CategoryResult
+    from app.models.competition import Competition
+    from app.models.score import Score
+    from app.models.skater import Skater
+    from app.services.club_key import club_key
+    from app.services.season_summary import refresh_season_summaries
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(AppSettings.__table__.insert(), [{
+            "club_name": CLUB, "club_short": CLUB, "current_season": SEASON,
+        }])
+        # A quarter of the skaters belong to the club
+        await conn.execute(Skater.__table__.insert(), [
+            {"first_name": f"Skater{i}", "last_name": f"BENCH{i}",
+             "club": f"Club {i % 4}", "club_key": club_key(f"Club {i % 4}")}
+            for i in range(skaters)
+        ])
+        await conn.execute(Competition.__table__.insert(), [
+            {"name": f"Competition {c}", "url": f"http://bench/{c}", "season": SEASON,
+             "date": date(2025 + (c + 9) // 12, (c + 9) % 12 + 1, 1 + c % 28)}
+            for c in range(competitions)
+        ])
+        scores, results = [], []
+        for comp_id in range(1, competitions + 1):
+            for sk in range(comp_id % 3, skaters, 3):
+                club = f"Club {sk % 4}"
+                common = {
+                    "competition_id": comp_id, "skater_id": sk + 1,
+                    "category": f"R{sk % 3 + 1} Novice Femme", "club": club, "club_key": club_key(club),
+                    "skating_level": f"R{sk % 3 + 1}", "age_group": "Novice", "gender": "Femme",
+                }
+                for segment in ("SP", "FS"):
+                    scores.append({**common, "segment": segment, "rank": sk % 12 + 1,
+                                   "total_score": 30.0 + (sk * 7 + comp_id) % 40})
+                results.append({**common, "overall_rank": sk % 12 + 1, "segment_count": 2,
+                                "combined_total": 60.0 + (sk * 7 + comp_id) % 80})
+        for start in range(0, len(scores), 5000):
+            await conn.execute(Score.__table__.insert(), scores[start:start + 5000])
+        for start in range(0, len(results), 5000):
+            await conn.execute(CategoryResult.__table__.insert(), results[start:start + 5000])
+
+    async with async_session_factory() as session:
+        await refresh_season_summaries(session, range(1, skaters + 1))
+        await session.commit()
+
+
+async def _previous_report(session):
+    """The club report queries as run before the column projection."""
+    from collections import defaultdict
+
+    from sqlalchemy import func, or_, select
+    from sqlalchemy.orm import selectinload
+
+    from app.models.category_result import CategoryResult
+    from app.models.competition import Competition
+    from app.models.score import Score
+    from app.models.skater import Skater
+    from app.models.skater_season_summary import SkaterSeasonSummary
+    from app.services.club_key import club_filter
+    from app.services.season_summary import combine_summaries
+
+    club_skaters = {s.id: s for s in (await session.execute(select(Skater).where(or_(
+        club_filter(CLUB, Skater.club_key),
+        Skater.id.in_(select(Score.skater_id).where(club_filter(CLUB, Score.club_key))),
+    )))).scalars().all()}
+    ids = list(club_skaters)
+    summary_rows = (await session.execute(select(SkaterSeasonSummary).where(
+        SkaterSeasonSummary.skater_id.in_(ids), SkaterSeasonSummary.season == SEASON,
+    ))).scalars().all()
+    await session.execute(
+        select(func.count(func.distinct(Score.competition_id)))
+        .join(Competition, Score.competition_id == Competition.id)
+        .where(Score.skater_id.in_(ids), Competition.season == SEASON)
+    )
+    cat_results = (await session.execute(
+        select(CategoryResult)
+        .join(Competition, CategoryResult.competition_id == Competition.id)
+        .options(selectinload(CategoryResult.competition), selectinload(CategoryResult.skater))
+        .where(CategoryResult.skater_id.in_(ids), Competition.season == SEASON)
+        .order_by(Competition.date)
+    )).scalars().all()
+    medals = [
+        (cr.skater.display_name, cr.competition.name, cr.competition.date, cr.category, cr.overall_rank)
+        for cr in cat_results if cr.overall_rank and cr.overall_rank <= 3
+    ]
+    by_skater = defaultdict(list)
+    for row in summary_rows:
+        by_skater[row.skater_id].append(row)
+    skaters = {sid: {"name": club_skaters[sid].display_name, **combine_summaries(rows)}
+               for sid, rows in by_skater.items()}
+    return medals, skaters
+
+
+async def _previous_ranking(session):
+    """The progression ranking query as run before the column projection."""
+    from collections import defaultdict
+
+    from sqlalchemy import select
+
+    from app.models.skater import Skater
+    from app.models.skater_season_summary import SkaterSeasonSummary
+    from app.services.club_key import club_filter
+    from app.services.season_summary import combine_summaries
+
+    groups = defaultdict(list)
+    for summary, first_name, last_name in (await session.execute(
+        select(SkaterSeasonSummary, Skater.first_name, Skater.last_name)
+        .join(Skater, SkaterSeasonSummary.skater_id == Skater.id)
+        .where(SkaterSeasonSummary.results_count > 0, SkaterSeasonSummary.season == SEASON,
+               club_filter(CLUB, Skater.club_key))
+    )).all():
+        groups[(summary.skater_id, summary.skating_level, summary.age_group)].append(summary)
+    return [combine_summaries(rows) for rows in groups.values()]
+
+
+async def _run(args) -> None:
+    from app.database import async_session_factory
+    from app.routes import stats
+    from app.services.report_data import get_club_report_data
+
+    await _seed(args.competitions, args.skaters)
+
+    async def _measure(fn) -> tuple[float, float]:
+        latencies, peaks = [], []
+        for run in range(args.runs + 3):
+            async with async_session_factory() as session:
+                start = time.perf_counter()
+                await fn(session)
+                latencies.append((time.perf_counter() - start) * 1000)
+            async with async_session_factory() as session:
+                gc.collect()
+                tracemalloc.start()
+                await fn(session)
+                peaks.append(tracemalloc.get_traced_memory()[1] / 1024)
+                tracemalloc.stop()
+        # The first runs warm the SQL compilation caches
+        return statistics.median(peaks[3:]), statistics.median(latencies[3:])
+
+    print(f"1 season, {args.competitions} competitions, {args.skaters} skaters, club {CLUB!r}")
+    print(f"{'query':<22}{'version':<10}{'peak KiB':>10}{'ratio':>8}{'p50 ms':>9}")
+    for name, previous, current in (
+        ("club report", _previous_report, lambda s: get_club_report_data(SEASON, s)),
+        ("progression ranking", _previous_ranking,
+         lambda s: stats._progression_ranking(s, SEASON, CLUB, None, None, None)),
+    ):
+        before, before_ms = await _measure(previous)
+        after, after_ms = await _measure(current)
+        print(f"{name:<22}{'previous':<10}{before:>10.0f}{'':>8}{before_ms:>9.1f}")
+        print(f"{name:<22}{'current':<10}{after:>10.0f}{before / after:>7.1f}x{after_ms:>9.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--skaters", type=int, default=1200)
+    parser.add_argument("--competitions", type=int, default=12)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        os.environ["CLUB_SHORT"] = CLUB
+        os.environ["CLUB_NAME"] = CLUB
+        sys.path.insert(0, str(BACKEND_DIR))
+        asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,41 @@
 import asyncio
+import os
 from typing import AsyncGenerator
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from app.database import Base
 from app.auth.passwords import hash_password
 
-# Use in-memory SQLite for tests
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
-
-_test_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+# In-memory SQLite by default; set TEST_DATABASE_URL to run the suite against
+# another database, e.g. the PostgreSQL service from docker-compose.test.yml.
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+# Server databases get a fresh connection per checkout: pooled asyncpg
+# connections are bound to the event loop of the test that opened them.
+_test_engine = create_async_engine(
+    TEST_DATABASE_URL,
+    echo=False,
+    **({} if TEST_DATABASE_URL.startswith("sqlite") else {"poolclass": NullPool}),
+)
 _test_session_factory = async_sessionmaker(_test_engine, expire_on_commit=False)
 
 
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked sqlite_only when the suite runs on another database."""
+    if TEST_DATABASE_URL.startswith("sqlite"):
+        return
+    skip = pytest.mark.skip(reason="SQLite-specific")
+    for item in items:
+        if "sqlite_only" in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     loop = asyncio.new_event_loop()
@@ -28,8 +48,11 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
     # Import all models so metadata is populated
     import app.models  # noqa: F401
 
+    from app.services.response_cache import response_cache
+
     async with _test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    response_cache.clear()
 
     async with _test_session_factory() as session:
         yield session
@@ -38,15 +61,47 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
         await conn.run_sync(Base.metadata.drop_all)
 
 
+# The route modules bind the session dependencies once, when app.main is
+# first imported, so these read the current test's session at call time.
+_client_session: dict[str, AsyncSession] = {}
+
+
+async def _test_get_session():
+    yield _client_session["session"]
+
+
+async def _test_get_read_session():
+    # Same session, but any write fails as it would on the query_only engine
+    session = _client_session["session"]
+
+    def _reject_flush(*_args):
+        raise ReadOnlySessionError("flush on a read-only session")
+
+    def _reject_dml(state):
+        if state.is_insert or state.is_update or state.is_delete:
+            raise ReadOnlySessionError(f"write on a read-only session: {state.statement}")
+
+    event.listen(session.sync_session, "before_flush", _reject_flush)
+    event.listen(session.sync_session, "do_orm_execute", _reject_dml)
+    try:
+        yield session
+    finally:
+        event.remove(session.sync_session, "before_flush", _reject_flush)
+        event.remove(session.sync_session, "do_orm_execute", _reject_dml)
+
+
+class ReadOnlySessionError(Exception):
+    pass
+
+
 @pytest_asyncio.fixture
 async def client(db_session: AsyncSession, monkeypatch) -> AsyncGenerator[AsyncClient, None]:
     """Async test client with test DB injected via monkeypatch."""
     import app.database as db_mod
 
-    async def _test_get_session():
-        yield db_session
-
+    monkeypatch.setitem(_client_session, "session", db_session)
     monkeypatch.setattr(db_mod, "get_session", _test_get_session)
+    monkeypatch.setattr(db_mod, "get_read_session", _test_get_read_session)
 
     from app.main import app
 
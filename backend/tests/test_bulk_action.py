@@ -92,3 +92,24 @@ async def test_bulk_action_requires_admin(client, reader_token, competitions):
         headers={"Authorization": f"Bearer {reader_token}"},
     )
     assert resp.status_code == 403
+
+
+async def test_bulk_import_creates_missing_competitions_once(client, admin_token, db_session, competitions):
+    from sqlalchemy import func, select
+
+    existing = competitions[0]
+    resp = await client.post(
+        "/api/competitions/bulk-import",
+        json={"urls": [existing.url, " http://example.com/new ", "http://example.com/new"],
+              "season": "2025-2026"},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert resp.status_code == 201
+    assert resp.json()["total"] == 3
+
+    count = (await db_session.execute(select(func.count(Competition.id)))).scalar()
+    assert count == 4
+    new = (await db_session.execute(
+        select(Competition).where(Competition.url == "http://example.com/new")
+    )).scalar_one()
+    assert new.season == "2025-2026"
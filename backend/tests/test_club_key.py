@@ -0,0 +1,45 @@
+from sqlalchemy import select, text
+
+from app.migrations import _backfill_club_keys
+from app.models.skater import Skater
+from app.services.club_key import club_filter, club_key
+
+
+def test_club_key_normalizes_case_accents_and_spaces():
+    assert club_key("  Club  Éa ") == "club ea"
+    assert club_key("CSG") == club_key("csg")
+    assert club_key("") is None
+    assert club_key(None) is None
+
+
+async def test_club_key_follows_club_on_orm_writes(db_session):
+    skater = Skater(first_name="Léa", last_name="MARTIN", club="Patin  Élite")
+    db_session.add(skater)
+    await db_session.flush()
+    assert skater.club_key == "patin elite"
+
+    skater.club = None
+    assert skater.club_key is None
+
+
+async def test_club_filter_matches_any_spelling(db_session):
+    db_session.add_all([
+        Skater(first_name="A", last_name="ONE", club="CSG"),
+        Skater(first_name="B", last_name="TWO", club="csg "),
+        Skater(first_name="C", last_name="THREE", club="Other"),
+    ])
+    await db_session.flush()
+    rows = (await db_session.execute(
+        select(Skater.last_name).where(club_filter("Csg", Skater.club_key))
+    )).scalars().all()
+    assert sorted(rows) == ["ONE", "TWO"]
+
+
+async def test_backfill_fills_missing_club_keys(db_session):
+    conn = await db_session.connection()
+    await conn.execute(text(
+        "INSERT INTO skaters (first_name, last_name, club) VALUES ('A', 'RAW', 'Club Été')"
+    ))
+    await _backfill_club_keys(conn)
+    key = (await conn.execute(text("SELECT club_key FROM skaters WHERE last_name = 'RAW'"))).scalar()
+    assert key == "club ete"
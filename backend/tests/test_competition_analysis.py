@@ -4,6 +4,7 @@ import pytest
 import pytest_asyncio
 from datetime import date
 from httpx import AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.competition import Competition
@@ -13,6 +14,8 @@ from app.models.app_settings import AppSettings
 from app.services.competition_analysis import (
     compute_club_challenge_points,
     compute_competition_club_analysis,
+    compute_season_club_analysis,
+    personal_best_results,
 )
 
 
@@ -183,6 +186,89 @@ async def test_competition_club_analysis(db_session: AsyncSession, seed_club_ana
     assert jean_result["medal"] == 2
 
 
+@pytest.mark.asyncio
+async def test_personal_bests_use_a_fixed_number_of_queries(db_session: AsyncSession, seed_club_analysis):
+    comp_a, comp_prior = seed_club_analysis["comp_a"], seed_club_analysis["comp_prior"]
+
+    async def _statements() -> int:
+        statements: list[str] = []
+        listener = lambda *_a: statements.append(_a[2])  # noqa: E731
+        event.listen(db_session.bind.sync_engine, "before_cursor_execute", listener)
+        try:
+            await compute_competition_club_analysis(db_session, comp_a.id, "TC")
+        finally:
+            event.remove(db_session.bind.sync_engine, "before_cursor_execute", listener)
+        return len(statements)
+
+    before = await _statements()
+    for i in range(5):
+        skater = Skater(first_name=f"New{i}", last_name="TC", club="TC")
+        db_session.add(skater)
+        await db_session.flush()
+        for comp, total in ((comp_prior, 20.0), (comp_a, 21.0 + i)):
+            db_session.add(CategoryResult(
+                competition_id=comp.id, skater_id=skater.id, category="R2 Minime Femme",
+                overall_rank=10 + i, combined_total=total, segment_count=1,
+            ))
+    await db_session.commit()
+
+    assert await _statements() == before
+    result = await compute_competition_club_analysis(db_session, comp_a.id, "TC")
+    assert result["kpis"]["personal_bests"] == 6
+
+
+@pytest.mark.asyncio
+async def test_personal_best_needs_an_earlier_date(db_session: AsyncSession):
+    comps = [
+        Competition(name=name, url=f"http://test/{name}", date=day, season="2025-2026")
+        for name, day in (
+            ("Sept", date(2025, 9, 1)), ("Oct", date(2025, 10, 1)), ("Oct bis", date(2025, 10, 1)),
+            ("Nov", date(2025, 11, 1)), ("Undated", None),
+        )
+    ]
+    skater = Skater(first_name="A", last_name="B", club="TC")
+    db_session.add_all([*comps, skater])
+    await db_session.flush()
+    for comp, total in zip(comps, (30.0, 32.0, 40.0, 40.0, 50.0)):
+        db_session.add(CategoryResult(
+            competition_id=comp.id, skater_id=skater.id, category="R2 Minime Femme",
+            overall_rank=1, combined_total=total, segment_count=1,
+        ))
+    await db_session.commit()
+
+    pbs = await personal_best_results(db_session, [c.id for c in comps], [skater.id])
+
+    # The first result has no prior best, a same-day result is not a prior
+    # one, a tie is not a personal best, and an undated competition has none
+    assert pbs == {
+        (comps[1].id, skater.id, "R2 Minime Femme"),
+        (comps[2].id, skater.id, "R2 Minime Femme"),
+    }
+
+
+@pytest.mark.asyncio
+async def test_season_club_analysis_matches_per_competition_kpis(db_session: AsyncSession, seed_club_analysis):
+    overview = await compute_season_club_analysis(db_session, "2025-2026", "TC")
+
+    assert [entry["competition"]["name"] for entry in overview] == ["Comp Prior", "Comp A"]
+    for entry in overview:
+        single = await compute_competition_club_analysis(db_session, entry["competition"]["id"], "TC")
+        assert entry["kpis"] == single["kpis"]
+    assert overview[1]["kpis"]["personal_bests"] == 1
+    assert await compute_season_club_analysis(db_session, "2024-2025", "TC") == []
+
+
+@pytest.mark.asyncio
+async def test_season_club_analysis_endpoint(client: AsyncClient, admin_token: str, seed_club_analysis):
+    resp = await client.get(
+        "/api/stats/season-club-analysis",
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [entry["kpis"]["total_medals"] for entry in data] == [1, 3]
+
+
 @pytest.mark.asyncio
 async def test_competition_club_analysis_endpoint(client: AsyncClient, admin_token: str, seed_club_analysis):
     comp_a = seed_club_analysis["comp_a"]
@@ -0,0 +1,88 @@
+from datetime import date
+
+from app.models.category_result import CategoryResult
+from app.models.competition import Competition
+from app.models.score import Score
+from app.models.skater import Skater
+
+
+async def _seed(db_session):
+    """Seven CSG skaters and one from another club, over two seasons."""
+    skaters = [Skater(first_name=f"S{i}", last_name=f"CSG{i}", club="CSG") for i in range(7)]
+    rival = Skater(first_name="Rival", last_name="OTHER", club="Autre Club")
+    db_session.add_all([*skaters, rival])
+    comps = [
+        Competition(name="Automne", url="http://c/1", date=date(2025, 10, 15), season="2025-2026"),
+        Competition(name="Hiver", url="http://c/2", date=date(2026, 1, 20), season="2025-2026"),
+        Competition(name="Ancienne", url="http://c/3", date=date(2024, 11, 1), season="2024-2025"),
+    ]
+    db_session.add_all(comps)
+    await db_session.flush()
+
+    rows = []
+    for i, skater in enumerate(skaters):
+        comp = comps[i % 2]
+        rows.append(Score(competition_id=comp.id, skater_id=skater.id, segment="FS",
+                          category="R2 Novice Femme", club="CSG", total_score=40.0 + i))
+        # Ranks 7..1: only the last three skaters reach the podium
+        rows.append(CategoryResult(competition_id=comp.id, skater_id=skater.id,
+                                   category="R2 Novice Femme", club="CSG", overall_rank=7 - i,
+                                   combined_total=40.0 + i, segment_count=1))
+    # Podium without a combined total: a medal, never a top score
+    rows.append(CategoryResult(competition_id=comps[1].id, skater_id=skaters[0].id,
+                               category="R1 Junior Femme", club="CSG", overall_rank=1,
+                               segment_count=0))
+    rows.append(Score(competition_id=comps[0].id, skater_id=rival.id, segment="FS",
+                      category="R2 Novice Femme", club="Autre Club", total_score=99.0))
+    rows.append(CategoryResult(competition_id=comps[0].id, skater_id=rival.id,
+                               category="R2 Novice Femme", club="Autre Club", overall_rank=1,
+                               combined_total=99.0, segment_count=1))
+    rows.append(Score(competition_id=comps[2].id, skater_id=skaters[0].id, segment="FS",
+                      category="R2 Novice Femme", club="CSG", total_score=35.0))
+    db_session.add_all(rows)
+    await db_session.commit()
+    return skaters
+
+
+async def test_dashboard_counts_medals_and_top_scores(client, db_session, admin_token, monkeypatch):
+    from app.routes import dashboard
+
+    monkeypatch.setattr(dashboard, "CLUB_SHORT", "CSG")
+    skaters = await _seed(db_session)
+
+    resp = await client.get(
+        "/api/dashboard/",
+        params={"season": "2025-2026"},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+
+    assert (data["active_skaters"], data["competitions_tracked"], data["total_programs"]) == (7, 2, 7)
+    assert [(m["skater_name"], m["rank"]) for m in data["medals"]] == [
+        ("S6 CSG6", 1), ("S0 CSG0", 1), ("S5 CSG5", 2), ("S4 CSG4", 3),
+    ]
+    assert data["medals"][1]["combined_total"] is None
+    assert [t["tss"] for t in data["top_scores"]] == [46.0, 45.0, 44.0, 43.0, 42.0]
+    assert data["top_scores"][0] == {
+        "skater_id": skaters[6].id,
+        "skater_name": "S6 CSG6",
+        "tss": 46.0,
+        "competition_name": "Automne",
+        "competition_date": "2025-10-15",
+        "category": "R2 Novice Femme",
+    }
+    assert [c["name"] for c in data["recent_competitions"]] == ["Hiver", "Automne"]
+
+
+async def test_dashboard_all_seasons(client, db_session, admin_token, monkeypatch):
+    from app.routes import dashboard
+
+    monkeypatch.setattr(dashboard, "CLUB_SHORT", "CSG")
+    await _seed(db_session)
+
+    resp = await client.get("/api/dashboard/", headers={"Authorization": f"Bearer {admin_token}"})
+    data = resp.json()
+
+    assert (data["active_skaters"], data["competitions_tracked"], data["total_programs"]) == (7, 3, 8)
+    assert [c["name"] for c in data["recent_competitions"]] == ["Hiver", "Automne", "Ancienne"]
@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.database import create_engine
+
+
+async def _pragma(engine, name: str):
+    async with engine.connect() as conn:
+        return (await conn.execute(text(f"PRAGMA {name}"))).scalar()
+
+
+async def test_sqlite_engine_applies_pragma_profile(tmp_path):
+    engine = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    try:
+        assert await _pragma(engine, "journal_mode") == "wal"
+        assert await _pragma(engine, "synchronous") == 1  # NORMAL
+        assert await _pragma(engine, "busy_timeout") == 5000
+        assert await _pragma(engine, "temp_store") == 2  # MEMORY
+        assert await _pragma(engine, "cache_size") < 0
+        assert await _pragma(engine, "query_only") == 0
+    finally:
+        await engine.dispose()
+
+
+async def test_read_engine_rejects_writes(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'app.db'}"
+    writer = create_engine(url)
+    reader = create_engine(url, read_only=True)
+    try:
+        async with writer.begin() as conn:
+            await conn.execute(text("CREATE TABLE t (x INTEGER)"))
+            await conn.execute(text("INSERT INTO t VALUES (1)"))
+
+        async with reader.connect() as conn:
+            assert (await conn.execute(text("SELECT x FROM t"))).scalar() == 1
+            with pytest.raises(OperationalError):
+                await conn.execute(text("INSERT INTO t VALUES (2)"))
+    finally:
+        await writer.dispose()
+        await reader.dispose()
+
+
+async def test_readers_not_blocked_by_open_write_transaction(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'app.db'}"
+    writer = create_engine(url)
+    reader = create_engine(url, read_only=True)
+    try:
+        async with writer.begin() as conn:
+            await conn.execute(text("CREATE TABLE t (x INTEGER)"))
+            await conn.execute(text("INSERT INTO t VALUES (1)"))
+
+        async with writer.begin() as write_conn:
+            await write_conn.execute(text("INSERT INTO t VALUES (2)"))
+            # With WAL the reader sees the last committed state instead of
+            # waiting for the writer to commit.
+            async with reader.connect() as conn:
+                assert (await conn.execute(text("SELECT count(*) FROM t"))).scalar() == 1
+    finally:
+        await writer.dispose()
+        await reader.dispose()
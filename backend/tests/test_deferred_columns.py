@@ -0,0 +1,73 @@
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+
+from app.models.competition import Competition
+from app.models.score import Score
+from app.models.skater import Skater
+
+ELEMENTS = [{"name": "2A", "base_value": 3.3, "goe": 0.50, "score": 3.8, "markers": []}]
+COMPONENTS = {"Composition": {"score": 2.5, "factor": 1.6, "judges": [2.5, 2.75, 2.25]}}
+
+
+def _auth(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest_asyncio.fixture
+async def scores(db_session):
+    comp = Competition(
+        name="Comp", url="http://test/deferred", date=date(2025, 11, 1), season="2025-2026",
+        last_import_log={"scores_imported": 2, "errors": []},
+    )
+    skater = Skater(first_name="Léa", last_name="MARTIN")
+    db_session.add_all([comp, skater])
+    await db_session.flush()
+    enriched = Score(competition_id=comp.id, skater_id=skater.id, segment="FS",
+                     elements=ELEMENTS, components=COMPONENTS, total_score=40.0)
+    bare = Score(competition_id=comp.id, skater_id=skater.id, segment="SP", total_score=20.0)
+    db_session.add_all([enriched, bare])
+    await db_session.commit()
+    db_session.expunge_all()
+    return comp, enriched, bare
+
+
+async def test_heavy_json_columns_are_not_loaded_by_default(db_session, scores):
+    score = (await db_session.execute(select(Score).where(Score.segment == "FS"))).scalar_one()
+    with pytest.raises(InvalidRequestError):
+        score.elements
+    comp = (await db_session.execute(select(Competition))).scalar_one()
+    with pytest.raises(InvalidRequestError):
+        comp.last_import_log
+
+
+async def test_scores_list_serves_stored_json(client: AsyncClient, admin_token, scores):
+    comp, _, _ = scores
+    resp = await client.get(
+        "/api/scores/",
+        params={"competition_id": comp.id, "fields": "segment,components,elements"},
+        headers=_auth(admin_token),
+    )
+    assert resp.status_code == 200
+    by_segment = {s["segment"]: s for s in resp.json()["items"]}
+    assert by_segment["FS"]["elements"] == ELEMENTS
+    assert by_segment["FS"]["components"] == COMPONENTS
+    assert by_segment["SP"]["elements"] is None
+
+
+async def test_score_elements_endpoint(client: AsyncClient, admin_token, scores):
+    _, enriched, bare = scores
+    headers = _auth(admin_token)
+    assert (await client.get(f"/api/scores/{enriched.id}/elements", headers=headers)).json() == ELEMENTS
+    assert (await client.get(f"/api/scores/{bare.id}/elements", headers=headers)).json() == []
+    assert (await client.get("/api/scores/999/elements", headers=headers)).status_code == 404
+
+
+async def test_import_status_serves_stored_log(client: AsyncClient, admin_token, scores):
+    comp, _, _ = scores
+    resp = await client.get(f"/api/competitions/{comp.id}/import-status", headers=_auth(admin_token))
+    assert resp.json() == {"scores_imported": 2, "errors": []}
@@ -0,0 +1,127 @@
+import asyncio
+import json
+
+import pytest_asyncio
+
+from app.models.competition import Competition
+from app.models.notification import Notification
+from app.routes.events import event_stream
+from app.services.event_bus import EventBus, event_bus, notify_after_commit
+from app.services.job_queue import JobQueue
+
+
+async def test_publish_filters_by_user_and_role():
+    bus = EventBus()
+    async with bus.subscribe("u1", is_admin=True) as admin_q, \
+            bus.subscribe("u2", is_admin=False) as reader_q:
+        bus.publish("job", {"id": "j1"}, admin_only=True)
+        bus.publish("notifications", {}, user_id="u2")
+
+        assert admin_q.get_nowait() == ("job", {"id": "j1"})
+        assert admin_q.empty()
+        assert reader_q.get_nowait() == ("notifications", {})
+        assert reader_q.empty()
+    assert bus.subscriber_count == 0
+
+
+async def test_slow_subscriber_drops_oldest_events():
+    bus = EventBus()
+    async with bus.subscribe("u1", is_admin=True) as q:
+        for i in range(105):
+            bus.publish("job", {"n": i})
+        assert q.qsize() == 100
+        assert q.get_nowait() == ("job", {"n": 5})
+
+
+async def test_notification_event_published_only_after_commit(db_session, admin_user):
+    user, _ = admin_user
+    async with event_bus.subscribe(user.id, is_admin=True) as q:
+        db_session.add(Notification(user_id=user.id, type="competition", title="t"))
+        notify_after_commit(db_session, user.id)
+        await db_session.flush()
+        assert q.empty()
+
+        await db_session.commit()
+        assert q.get_nowait() == ("notifications", {})
+
+        db_session.add(Notification(user_id=user.id, type="competition", title="t2"))
+        notify_after_commit(db_session, user.id)
+        await db_session.flush()
+        await db_session.rollback()
+        await db_session.commit()
+        assert q.empty()
+
+
+async def test_event_stream_sends_count_jobs_and_heartbeats():
+    counts = iter([3, 4])
+
+    async def count_unread():
+        return next(counts)
+
+    stream = event_stream("u1", True, count_unread, heartbeat=0.05)
+    first = await anext(stream)
+    assert first.event == "notifications"
+    assert json.loads(first.data) == {"count": 3}
+
+    event_bus.publish("job", {"id": "j1", "status": "running"}, admin_only=True)
+    msg = await anext(stream)
+    assert msg.event == "job"
+    assert json.loads(msg.data) == {"id": "j1", "status": "running"}
+
+    event_bus.publish("notifications", {}, user_id="u1")
+    msg = await anext(stream)
+    assert json.loads(msg.data) == {"count": 4}
+
+    msg = await asyncio.wait_for(anext(stream), timeout=1.0)
+    assert msg.comment == "keepalive"
+
+    await stream.aclose()
+    assert event_bus.subscriber_count == 0
+
+
+async def test_non_admin_stream_does_not_receive_job_events():
+    async def count_unread():
+        return 0
+
+    stream = event_stream("u2", False, count_unread, heartbeat=0.05)
+    await anext(stream)
+    event_bus.publish("job", {"id": "j1"}, admin_only=True)
+    msg = await asyncio.wait_for(anext(stream), timeout=1.0)
+    assert msg.comment == "keepalive"
+    await stream.aclose()
+
+
+@pytest_asyncio.fixture
+async def competition(db_session):
+    comp = Competition(name="SSE Comp", url="http://example.com/sse")
+    db_session.add(comp)
+    await db_session.commit()
+    return comp
+
+
+async def test_job_queue_publishes_state_transitions(db_session, competition):
+    queue = JobQueue(worker_id="worker-sse")
+    queue.set_session_factory(lambda: db_session, owns_session=False)
+
+    async def handler(job):
+        return {"ok": True}
+
+    queue.set_handler(handler)
+    async with event_bus.subscribe("admin", is_admin=True) as q:
+        job = await queue.create_job("import", competition.id)
+        await queue.start_worker()
+        await asyncio.wait_for(queue.join(), timeout=2.0)
+        await queue.stop_worker()
+
+        statuses = []
+        while not q.empty():
+            event_type, data = q.get_nowait()
+            assert event_type == "job"
+            assert data["id"] == job["id"]
+            statuses.append(data["status"])
+    assert statuses == ["queued", "running", "completed"]
+
+
+async def test_events_endpoint_requires_auth(client):
+    resp = await client.get("/api/events/")
+    assert resp.status_code == 401
@@ -206,3 +206,59 @@ def test_parse_competition_info_no_date_no_date_end():
     info = scraper.parse_competition_info(html)
     assert info.date is None
     assert info.date_end is None
+
+
+def _fake_site(monkeypatch):
+    """Serve the fixtures for every page of index_sample.html and record fetches."""
+    import app.services.site_scraper as site_scraper
+
+    pages = {
+        "index.htm": (FIXTURES / "index_sample.html").read_text(),
+        "SEG": (FIXTURES / "seg_sample.html").read_text(),
+        "CAT": (FIXTURES / "cat_result_two_segments.html").read_text(),
+    }
+    fetched: list[str] = []
+
+    async def fake_fetch(url, client):
+        fetched.append(url.rsplit("/", 1)[-1])
+        name = url.rsplit("/", 1)[-1]
+        return pages["index.htm"] if name == "index.htm" else pages[name[:3]]
+
+    monkeypatch.setattr(site_scraper, "_fetch", fake_fetch)
+    return fetched
+
+
+async def test_scrape_marks_fetched_segments(monkeypatch):
+    fetched = _fake_site(monkeypatch)
+    events, results, _, _, _ = await FSManagerScraper().scrape("http://example.com/results/index.htm")
+
+    assert fetched == [
+        "index.htm", "SEG018.htm", "SEG005.htm", "SEG006.htm", "CAT001RS.htm", "CAT002RS.htm",
+    ]
+    assert results
+    assert all(e.fetched and e.fingerprint for e in events)
+    # Every starter on the sample page is ranked and each segment links its PDF
+    assert all(e.finished for e in events)
+
+
+async def test_scrape_skips_finished_segments_and_their_category(monkeypatch):
+    fetched = _fake_site(monkeypatch)
+    events, _, _, _, _ = await FSManagerScraper().scrape(
+        "http://example.com/results/index.htm",
+        skip_seg_urls={"http://example.com/results/SEG018.htm", "http://example.com/results/SEG005.htm"},
+    )
+
+    # R1 is entirely finished: neither its SEG nor its CAT page is fetched.
+    # R2 still has a live segment, so its CAT page is.
+    assert fetched == ["index.htm", "SEG006.htm", "CAT002RS.htm"]
+    assert [e.fetched for e in events] == [False, False, True]
+
+
+async def test_scrape_index_only(monkeypatch):
+    fetched = _fake_site(monkeypatch)
+    events, results, cat_results, _, _ = await FSManagerScraper().scrape(
+        "http://example.com/results/index.htm", index_only=True,
+    )
+    assert fetched == ["index.htm"]
+    assert len(events) == 3
+    assert results == [] and cat_results == []
@@ -35,3 +35,28 @@ async def test_get_or_create_skater_sets_club_on_new(db_session: AsyncSession):
     """New skater gets club from import."""
     result = await _get_or_create_skater(db_session, "Bob MARTIN", "FRA", "My Club")
     assert result.club == "My Club"
+    assert result.club_key == "my club"
+    assert result.id is not None
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_skater_reuses_row_created_concurrently(db_session: AsyncSession, monkeypatch):
+    """A skater inserted by another import after the lookup is reused, not duplicated."""
+    from sqlalchemy import func, select
+
+    from app.services import import_service
+
+    real_insert_ignore = import_service.insert_ignore
+
+    async def _racing_insert_ignore(session, model, rows, conflict):
+        # Another worker inserts the same skater between our SELECT and INSERT
+        await real_insert_ignore(session, model, {"first_name": "Bob", "last_name": "MARTIN",
+                                                  "club": "Other Club"}, conflict)
+        await real_insert_ignore(session, model, rows, conflict)
+
+    monkeypatch.setattr(import_service, "insert_ignore", _racing_insert_ignore)
+    result = await _get_or_create_skater(db_session, "Bob MARTIN", "FRA", "My Club")
+
+    assert result.club == "Other Club"
+    count = (await db_session.execute(select(func.count(Skater.id)))).scalar()
+    assert count == 1
@@ -0,0 +1,54 @@
+import time
+
+from app.services import job_metrics
+from app.services.job_metrics import JobMetrics, use_metrics
+
+
+def test_nested_phase_time_is_charged_to_inner_phase(monkeypatch):
+    clock = iter([0.0, 0.0, 1.0, 3.0, 4.0, 10.0])
+    monkeypatch.setattr(time, "perf_counter", lambda: next(clock))
+
+    metrics = JobMetrics()  # started at 0
+    with metrics.phase("write"):  # 0 -> 4
+        with metrics.phase("match"):  # 1 -> 3
+            pass
+    metrics.count("match")
+
+    data = metrics.to_dict()  # now 10
+    assert data["total_seconds"] == 10.0
+    assert data["phases"]["write"] == {"seconds": 2.0, "count": 0}
+    assert data["phases"]["match"] == {"seconds": 2.0, "count": 1}
+
+
+def test_phase_helper_counts_items():
+    metrics = JobMetrics()
+    with use_metrics(metrics):
+        with job_metrics.phase("fetch", items=3):
+            pass
+        job_metrics.count("fetch")
+    assert metrics.to_dict()["phases"]["fetch"]["count"] == 4
+
+
+def test_helpers_are_noops_outside_a_job():
+    assert job_metrics.current_metrics() is None
+    with job_metrics.phase("fetch", items=1):
+        pass
+    job_metrics.count("fetch")
+
+
+async def test_progress_is_throttled_but_final_update_always_sent():
+    updates = []
+
+    async def on_progress(p):
+        updates.append(p)
+
+    metrics = JobMetrics(on_progress=on_progress, progress_interval=60)
+    with use_metrics(metrics):
+        for done in range(1, 6):
+            await job_metrics.progress("fetch", done, 5)
+
+    assert updates == [
+        {"phase": "fetch", "done": 1, "total": 5},
+        {"phase": "fetch", "done": 5, "total": 5},
+    ]
+    assert job_metrics.current_metrics() is None
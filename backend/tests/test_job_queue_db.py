@@ -1,6 +1,7 @@
 import asyncio
 from datetime import datetime, timedelta, timezone
 
+import pytest
 import pytest_asyncio
 from sqlalchemy import select
 
@@ -24,7 +25,7 @@ async def competition(db_session):
 
 @pytest_asyncio.fixture
 async def queue(db_session):
-    q = JobQueue()
+    q = JobQueue(worker_id="worker-a")
     q.set_session_factory(lambda: db_session, owns_session=False)
     return q
 
@@ -47,13 +48,57 @@ async def test_list_jobs_from_db(queue, competition):
     await queue.create_job("import", competition.id)
     await queue.create_job("enrich", competition.id)
 
-    jobs = await queue.list_jobs()
+    jobs, next_cursor = await queue.list_jobs()
     assert len(jobs) == 2
+    assert next_cursor is None
     # Newest first
     assert jobs[0]["type"] == "enrich"
     assert jobs[1]["type"] == "import"
 
 
+async def test_list_jobs_keyset_pages(queue, db_session, competition):
+    # Several jobs share a created_at: the id tie-breaker keeps pages disjoint.
+    same = datetime(2026, 1, 1, 12, 0)
+    for i in range(5):
+        db_session.add(Job(
+            id=f"page{i:08d}", type="enrich", trigger="auto",
+            competition_id=competition.id, status="completed",
+            created_at=same if i < 3 else same + timedelta(minutes=i),
+        ))
+    await db_session.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = await queue.list_jobs(limit=2, cursor=cursor)
+        seen.extend(j["id"] for j in page)
+        if cursor is None:
+            break
+    assert seen == ["page00000004", "page00000003", "page00000002", "page00000001", "page00000000"]
+
+
+async def test_list_jobs_filters(queue, db_session, competition):
+    other = await _other_competition(db_session, 1)
+    await queue.create_job("import", competition.id, trigger="manual")
+    enrich = await queue.create_job("enrich", competition.id, trigger="auto")
+    await queue.create_job("import", other.id, trigger="auto")
+    await queue.cancel_job(enrich["id"])
+
+    jobs, _ = await queue.list_jobs(competition_id=competition.id)
+    assert {j["type"] for j in jobs} == {"import", "enrich"}
+    jobs, _ = await queue.list_jobs(trigger="auto", job_type="import")
+    assert [j["competition_id"] for j in jobs] == [other.id]
+    jobs, _ = await queue.list_jobs(status=["cancelled"])
+    assert [j["id"] for j in jobs] == [enrich["id"]]
+    jobs, _ = await queue.list_jobs(status=["queued", "running"])
+    assert len(jobs) == 2
+
+
+async def test_list_jobs_rejects_bad_cursor(queue):
+    with pytest.raises(ValueError):
+        await queue.list_jobs(cursor="not-a-cursor")
+
+
 async def test_get_job_from_db(queue, competition):
     job = await queue.create_job("import", competition.id)
     fetched = await queue.get_job(job["id"])
@@ -142,7 +187,7 @@ async def test_worker_processes_and_persists(queue, competition, db_session):
     job = await queue.create_job("import", competition.id)
     await queue.start_worker()
 
-    await asyncio.wait_for(queue._queue.join(), timeout=2.0)
+    await asyncio.wait_for(queue.join(), timeout=2.0)
     await queue.stop_worker()
 
     row = await db_session.get(Job, job["id"])
@@ -161,7 +206,7 @@ async def test_worker_handles_failure_and_persists(queue, competition, db_sessio
     job = await queue.create_job("import", competition.id)
     await queue.start_worker()
 
-    await asyncio.wait_for(queue._queue.join(), timeout=2.0)
+    await asyncio.wait_for(queue.join(), timeout=2.0)
     await queue.stop_worker()
 
     row = await db_session.get(Job, job["id"])
@@ -169,3 +214,392 @@ async def test_worker_handles_failure_and_persists(queue, competition, db_sessio
     assert row.status == "failed"
     assert "scrape failed" in row.error
     assert row.completed_at is not None
+
+
+async def test_create_job_coalesces_queued_duplicate(queue, competition, db_session):
+    first = await queue.create_job("import", competition.id, trigger="auto")
+    second = await queue.create_job("import", competition.id, trigger="bulk")
+    assert second["id"] == first["id"]
+
+    rows = (await db_session.execute(select(Job))).scalars().all()
+    assert len(rows) == 1
+
+
+async def test_create_job_does_not_coalesce_across_competitions_or_types(queue, competition, db_session):
+    other = Competition(name="Other", url="http://example.com/other")
+    db_session.add(other)
+    await db_session.commit()
+
+    a = await queue.create_job("import", competition.id)
+    b = await queue.create_job("import", other.id)
+    c = await queue.create_job("enrich", competition.id)
+    assert len({a["id"], b["id"], c["id"]}) == 3
+
+
+async def test_create_job_does_not_coalesce_with_finished_job(queue, competition, db_session):
+    first = await queue.create_job("import", competition.id)
+    row = await db_session.get(Job, first["id"])
+    row.status = "completed"
+    await db_session.commit()
+
+    second = await queue.create_job("import", competition.id)
+    assert second["id"] != first["id"]
+
+
+async def test_queued_reimport_absorbs_import(queue, competition):
+    reimport = await queue.create_job("reimport", competition.id)
+    job = await queue.create_job("import", competition.id)
+    assert job["id"] == reimport["id"]
+    assert job["type"] == "reimport"
+
+
+async def test_reimport_upgrades_queued_import(queue, competition, db_session):
+    imp = await queue.create_job("import", competition.id)
+    job = await queue.create_job("reimport", competition.id)
+    assert job["id"] == imp["id"]
+    assert job["type"] == "reimport"
+
+    row = await db_session.get(Job, imp["id"])
+    assert row.type == "reimport"
+
+
+async def test_create_job_returns_same_shape_when_coalesced(queue, competition):
+    first = await queue.create_job("import", competition.id)
+    second = await queue.create_job("import", competition.id)
+    assert second == first
+
+
+async def test_create_job_loses_insert_race_to_concurrent_job(queue, competition, monkeypatch):
+    """If another caller queues the same job between lookup and insert, reuse it."""
+    winner = await queue.create_job("import", competition.id)
+
+    real_find = JobQueue._find_coalescable
+    calls = []
+
+    async def _miss_once(session, job_type, competition_id):
+        calls.append(job_type)
+        if len(calls) == 1:
+            return None
+        return await real_find(session, job_type, competition_id)
+
+    monkeypatch.setattr(JobQueue, "_find_coalescable", staticmethod(_miss_once))
+    job = await queue.create_job("import", competition.id)
+    assert job["id"] == winner["id"]
+
+
+async def test_reimport_does_not_upgrade_claimed_import(queue, competition, db_session, monkeypatch):
+    """An import claimed by a worker mid-request is left alone; a new reimport is queued."""
+    imp = await queue.create_job("import", competition.id)
+    row = await db_session.get(Job, imp["id"])
+
+    async def _stale_find(session, job_type, competition_id):
+        # Simulate the worker claiming the row right after the lookup.
+        await session.execute(
+            Job.__table__.update().where(Job.id == row.id).values(status="running")
+        )
+        return row
+
+    real_find = JobQueue._find_coalescable
+    monkeypatch.setattr(JobQueue, "_find_coalescable", staticmethod(_stale_find))
+    job = await queue.create_job("reimport", competition.id)
+    monkeypatch.setattr(JobQueue, "_find_coalescable", real_find)
+
+    assert job["id"] != imp["id"]
+    assert job["type"] == "reimport"
+    await db_session.refresh(row)
+    assert row.type == "import"
+    assert row.status == "running"
+
+
+async def test_claim_is_exclusive_between_workers(queue, competition, db_session):
+    other = JobQueue(worker_id="worker-b")
+    other.set_session_factory(lambda: db_session, owns_session=False)
+
+    job = await queue.create_job("import", competition.id)
+    claimed = await queue._claim_next()
+    assert claimed["id"] == job["id"]
+    assert await other._claim_next() is None
+
+    row = await db_session.get(Job, job["id"])
+    assert row.status == "running"
+    assert row.claimed_by == "worker-a"
+    assert row.lease_until is not None
+    assert row.heartbeat_at is not None
+
+
+async def test_claim_takes_oldest_queued_first(queue, competition, db_session):
+    other = await _other_competition(db_session, 1)
+    first = await queue.create_job("import", competition.id)
+    second = await queue.create_job("enrich", other.id)
+    row = await db_session.get(Job, second["id"])
+    row.created_at = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=1)
+    await db_session.commit()
+
+    assert (await queue._claim_next())["id"] == first["id"]
+    assert (await queue._claim_next())["id"] == second["id"]
+    assert await queue._claim_next() is None
+
+
+async def test_claim_skips_competition_with_running_job(queue, competition, db_session):
+    other = await _other_competition(db_session, 1)
+    importing = await queue.create_job("import", competition.id)
+    enrich = await queue.create_job("enrich", competition.id)
+    elsewhere = await queue.create_job("import", other.id)
+
+    assert (await queue._claim_next())["id"] == importing["id"]
+    assert (await queue._claim_next())["id"] == elsewhere["id"]
+    assert await queue._claim_next() is None
+
+    row = await db_session.get(Job, importing["id"])
+    row.status = "completed"
+    await db_session.commit()
+    assert (await queue._claim_next())["id"] == enrich["id"]
+
+
+async def test_cancelled_job_is_never_claimed(queue, competition):
+    job = await queue.create_job("import", competition.id)
+    assert await queue.cancel_job(job["id"]) is True
+    assert await queue._claim_next() is None
+
+
+async def test_queued_jobs_resume_on_new_worker(competition, db_session):
+    """Jobs left queued by a stopped process are run by the next worker."""
+    before = JobQueue(worker_id="old-process")
+    before.set_session_factory(lambda: db_session, owns_session=False)
+    job = await before.create_job("import", competition.id)
+
+    after = JobQueue(worker_id="new-process")
+    after.set_session_factory(lambda: db_session, owns_session=False)
+    seen = []
+
+    async def handler(j):
+        seen.append(j["id"])
+        return {}
+
+    after.set_handler(handler)
+    await after.start_worker()
+    await asyncio.wait_for(after.join(), timeout=2.0)
+    await after.stop_worker()
+
+    row = await db_session.get(Job, job["id"])
+    await db_session.refresh(row)
+
+    assert seen == [job["id"]]
+    assert row.status == "completed"
+    assert row.claimed_by == "new-process"
+
+
+async def test_expired_lease_is_reaped(queue, competition, db_session):
+    job = await queue.create_job("import", competition.id)
+    row = await db_session.get(Job, job["id"])
+    row.status = "running"
+    row.claimed_by = "dead-worker"
+    row.lease_until = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=1)
+    await db_session.commit()
+
+    assert await queue._reap_expired() == 1
+    await db_session.refresh(row)
+    assert row.status == "failed"
+    assert "lease expired" in row.error
+
+
+async def test_cleanup_keeps_running_job_with_live_lease(queue, competition, db_session):
+    job = await queue.create_job("import", competition.id)
+    row = await db_session.get(Job, job["id"])
+    row.status = "running"
+    row.claimed_by = "other-process"
+    row.lease_until = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(minutes=2)
+    await db_session.commit()
+
+    await queue.cleanup(days=7)
+    await db_session.refresh(row)
+    assert row.status == "running"
+
+
+async def test_renew_lease_extends_lease(queue, competition, db_session):
+    job = await queue.create_job("import", competition.id)
+    await queue._claim_next()
+    row = await db_session.get(Job, job["id"])
+    row.lease_until = datetime.now(timezone.utc).replace(tzinfo=None)
+    await db_session.commit()
+    stale_lease = row.lease_until
+
+    await queue._renew_lease(job["id"])
+
+    await db_session.refresh(row)
+    assert row.lease_until > stale_lease + timedelta(seconds=60)
+    assert row.heartbeat_at >= stale_lease
+
+
+async def test_renew_lease_ignores_job_owned_by_other_worker(queue, competition, db_session):
+    job = await queue.create_job("import", competition.id)
+    row = await db_session.get(Job, job["id"])
+    row.status = "running"
+    row.claimed_by = "worker-b"
+    await db_session.commit()
+
+    await queue._renew_lease(job["id"])
+
+    await db_session.refresh(row)
+    assert row.lease_until is None
+
+
+async def test_stop_worker_right_after_create_job(queue, competition):
+    async def handler(job):
+        return {}
+
+    queue.set_handler(handler)
+    await queue.start_worker()
+    await queue.create_job("import", competition.id)
+    await asyncio.wait_for(queue.stop_worker(), timeout=2.0)
+    assert queue._worker_task is None
+
+
+async def test_worker_survives_failed_status_write(queue, competition, db_session, monkeypatch):
+    async def handler(job):
+        return {}
+
+    calls = []
+    real_finish = JobQueue._finish
+
+    async def _flaky_finish(self, *args):
+        calls.append(args[0])
+        if len(calls) == 1:
+            raise RuntimeError("database is locked")
+        return await real_finish(self, *args)
+
+    monkeypatch.setattr(JobQueue, "_finish", _flaky_finish)
+    queue.set_handler(handler)
+    other = await _other_competition(db_session, 1)
+    first = await queue.create_job("import", competition.id)
+    second = await queue.create_job("import", other.id)
+    await queue.start_worker()
+    await asyncio.wait_for(queue.join(), timeout=2.0)
+    await queue.stop_worker()
+
+    assert calls == [first["id"], second["id"]]
+    row = await db_session.get(Job, second["id"])
+    await db_session.refresh(row)
+    assert row.status == "completed"
+
+
+async def _other_competition(db_session, n: int) -> Competition:
+    comp = Competition(name=f"Other {n}", url=f"http://example.com/other{n}")
+    db_session.add(comp)
+    await db_session.commit()
+    return comp
+
+
+async def test_priority_follows_trigger(queue, competition, db_session):
+    other = await _other_competition(db_session, 1)
+    third = await _other_competition(db_session, 2)
+    bulk = await queue.create_job("import", competition.id, trigger="bulk")
+    auto = await queue.create_job("import", other.id, trigger="auto")
+    manual = await queue.create_job("import", third.id, trigger="manual")
+    assert (bulk["priority"], auto["priority"], manual["priority"]) == (2, 1, 0)
+
+    claimed = [(await queue._claim_next())["id"] for _ in range(3)]
+    assert claimed == [manual["id"], auto["id"], bulk["id"]]
+
+
+async def test_aged_low_priority_job_overtakes_new_manual_job(queue, competition, db_session):
+    """Bulk jobs that waited past their head start run before fresh manual jobs."""
+    other = await _other_competition(db_session, 1)
+    bulk = await queue.create_job("import", competition.id, trigger="bulk")
+    row = await db_session.get(Job, bulk["id"])
+    row.created_at -= timedelta(hours=1)
+    row.deadline -= timedelta(hours=1)
+    await db_session.commit()
+
+    manual = await queue.create_job("import", other.id, trigger="manual")
+
+    assert (await queue._claim_next())["id"] == bulk["id"]
+    assert (await queue._claim_next())["id"] == manual["id"]
+
+
+async def test_manual_request_promotes_queued_bulk_job(queue, competition, db_session):
+    bulk = await queue.create_job("reimport", competition.id, trigger="bulk")
+    job = await queue.create_job("import", competition.id, trigger="manual")
+    assert job["id"] == bulk["id"]
+    assert job["priority"] == 0
+
+    row = await db_session.get(Job, bulk["id"])
+    assert row.deadline <= datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+async def test_lower_priority_request_does_not_demote(queue, competition):
+    manual = await queue.create_job("import", competition.id, trigger="manual")
+    job = await queue.create_job("import", competition.id, trigger="bulk")
+    assert job["id"] == manual["id"]
+    assert job["priority"] == 0
+
+
+async def test_worker_stores_progress_and_phase_timings(queue, competition, db_session):
+    from app.services import job_metrics
+
+    async def handler(job):
+        with job_metrics.phase("fetch", items=2):
+            await job_metrics.progress("fetch", 2, 2)
+        return {}
+
+    queue.set_handler(handler)
+    job = await queue.create_job("import", competition.id)
+    await queue.start_worker()
+    await asyncio.wait_for(queue.join(), timeout=2.0)
+    await queue.stop_worker()
+
+    fetched = await queue.get_job(job["id"])
+    assert fetched["progress"] == {"phase": "fetch", "done": 2, "total": 2}
+    assert fetched["metrics"]["phases"]["fetch"]["count"] == 2
+    assert fetched["metrics"]["total_seconds"] >= 0
+
+
+async def test_progress_does_not_wait_for_the_jobs_write_lock(tmp_path, monkeypatch):
+    """An import holds the SQLite write lock until it commits; progress must not block on it."""
+    import time
+
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    import app.database as db_mod
+    from app.database import Base
+    from app.models.skater import Skater
+    from app.services import job_metrics
+
+    monkeypatch.setattr(db_mod, "SQLITE_BUSY_TIMEOUT_MS", 1000)
+    engine = db_mod.create_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with factory() as session:
+            comp = Competition(name="C", url="http://example.com/lock")
+            session.add(comp)
+            await session.commit()
+
+        q = JobQueue(worker_id="worker-a")
+        q.set_session_factory(factory)
+        progress_seconds = []
+
+        async def handler(job):
+            async with factory() as session:
+                session.add(Skater(first_name="Lea", last_name="PETIT"))
+                await session.flush()  # takes the write lock
+                start = time.perf_counter()
+                for done in range(1, 4):
+                    await job_metrics.progress("write", done, 3)
+                progress_seconds.append(time.perf_counter() - start)
+                await session.commit()
+            return {}
+
+        q.set_handler(handler)
+        job = await q.create_job("import", comp.id)
+        await q.start_worker()
+        await asyncio.wait_for(q.join(), timeout=10.0)
+        await q.stop_worker()
+
+        assert progress_seconds[0] < 0.5
+        fetched = await q.get_job(job["id"])
+        assert fetched["status"] == "completed"
+        assert fetched["progress"] == {"phase": "write", "done": 3, "total": 3}
+    finally:
+        await engine.dispose()
@@ -30,7 +30,7 @@ async def sample_job(db_session: AsyncSession, competition):
         trigger="manual",
         competition_id=competition.id,
         status="queued",
-        created_at=datetime.now(timezone.utc),
+        created_at=datetime.now(timezone.utc).replace(tzinfo=None),
     )
     db_session.add(job)
     await db_session.commit()
@@ -46,10 +46,40 @@ async def test_list_jobs_as_admin(client, admin_token, sample_job):
     resp = await client.get("/api/jobs/", headers={"Authorization": f"Bearer {admin_token}"})
     assert resp.status_code == 200
     data = resp.json()
-    assert len(data) >= 1
-    assert data[0]["id"] == "testjob12345"
-    assert data[0]["competition_name"] == "API Test Comp"
-    assert data[0]["trigger"] == "manual"
+    assert data["next_cursor"] is None
+    assert len(data["items"]) >= 1
+    assert data["items"][0]["id"] == "testjob12345"
+    assert data["items"][0]["competition_name"] == "API Test Comp"
+    assert data["items"][0]["trigger"] == "manual"
+
+
+async def test_list_jobs_paginates_with_filters(client, admin_token, sample_job, db_session, competition):
+    for i in range(3):
+        db_session.add(Job(
+            id=f"done{i:08d}", type="enrich", trigger="auto",
+            competition_id=competition.id, status="completed",
+            created_at=datetime(2026, 1, 1, 12, i),
+        ))
+    await db_session.commit()
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    resp = await client.get("/api/jobs/?status=completed&limit=2", headers=headers)
+    data = resp.json()
+    assert [j["id"] for j in data["items"]] == ["done00000002", "done00000001"]
+    assert data["next_cursor"]
+
+    resp = await client.get(
+        "/api/jobs/", params={"status": "completed", "limit": 2, "cursor": data["next_cursor"]},
+        headers=headers,
+    )
+    data = resp.json()
+    assert [j["id"] for j in data["items"]] == ["done00000000"]
+    assert data["next_cursor"] is None
+
+
+async def test_list_jobs_invalid_cursor(client, admin_token):
+    resp = await client.get("/api/jobs/?cursor=garbage", headers={"Authorization": f"Bearer {admin_token}"})
+    assert resp.status_code == 400
 
 
 async def test_get_job_as_admin(client, admin_token, sample_job):
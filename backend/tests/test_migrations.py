@@ -0,0 +1,249 @@
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app import migrations
+from app.migrations import MIGRATIONS, Migration, run_background_migrations, run_migrations
+from tests.conftest import TEST_DATABASE_URL
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    yield engine
+    await engine.dispose()
+
+
+async def _versions(engine) -> list[int]:
+    async with engine.connect() as conn:
+        rows = await conn.execute(text("SELECT version FROM schema_migrations ORDER BY version"))
+        return list(rows.scalars())
+
+
+async def _columns(engine, table: str) -> set[str]:
+    async with engine.connect() as conn:
+        rows = await conn.execute(text(f"PRAGMA table_info({table})"))
+        return {row[1] for row in rows}
+
+
+async def _make_legacy(engine) -> None:
+    """A database created before club_key and schema_migrations existed."""
+    await run_migrations(engine)
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP TABLE schema_migrations"))
+        await conn.execute(text("DROP INDEX ix_scores_club_key"))
+        await conn.execute(text("ALTER TABLE scores DROP COLUMN club_key"))
+        await conn.execute(text("INSERT INTO competitions (name, url) VALUES ('C', 'http://c')"))
+        await conn.execute(text(
+            "INSERT INTO skaters (first_name, last_name, club) VALUES ('A', 'B', 'Club Été')"
+        ))
+        await conn.execute(text(
+            "INSERT INTO scores (competition_id, skater_id, category, segment, total_score, elements)"
+            " VALUES (1, 1, 'R1 Novice Femme', 'FS', 42.5, '[{\"name\": \"2A\", \"goe\": 0.5}]')"
+        ))
+
+
+async def test_new_database_records_every_step_without_running_it(engine):
+    pending = await run_migrations(engine)
+    assert pending == []
+    assert await _versions(engine) == [m.version for m in MIGRATIONS]
+
+
+async def test_up_to_date_database_only_reads_schema(engine):
+    await run_migrations(engine)
+    statements: list[str] = []
+    event.listen(
+        engine.sync_engine, "before_cursor_execute",
+        lambda _c, _cur, statement, *_a: statements.append(statement),
+    )
+
+    assert await run_migrations(engine) == []
+    writes = [s for s in statements if s.lstrip().split()[0].upper() in ("ALTER", "UPDATE", "INSERT", "CREATE", "DROP")]
+    assert writes == []
+
+
+async def test_legacy_database_gets_pending_steps(engine):
+    await _make_legacy(engine)
+
+    pending = await run_migrations(engine)
+
+    assert "club_key" in await _columns(engine, "scores")
+    assert [m.name for m in pending] == [m.name for m in MIGRATIONS if m.background]
+    assert await _versions(engine) == [m.version for m in MIGRATIONS if not m.background]
+
+    await run_background_migrations(engine, pending)
+    assert await _versions(engine) == [m.version for m in MIGRATIONS]
+    async with engine.connect() as conn:
+        club, club_key, level = (await conn.execute(
+            text("SELECT club, club_key, skating_level FROM scores")
+        )).one()
+    assert (club, club_key, level) == ("Club Été", "club ete", "R1")
+    async with engine.connect() as conn:
+        element = (await conn.execute(text("SELECT code, jump_type, goe FROM score_elements"))).one()
+    assert tuple(element) == ("2A", "2A", 0.5)
+    async with engine.connect() as conn:
+        summary = (await conn.execute(
+            text("SELECT skater_id, club_key, programs FROM skater_season_summaries")
+        )).one()
+    assert tuple(summary) == (1, "club ete", 1)
+    async with engine.connect() as conn:
+        distribution = (await conn.execute(
+            text("SELECT skating_level, segment, count, median FROM score_distributions")
+        )).one()
+    assert tuple(distribution) == ("R1", "FS", 1, 42.5)
+
+
+async def test_failed_background_step_is_retried_and_blocks_later_steps(engine, monkeypatch):
+    await _make_legacy(engine)
+
+    async def _boom(conn):
+        raise RuntimeError("boom")
+
+    first, *rest = [m for m in MIGRATIONS if m.background]
+    patched = [Migration(first.version, first.name, _boom, background=True), *rest]
+    monkeypatch.setattr(migrations, "MIGRATIONS", [m for m in MIGRATIONS if not m.background] + patched)
+
+    pending = await run_migrations(engine)
+    await run_background_migrations(engine, pending)
+    assert first.version not in await _versions(engine)
+    assert not set(m.version for m in rest) & set(await _versions(engine))
+
+    monkeypatch.setattr(migrations, "MIGRATIONS", MIGRATIONS)
+    pending = await run_migrations(engine)
+    assert pending[0].version == first.version
+
+
+async def test_category_backfill_parses_each_distinct_string(engine, monkeypatch):
+    from app.services import category_parser
+
+    await run_migrations(engine)
+    async with engine.begin() as conn:
+        await conn.execute(text("INSERT INTO competitions (name, url) VALUES ('C', 'http://c')"))
+        await conn.execute(text("INSERT INTO skaters (first_name, last_name) VALUES ('A', 'B')"))
+        for i, category in enumerate(["R1 Novice Femme", "National Senior Homme", "R2 Minime Femme"] * 3):
+            await conn.execute(text(
+                "INSERT INTO scores (competition_id, skater_id, category, segment)"
+                " VALUES (1, 1, :category, :segment)"
+            ), {"category": category, "segment": f"S{i}"})
+        await conn.execute(text(
+            "INSERT INTO category_results (competition_id, skater_id, category, segment_count)"
+            " VALUES (1, 1, 'Adulte Or Dames', 2)"
+        ))
+
+    calls = []
+    parse = category_parser.parse_category
+    monkeypatch.setattr(category_parser, "parse_category", lambda raw: calls.append(raw) or parse(raw))
+    monkeypatch.setattr(migrations, "_CATEGORY_CHUNK", 2)
+    async with engine.connect() as conn:
+        await migrations._backfill_categories(conn)
+
+    assert sorted(calls) == ["Adulte Or Dames", "National Senior Homme", "R1 Novice Femme", "R2 Minime Femme"]
+    async with engine.connect() as conn:
+        scores = set((await conn.execute(
+            text("SELECT category, skating_level, age_group, gender FROM scores")
+        )).all())
+        result = (await conn.execute(
+            text("SELECT skating_level, age_group FROM category_results")
+        )).one()
+    assert scores == {
+        ("R1 Novice Femme", "R1", "Novice", "Femme"),
+        ("National Senior Homme", "National", "Senior", "Homme"),
+        ("R2 Minime Femme", "R2", "Minime", "Femme"),
+    }
+    assert tuple(result) == ("Adulte Or", "Adulte")
+
+
+@pytest.mark.skipif(TEST_DATABASE_URL.startswith("sqlite"), reason="needs a server database")
+async def test_workers_booting_together_migrate_once():
+    import asyncio
+
+    import app.models  # noqa: F401
+    from sqlalchemy.pool import NullPool
+
+    from app.database import Base
+
+    engines = [create_async_engine(TEST_DATABASE_URL, poolclass=NullPool) for _ in range(3)]
+    try:
+        async with engines[0].begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        results = await asyncio.gather(*(run_migrations(e) for e in engines))
+        assert results == [[], [], []]
+        assert await _versions(engines[0]) == [m.version for m in MIGRATIONS]
+    finally:
+        async with engines[0].begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        for e in engines:
+            await e.dispose()
+
+
+async def test_index_step_cancels_duplicate_queued_jobs_first(engine):
+    await _make_legacy(engine)
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP INDEX uq_jobs_queued_competition_type"))
+        for job_id, created in (("old", "2024-01-01 10:00:00"), ("new", "2024-01-01 11:00:00")):
+            await conn.execute(text(
+                "INSERT INTO jobs (id, type, \"trigger\", competition_id, status, priority, created_at)"
+                " VALUES (:id, 'import', 'manual', 1, 'queued', 1, :created)"
+            ), {"id": job_id, "created": created})
+
+    await run_migrations(engine)
+
+    async with engine.connect() as conn:
+        jobs = dict((await conn.execute(text("SELECT id, status FROM jobs"))).all())
+        indexes = (await conn.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND name = 'uq_jobs_queued_competition_type'"
+        ))).scalars().all()
+    assert jobs == {"old": "queued", "new": "cancelled"}
+    assert indexes == ["uq_jobs_queued_competition_type"]
+
+
+async def test_failed_index_fails_its_step(engine, monkeypatch):
+    await _make_legacy(engine)
+
+    async def _boom(conn):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(migrations, "create_missing_indexes", _boom)
+    with pytest.raises(RuntimeError):
+        await run_migrations(engine)
+    assert 4 not in await _versions(engine)
+
+
+async def test_background_backfill_commits_each_batch(engine, monkeypatch):
+    await _make_legacy(engine)
+    async with engine.begin() as conn:
+        for i, category in enumerate(["R2 Minime Femme", "National Senior Homme"]):
+            await conn.execute(text(
+                "INSERT INTO scores (competition_id, skater_id, category, segment)"
+                " VALUES (1, 1, :category, :segment)"
+            ), {"category": category, "segment": f"S{i}"})
+    monkeypatch.setattr(migrations, "_CATEGORY_CHUNK", 1)
+    pending = [m for m in await run_migrations(engine) if m.name == "backfill_categories"]
+
+    commits = []
+    event.listen(engine.sync_engine, "commit", lambda _conn: commits.append(1))
+    await run_background_migrations(engine, pending)
+
+    # One commit per category string, plus the one recording the step
+    assert len(commits) == 4
+
+
+async def test_score_elements_backfill_commits_each_batch(engine, monkeypatch):
+    await _make_legacy(engine)
+    async with engine.begin() as conn:
+        for segment in ("SP", "S2"):
+            await conn.execute(text(
+                "INSERT INTO scores (competition_id, skater_id, category, segment, elements)"
+                " VALUES (1, 1, 'R1 Novice Femme', :segment, '[{\"name\": \"2T\"}]')"
+            ), {"segment": segment})
+    monkeypatch.setattr(migrations, "_SCORE_ELEMENTS_BATCH", 1)
+
+    commits = []
+    event.listen(engine.sync_engine, "commit", lambda _conn: commits.append(1))
+    async with engine.connect() as conn:
+        await migrations._backfill_score_elements(conn)
+
+    assert len(commits) == 3
+    async with engine.connect() as conn:
+        count = (await conn.execute(text("SELECT COUNT(*) FROM score_elements"))).scalar()
+    assert count == 3
@@ -16,7 +16,7 @@ async def test_polling_auto_disable_after_week(db_session: AsyncSession):
         date=date(2026, 3, 1),
         date_end=date(2026, 3, 2),
         polling_enabled=True,
-        polling_activated_at=datetime(2026, 3, 1, tzinfo=timezone.utc),
+        polling_activated_at=datetime(2026, 3, 1),
     )
     db_session.add(comp)
     await db_session.commit()
@@ -36,7 +36,7 @@ async def test_polling_not_disabled_without_date_end(db_session: AsyncSession):
         name="No End Date",
         url="https://example.com/no-end/index.htm",
         polling_enabled=True,
-        polling_activated_at=datetime(2026, 3, 1, tzinfo=timezone.utc),
+        polling_activated_at=datetime(2026, 3, 1),
     )
     db_session.add(comp)
     await db_session.commit()
@@ -44,3 +44,152 @@ async def test_polling_not_disabled_without_date_end(db_session: AsyncSession):
 
     from app.main import _should_disable_polling
     assert _should_disable_polling(comp, today=date(2026, 12, 31)) is False
+
+
+def _comp(**kwargs) -> Competition:
+    kwargs.setdefault("poll_quiet_streak", 0)
+    return Competition(name="Sched", url="https://example.com/sched/index.htm", **kwargs)
+
+
+def test_active_day_polls_every_few_minutes():
+    from app.services import poll_scheduler
+    comp = _comp(schedule_dates=["2026-03-07", "2026-03-08"], poll_quiet_streak=5)
+    assert poll_scheduler.next_poll_delay(comp, datetime(2026, 3, 8, 14, 0)) == poll_scheduler.ACTIVE_INTERVAL
+
+
+def test_quiet_day_backs_off_exponentially_up_to_cap():
+    from app.services import poll_scheduler
+    comp = _comp(date=date(2026, 1, 10))  # far in the past: no upcoming day to cap on
+    now = datetime(2026, 3, 1, 12, 0)
+    delays = []
+    for streak in range(0, 8):
+        comp.poll_quiet_streak = streak
+        delays.append(poll_scheduler.next_poll_delay(comp, now))
+    assert delays[0] == poll_scheduler.QUIET_INTERVAL
+    assert delays[1] == 2 * poll_scheduler.QUIET_INTERVAL
+    assert delays[-1] == poll_scheduler.MAX_INTERVAL
+    assert delays == sorted(delays)
+
+    comp.poll_quiet_streak = 10_000
+    assert poll_scheduler.next_poll_delay(comp, now) == poll_scheduler.MAX_INTERVAL
+
+
+def test_quiet_day_wakes_up_for_next_scheduled_day():
+    from app.services import poll_scheduler
+    comp = _comp(schedule_dates=["2026-03-08"], poll_quiet_streak=6)
+    now = datetime(2026, 3, 7, 23, 0)
+    assert poll_scheduler.next_poll_delay(comp, now) == timedelta(hours=1)
+
+
+def test_schedule_falls_back_to_competition_dates():
+    from app.services import poll_scheduler
+    comp = _comp(date=date(2026, 3, 7), date_end=date(2026, 3, 9))
+    assert poll_scheduler.is_active_day(comp, date(2026, 3, 8))
+    assert not poll_scheduler.is_active_day(comp, date(2026, 3, 10))
+
+
+def test_record_poll_tracks_quiet_streak_and_jitter():
+    import random
+    from app.services import poll_scheduler
+    comp = _comp(date=date(2026, 1, 10))
+    rng = random.Random(42)
+
+    t0 = datetime(2026, 3, 1, 12, 0)
+    poll_scheduler.record_poll(comp, t0, rng)
+    assert comp.poll_quiet_streak == 0
+    assert comp.last_polled_at == t0
+    low = t0 + poll_scheduler.QUIET_INTERVAL * (1 - poll_scheduler.POLL_JITTER)
+    high = t0 + poll_scheduler.QUIET_INTERVAL * (1 + poll_scheduler.POLL_JITTER)
+    assert low <= comp.next_poll_at <= high
+
+    # Nothing changed since the last poll: back off
+    t1 = comp.next_poll_at
+    poll_scheduler.record_poll(comp, t1, rng)
+    assert comp.poll_quiet_streak == 1
+
+    # The import found new results: back to the base interval
+    comp.last_change_at = t1 + timedelta(minutes=1)
+    poll_scheduler.record_poll(comp, comp.next_poll_at, rng)
+    assert comp.poll_quiet_streak == 0
+
+
+def test_stop_polling_after_quiet_period_once_schedule_is_over():
+    from app.services import poll_scheduler
+    comp = _comp(
+        schedule_dates=["2026-03-07", "2026-03-08"],
+        polling_activated_at=datetime(2026, 3, 1),
+        last_change_at=datetime(2026, 3, 8, 18, 0),
+    )
+    # Schedule not over yet
+    assert not poll_scheduler.should_stop_polling(comp, datetime(2026, 3, 8, 23, 0))
+    # Over, but changes were recent
+    assert not poll_scheduler.should_stop_polling(comp, datetime(2026, 3, 9, 12, 0))
+    # Over and quiet for longer than the stop period
+    later = datetime(2026, 3, 8, 18, 0) + poll_scheduler.STOP_AFTER + timedelta(minutes=1)
+    assert poll_scheduler.should_stop_polling(comp, later)
+
+
+def test_upcoming_competition_keeps_polling():
+    from app.services import poll_scheduler
+    comp = _comp(
+        schedule_dates=["2026-04-01"],
+        polling_activated_at=datetime(2026, 1, 1),
+    )
+    assert not poll_scheduler.should_stop_polling(comp, datetime(2026, 3, 1))
+
+
+@pytest.mark.asyncio
+async def test_poll_due_competitions_only_submits_due_ones(db_session: AsyncSession):
+    from app.main import _poll_due_competitions
+    from app.models.job import Job
+    from app.services.job_queue import job_queue
+    job_queue.set_session_factory(lambda: db_session, owns_session=False)
+
+    now = datetime(2026, 3, 8, 12, 0)
+    due = _comp(polling_enabled=True, schedule_dates=["2026-03-08"])
+    due.url += "?due"
+    later = _comp(polling_enabled=True, schedule_dates=["2026-03-08"], next_poll_at=now + timedelta(minutes=3))
+    later.url += "?later"
+    db_session.add_all([due, later])
+    await db_session.commit()
+
+    assert await _poll_due_competitions(db_session, now) == 1
+    jobs = (await db_session.execute(select(Job))).scalars().all()
+    assert {(j.competition_id, j.type) for j in jobs} == {(due.id, "import"), (due.id, "enrich")}
+    await db_session.refresh(due)
+    assert due.last_polled_at == now
+    assert now < due.next_poll_at <= now + timedelta(minutes=6)
+
+
+def _seg_event(url, *, fetched=True, finished=True, fingerprint="abc", pdf_url="p.pdf"):
+    from app.services.site_scraper import ScrapedEvent
+    return ScrapedEvent(
+        category="R1", segment="Free Skating", seg_url=url, pdf_url=pdf_url,
+        fetched=fetched, finished=finished, fingerprint=fingerprint,
+    )
+
+
+def test_segment_finished_only_when_unchanged_between_polls():
+    from app.services.import_service import _update_segment_status, _finished_segment_urls
+
+    status = _update_segment_status(None, [_seg_event("SEG1"), _seg_event("SEG2", finished=False)])
+    # First sighting: complete-looking but not yet confirmed unchanged
+    assert _finished_segment_urls(status) == set()
+
+    status = _update_segment_status(status, [_seg_event("SEG1"), _seg_event("SEG2", finished=False)])
+    assert _finished_segment_urls(status) == {"SEG1"}
+
+    # A changed score sheet resets the segment
+    status = _update_segment_status(status, [_seg_event("SEG1", fingerprint="def")])
+    assert _finished_segment_urls(status) == set()
+
+
+def test_segment_status_keeps_skipped_and_drops_removed_segments():
+    from app.services.import_service import _update_segment_status
+
+    previous = {
+        "SEG1": {"fingerprint": "abc", "pdf_url": "p.pdf", "finished": True},
+        "SEG9": {"fingerprint": "xyz", "pdf_url": None, "finished": False},
+    }
+    status = _update_segment_status(previous, [_seg_event("SEG1", fetched=False, fingerprint=None)])
+    assert status == {"SEG1": previous["SEG1"]}
@@ -0,0 +1,135 @@
+"""EXPLAIN QUERY PLAN checks: the analytical access paths must stay index-driven.
+
+The statements mirror the filters used by the dashboard, stats and skater
+routes. A full table scan of a large table on one of these paths means an
+index is missing or a filter no longer matches its index expression.
+"""
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects import sqlite
+
+from app.models.category_result import CategoryResult
+from app.models.competition import Competition
+from app.models.score import Score
+from app.models.score_element import ScoreElement
+from app.models.skater import Skater
+from app.services.club_key import club_filter
+
+pytestmark = pytest.mark.sqlite_only
+
+
+async def _plan(session, stmt) -> list[str]:
+    sql = str(stmt.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}))
+    rows = (await session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))).all()
+    return [row[3] for row in rows]
+
+
+def _assert_no_full_scan(plan: list[str], *tables: str) -> None:
+    for detail in plan:
+        for table in tables:
+            assert not detail.startswith(f"SCAN {table}"), plan
+
+
+def _assert_uses(plan: list[str], index: str) -> None:
+    assert any(index in detail for detail in plan), plan
+
+
+async def test_skater_scores_use_skater_index(db_session):
+    stmt = (
+        select(Score)
+        .join(Score.competition)
+        .where(Score.skater_id == 42)
+        .order_by(Competition.date)
+    )
+    plan = await _plan(db_session, stmt)
+    _assert_uses(plan, "ix_scores_skater_competition")
+    _assert_no_full_scan(plan, "scores")
+
+
+async def test_skater_category_results_use_skater_index(db_session):
+    stmt = select(CategoryResult).where(CategoryResult.skater_id == 42)
+    plan = await _plan(db_session, stmt)
+    _assert_uses(plan, "ix_category_results_skater_competition")
+
+
+async def test_club_score_filter_uses_club_key_index(db_session):
+    # Dashboard / skaters list: skaters who ever scored for the club
+    stmt = select(Score.skater_id).where(club_filter("CSG", Score.club_key))
+    plan = await _plan(db_session, stmt)
+    _assert_uses(plan, "ix_scores_club_key")
+    _assert_no_full_scan(plan, "scores")
+
+
+async def test_club_skater_filter_uses_club_key_index(db_session):
+    plan = await _plan(db_session, select(Skater).where(club_filter("CSG", Skater.club_key)))
+    _assert_uses(plan, "ix_skaters_club_key")
+    _assert_no_full_scan(plan, "skaters")
+
+
+async def test_stats_level_filter_is_index_driven(db_session):
+    # progression-ranking with level / age / gender filters
+    stmt = (
+        select(CategoryResult)
+        .join(CategoryResult.competition)
+        .join(CategoryResult.skater)
+        .where(
+            CategoryResult.combined_total.isnot(None),
+            Competition.season == "2025-2026",
+            CategoryResult.skating_level == "R1",
+            CategoryResult.age_group == "Novice",
+            CategoryResult.gender == "F",
+        )
+        .order_by(Competition.date.asc())
+    )
+    plan = await _plan(db_session, stmt)
+    _assert_no_full_scan(plan, "category_results", "scores")
+
+
+async def test_season_filter_uses_competition_index(db_session):
+    stmt = select(Competition).where(Competition.season == "2025-2026").order_by(Competition.date)
+    plan = await _plan(db_session, stmt)
+    _assert_uses(plan, "ix_competitions_season_date")
+    _assert_no_full_scan(plan, "competitions")
+
+
+async def test_dashboard_season_scores_are_index_driven(db_session):
+    stmt = (
+        select(Score)
+        .join(Score.skater)
+        .join(Score.competition)
+        .where(
+            Competition.season == "2025-2026",
+            club_filter("CSG", Score.club_key, Skater.club_key),
+        )
+    )
+    plan = await _plan(db_session, stmt)
+    _assert_no_full_scan(plan, "scores", "skaters")
+
+
+async def test_element_mastery_reaches_elements_through_club_scores(db_session):
+    # Without statistics, an element_type index would be read for every jump ever recorded
+    stmt = (
+        select(ScoreElement.base_code, func.count())
+        .join(ScoreElement.parent)
+        .join(Score.competition)
+        .join(Score.skater)
+        .where(
+            ScoreElement.element_type == "jump",
+            Competition.season == "2025-2026",
+            club_filter("CSG", Skater.club_key),
+        )
+        .group_by(ScoreElement.base_code)
+    )
+    plan = await _plan(db_session, stmt)
+    _assert_uses(plan, "ix_skaters_club_key")
+    _assert_no_full_scan(plan, "score_elements", "scores")
+    assert not any(detail.startswith("SEARCH score_elements USING INDEX ix_") for detail in plan), plan
+
+
+async def test_scores_count_reads_an_index_only(db_session):
+    # X-Total-Count of /api/scores and /api/scores/category-results
+    for model in (Score, CategoryResult):
+        stmt = select(func.count()).select_from(model).where(model.competition_id == 42)
+        plan = await _plan(db_session, stmt)
+        _assert_uses(plan, "COVERING INDEX")
@@ -2,6 +2,7 @@ import pytest
 import sys
 from datetime import date
 from unittest.mock import MagicMock, patch
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.competition import Competition
@@ -10,6 +11,7 @@ from app.models.score import Score
 from app.models.category_result import CategoryResult
 from app.models.app_settings import AppSettings
 from app.services.report_data import get_skater_report_data, get_club_report_data
+from app.services.season_summary import refresh_season_summaries
 
 
 @pytest.fixture(autouse=True)
@@ -128,6 +130,7 @@ async def _seed_club_data(session: AsyncSession):
         CategoryResult(competition_id=comp1.id, skater_id=s2.id, category="Junior Messieurs",
                        overall_rank=3, combined_total=45.0, segment_count=1),
     ])
+    await refresh_season_summaries(session, [s1.id, s2.id, s3.id])
     await session.commit()
     return s1, s2
 
@@ -155,6 +158,26 @@ async def test_club_report_data(db_session: AsyncSession):
     assert data.most_improved[0]["delta"] == 8.0
 
 
+@pytest.mark.asyncio
+async def test_club_report_data_selects_columns_only(db_session: AsyncSession):
+    await _seed_club_data(db_session)
+    db_session.expunge_all()
+    loaded: list[type] = []
+    event.listen(db_session.sync_session, "loaded_as_persistent",
+                 lambda _session, obj: loaded.append(type(obj)))
+
+    data = await get_club_report_data("2025-2026", db_session)
+
+    assert [(m["skater_name"], m["competition_name"], m["rank"]) for m in data.medals] in (
+        [("Alice DUPONT", "CSNPA Automne", 1), ("Bob MARTIN", "CSNPA Automne", 3),
+         ("Alice DUPONT", "Coupe Régionale", 1)],
+        [("Bob MARTIN", "CSNPA Automne", 3), ("Alice DUPONT", "CSNPA Automne", 1),
+         ("Alice DUPONT", "Coupe Régionale", 1)],
+    )
+    # Only the settings row is loaded as an entity
+    assert loaded == [AppSettings]
+
+
 @pytest.mark.asyncio
 async def test_skater_pdf_endpoint(client, admin_token, db_session):
     skater = await _seed_skater_data(db_session)
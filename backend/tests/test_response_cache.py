@@ -0,0 +1,136 @@
+from datetime import date
+
+from app.config import CLUB_SHORT
+from app.models.competition import Competition
+from app.models.score import Score
+from app.models.skater import Skater
+from app.services.response_cache import ResponseCache, bump_data_version, response_cache
+
+
+def _auth(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def test_cache_counts_hits_and_misses(db_session):
+    cache = ResponseCache(max_entries=4)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return {"value": len(calls)}
+
+    first = await cache.get_or_compute(db_session, "route", {"season": "2025-2026"}, compute)
+    second = await cache.get_or_compute(db_session, "route", {"season": "2025-2026"}, compute)
+    other = await cache.get_or_compute(db_session, "route", {"season": "2024-2025"}, compute)
+
+    assert first == second == {"value": 1}
+    assert other == {"value": 2}
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+async def test_bump_invalidates_cached_entries(db_session):
+    cache = ResponseCache(max_entries=4)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert await cache.get_or_compute(db_session, "route", {}, compute) == 1
+    await bump_data_version(db_session)
+    await db_session.commit()
+
+    assert await cache.get_or_compute(db_session, "route", {}, compute) == 2
+    assert await cache.get_or_compute(db_session, "route", {}, compute) == 2
+    assert cache.stats()["entries"] == 1
+
+
+async def test_least_recently_used_entry_is_evicted(db_session):
+    cache = ResponseCache(max_entries=2)
+
+    async def compute():
+        return object()
+
+    a = await cache.get_or_compute(db_session, "route", {"k": "a"}, compute)
+    await cache.get_or_compute(db_session, "route", {"k": "b"}, compute)
+    await cache.get_or_compute(db_session, "route", {"k": "a"}, compute)  # "a" is now the newest
+    await cache.get_or_compute(db_session, "route", {"k": "c"}, compute)  # evicts "b"
+
+    assert cache.stats()["entries"] == 2
+    assert await cache.get_or_compute(db_session, "route", {"k": "a"}, compute) is a
+    misses = cache.misses
+    await cache.get_or_compute(db_session, "route", {"k": "b"}, compute)
+    assert cache.misses == misses + 1
+
+
+async def test_dashboard_is_served_from_cache_until_an_import(client, db_session, admin_token):
+    skater = Skater(first_name="Alice", last_name="DUPONT", club=CLUB_SHORT)
+    comp = Competition(name="Automne", url="http://c/1", date=date(2025, 10, 15), season="2025-2026")
+    db_session.add_all([skater, comp])
+    await db_session.commit()
+
+    resp = await client.get("/api/dashboard/", headers=_auth(admin_token))
+    assert resp.json()["total_programs"] == 0
+
+    db_session.add(Score(competition_id=comp.id, skater_id=skater.id, segment="FS",
+                         category="R2 Novice Femme", club=CLUB_SHORT, total_score=50.0))
+    await db_session.commit()
+    resp = await client.get("/api/dashboard/", headers=_auth(admin_token))
+    assert resp.json()["total_programs"] == 0
+
+    # Imports bump the version in the transaction that writes the scores
+    await bump_data_version(db_session)
+    await db_session.commit()
+    resp = await client.get("/api/dashboard/", headers=_auth(admin_token))
+    assert resp.json()["total_programs"] == 1
+
+
+async def test_admin_can_read_and_flush_cache(client, db_session, admin_token):
+    hits, misses = response_cache.hits, response_cache.misses
+    await client.get("/api/dashboard/", headers=_auth(admin_token))
+    await client.get("/api/dashboard/", headers=_auth(admin_token))
+
+    resp = await client.get("/api/admin/cache", headers=_auth(admin_token))
+    assert resp.status_code == 200
+    assert resp.json()["entries"] == 1
+    assert (resp.json()["hits"], resp.json()["misses"]) == (hits + 1, misses + 1)
+    assert resp.json()["single_flight"]["in_flight"] == 0
+
+    resp = await client.post("/api/admin/cache/flush", headers=_auth(admin_token))
+    assert resp.status_code == 201
+    assert resp.json()["entries"] == 0
+
+    await client.get("/api/dashboard/", headers=_auth(admin_token))
+    assert response_cache.misses == misses + 2
+
+
+async def test_cache_endpoints_are_admin_only(client, reader_token):
+    resp = await client.get("/api/admin/cache", headers=_auth(reader_token))
+    assert resp.status_code == 403
+    resp = await client.post("/api/admin/cache/flush", headers=_auth(reader_token))
+    assert resp.status_code == 403
+
+
+async def test_import_bumps_version_only_when_results_change(db_session, monkeypatch):
+    from app.services import import_service
+    from app.services.response_cache import current_data_version
+    from app.services.site_scraper import ScrapedCompetitionInfo, ScrapedResult
+
+    comp = Competition(name="Comp", url="http://test/import", date=date(2025, 11, 1), season="2025-2026")
+    db_session.add(comp)
+    await db_session.commit()
+
+    class _Scraper:
+        async def scrape(self, url, **kwargs):
+            results = [ScrapedResult(name="Léa MARTIN", category="R1 Junior Femme", segment="FS",
+                                     rank=1, total_score=61.5)]
+            return [], results, [], ScrapedCompetitionInfo(), ""
+
+    monkeypatch.setattr(import_service, "get_scraper", lambda url: _Scraper())
+    await import_service.run_import(db_session, comp.id)
+    version = await current_data_version(db_session)
+    assert version is not None
+
+    # A poll that finds the same results leaves cached responses valid
+    await import_service.run_import(db_session, comp.id)
+    assert await current_data_version(db_session) == version
@@ -0,0 +1,75 @@
+from datetime import date
+
+from sqlalchemy import select
+
+from app.models.competition import Competition
+from app.models.score_distribution import ScoreDistribution
+from app.services.score_distribution import COMBINED, histogram, percentile_rank, quartiles
+
+
+async def _distributions(db_session) -> dict:
+    rows = (await db_session.execute(select(ScoreDistribution))).scalars().all()
+    return {(row.season, row.skating_level, row.segment): row.sorted_values for row in rows}
+
+
+async def _import(db_session, monkeypatch, comp, results, cat_results):
+    from app.services import import_service
+    from app.services.site_scraper import ScrapedCompetitionInfo
+
+    class _Scraper:
+        async def scrape(self, url, **kwargs):
+            return [], results, cat_results, ScrapedCompetitionInfo(), ""
+
+    monkeypatch.setattr(import_service, "get_scraper", lambda url: _Scraper())
+    await import_service.run_import(db_session, comp.id)
+
+
+async def test_import_season_edit_and_delete_keep_distributions_current(
+    client, db_session, admin_token, monkeypatch
+):
+    from app.services.site_scraper import ScrapedCategoryResult, ScrapedResult
+
+    comp = Competition(name="Comp", url="http://test/import", date=date(2025, 11, 1),
+                       season="2025-2026", metadata_confirmed=True)
+    db_session.add(comp)
+    await db_session.commit()
+    await _import(db_session, monkeypatch, comp, [
+        ScrapedResult(name="Léa MARTIN", category="R1 Junior Femme", segment="FS", rank=1, total_score=61.5),
+        ScrapedResult(name="Zoé PETIT", category="R1 Junior Femme", segment="FS", rank=2, total_score=55.0),
+    ], [
+        ScrapedCategoryResult(name="Léa MARTIN", category="R1 Junior Femme", overall_rank=1, combined_total=61.5),
+    ])
+    assert await _distributions(db_session) == {
+        ("2025-2026", "R1", "FS"): [55.0, 61.5],
+        ("2025-2026", "R1", COMBINED): [61.5],
+    }
+
+    # A poll updating a combined total, without any new row
+    await _import(db_session, monkeypatch, comp, [], [
+        ScrapedCategoryResult(name="Léa MARTIN", category="R1 Junior Femme", overall_rank=1, combined_total=63.0),
+    ])
+    assert (await _distributions(db_session))[("2025-2026", "R1", COMBINED)] == [63.0]
+
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    resp = await client.patch(f"/api/competitions/{comp.id}", json={"season": "2024-2025"}, headers=headers)
+    assert resp.status_code == 200
+    assert set(await _distributions(db_session)) == {("2024-2025", "R1", "FS"), ("2024-2025", "R1", COMBINED)}
+
+    resp = await client.delete(f"/api/competitions/{comp.id}", headers=headers)
+    assert resp.status_code == 204
+    assert await _distributions(db_session) == {}
+
+
+def test_quartiles_match_statistics_quantiles():
+    assert quartiles([20.0, 25.0, 28.0, 30.0, 33.0]) == {
+        "data_points": 5, "min": 20.0, "max": 33.0, "median": 28.0, "p25": 22.5, "p75": 31.5,
+    }
+    assert quartiles([40.0])["p25"] == 40.0
+    assert quartiles([])["median"] is None
+
+
+def test_percentile_rank_and_histogram_edges():
+    assert percentile_rank([], 10.0) is None
+    assert percentile_rank([10.0, 20.0], 5.0) == 0.0
+    assert percentile_rank([10.0, 20.0], 25.0) == 100.0
+    assert histogram([30.0, 30.0], 5) == [{"lower": 30.0, "upper": 30.0, "count": 2}]
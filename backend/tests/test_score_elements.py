@@ -0,0 +1,148 @@
+from datetime import date
+
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.competition import Competition
+from app.models.score import Score
+from app.models.score_element import ScoreElement
+from app.models.skater import Skater
+from app.services.report_data import get_skater_report_data
+from app.services.score_elements import MARKER_BITS, element_rows, replace_score_elements
+
+
+def _el(name, goe, markers=(), judges=(0, 0, 0)):
+    return {"name": name, "base_value": 1.0, "goe": goe, "score": 1.0 + goe,
+            "markers": list(markers), "judge_goe": list(judges)}
+
+
+def test_element_rows_classifies_each_element():
+    rows = element_rows([
+        _el("3Lz", 0.5, markers=["<"]),
+        _el("2S+1T", -0.2, markers=["<", "+"]),
+        _el("CCoSp4", 1.0),
+        _el("StSqB", 0.0),
+        _el("ChSq1", 0.3),
+        {"name": "", "goe": 0},
+    ])
+    assert [(r["position"], r["element_type"], r["base_code"], r["level"]) for r in rows] == [
+        (1, "jump", "3Lz", 0),
+        (2, "jump", "2S", 0),
+        (3, "spin", "CCoSp", 4),
+        (4, "step", "StSq", 0.5),
+        (5, "step", "ChSq", 1),
+    ]
+    assert rows[0]["markers_mask"] == MARKER_BITS["<"]
+    assert rows[1]["markers"] == ["<", "+"]
+
+
+def test_element_rows_accepts_wrapped_and_legacy_keys():
+    rows = element_rows({"elements": [{"name": "2A", "goe": 0.4, "judges": [1, 0, 1], "total": 3.7}]})
+    assert rows[0]["judge_goe"] == [1, 0, 1]
+    assert rows[0]["score"] == 3.7
+    assert element_rows(None) == []
+
+
+@pytest_asyncio.fixture
+async def enriched_score(db_session: AsyncSession):
+    comp = Competition(name="Comp", url="http://test/c", date=date(2025, 11, 1), season="2025-2026")
+    skater = Skater(first_name="Léa", last_name="MARTIN")
+    db_session.add_all([comp, skater])
+    await db_session.flush()
+    score = Score(
+        competition_id=comp.id, skater_id=skater.id, segment="FS", category="R1 Novice Femme",
+        elements=[_el("2A", 0.5), _el("3T", -1.0, markers=["q"]), _el("2A", 0.3), _el("FSSp3", 0.2)],
+    )
+    db_session.add(score)
+    await db_session.flush()
+    await replace_score_elements(db_session, score)
+    await db_session.commit()
+    return score
+
+
+async def _count(db_session, score_id) -> int:
+    return (await db_session.execute(
+        select(func.count()).select_from(ScoreElement).where(ScoreElement.score_id == score_id)
+    )).scalar()
+
+
+async def test_replace_score_elements_rewrites_rows(db_session, enriched_score):
+    enriched_score.elements = [_el("2Lz", 0.1)]
+    await replace_score_elements(db_session, enriched_score)
+    await db_session.commit()
+    codes = (await db_session.execute(
+        select(ScoreElement.code).where(ScoreElement.score_id == enriched_score.id)
+    )).scalars().all()
+    assert codes == ["2Lz"]
+
+
+async def test_deleting_score_deletes_its_elements(db_session, enriched_score):
+    await db_session.delete(enriched_score)
+    await db_session.commit()
+    assert await _count(db_session, enriched_score.id) == 0
+
+
+async def test_skater_elements_endpoints(client: AsyncClient, admin_token: str, enriched_score):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    resp = await client.get(f"/api/skaters/{enriched_score.skater_id}/elements", headers=headers)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [e["element_name"] for e in data] == ["2A", "3T", "2A", "FSSp3"]
+    assert data[1]["markers"] == ["q"]
+    assert data[1]["judges"] == [0, 0, 0]
+    assert data[0]["competition_name"] == "Comp"
+
+    resp = await client.get(
+        f"/api/skaters/{enriched_score.skater_id}/elements", params={"element_type": "2a"}, headers=headers,
+    )
+    assert [e["goe"] for e in resp.json()] == [0.5, 0.3]
+
+    resp = await client.get(f"/api/skaters/{enriched_score.skater_id}/element-names", headers=headers)
+    assert resp.json() == ["2A", "3T", "FSSp3"]
+
+
+async def test_report_element_summary(db_session, enriched_score):
+    data = await get_skater_report_data(enriched_score.skater_id, "2025-2026", db_session)
+    summary = data.element_summary
+    assert summary.total_elements_tracked == 4
+    assert summary.most_attempted[0].name == "2A"
+    assert summary.most_attempted[0].attempts == 2
+    assert [s.name for s in summary.best_goe] == ["2A"]
+    assert summary.best_goe[0].avg_goe == 0.4
+
+
+async def test_run_enrich_fills_score_elements(db_session, monkeypatch):
+    from app.services import import_service
+    from app.services.site_scraper import ScrapedEvent
+
+    comp = Competition(name="Comp", url="http://test/enrich", date=date(2025, 11, 1), season="2025-2026")
+    skater = Skater(first_name="Léa", last_name="MARTIN")
+    db_session.add_all([comp, skater])
+    await db_session.flush()
+    db_session.add(Score(competition_id=comp.id, skater_id=skater.id, segment="FS", category="R1"))
+    await db_session.commit()
+
+    class _Scraper:
+        async def scrape(self, url, **kwargs):
+            return [ScrapedEvent(category="R1", segment="Free Skating", pdf_url="p.pdf")], [], [], [], None
+
+    async def _download(urls, slug):
+        return ["p.pdf"]
+
+    monkeypatch.setattr(import_service, "get_scraper", lambda url: _Scraper())
+    monkeypatch.setattr(import_service, "download_pdfs", _download)
+    monkeypatch.setattr(import_service, "parse_elements", lambda path: [{
+        "skater_name": "Léa MARTIN",
+        "category_segment": None,
+        "elements": [_el("2A", 0.5), _el("CCoSp4", 1.0)],
+    }])
+
+    result = await import_service.run_enrich(db_session, comp.id)
+
+    assert result["scores_enriched"] == 1
+    rows = (await db_session.execute(
+        select(ScoreElement.code, ScoreElement.element_type).order_by(ScoreElement.position)
+    )).all()
+    assert [tuple(r) for r in rows] == [("2A", "jump"), ("CCoSp4", "spin")]
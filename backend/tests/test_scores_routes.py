@@ -0,0 +1,106 @@
+from datetime import date
+
+import pytest_asyncio
+from httpx import AsyncClient
+
+from app.models.category_result import CategoryResult
+from app.models.competition import Competition
+from app.models.score import Score
+from app.models.skater import Skater
+
+
+def _auth(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest_asyncio.fixture
+async def results(db_session):
+    """Two competitions, four skaters each with SP and FS scores, one unranked."""
+    comps = [
+        Competition(name=f"Comp {i}", url=f"http://test/scores/{i}", date=date(2025, 11, i + 1),
+                    season="2025-2026")
+        for i in range(2)
+    ]
+    skaters = [Skater(first_name=f"S{i}", last_name="TEST", club="CSG") for i in range(4)]
+    db_session.add_all([*comps, *skaters])
+    await db_session.flush()
+    for comp in comps:
+        for i, skater in enumerate(skaters):
+            rank = None if i == 0 else i
+            for segment in ("FS", "SP"):
+                db_session.add(Score(
+                    competition_id=comp.id, skater_id=skater.id, segment=segment,
+                    category="R2 Novice Femme", rank=rank, total_score=40.0 - i,
+                    elements=[{"name": "2A"}], components={"Composition": 2.5},
+                ))
+            db_session.add(CategoryResult(
+                competition_id=comp.id, skater_id=skater.id, category="R2 Novice Femme",
+                overall_rank=rank, combined_total=80.0 - i, segment_count=2,
+            ))
+    await db_session.commit()
+    return comps
+
+
+async def _walk(client, token, path, **params) -> list[dict]:
+    items, cursor = [], None
+    while True:
+        resp = await client.get(path, params={**params, **({"cursor": cursor} if cursor else {})},
+                                headers=_auth(token))
+        assert resp.status_code == 200
+        page = resp.json()
+        items += page["items"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return items
+
+
+async def test_scores_pages_follow_the_listing_order(client: AsyncClient, admin_token, results):
+    resp = await client.get("/api/scores/", headers=_auth(admin_token))
+    everything = resp.json()
+    assert resp.headers["x-total-count"] == "16"
+    assert everything["next_cursor"] is None
+
+    # Competition, segment, rank with unranked scores last, then id
+    keys = [(s["competition_id"], s["segment"], s["rank"]) for s in everything["items"]]
+    assert keys[:4] == [(results[0].id, "FS", rank) for rank in (1, 2, 3, None)]
+
+    paged = await _walk(client, admin_token, "/api/scores/", limit=3)
+    assert [s["id"] for s in paged] == [s["id"] for s in everything["items"]]
+
+    resp = await client.get("/api/scores/", params={"competition_id": results[1].id, "segment": "sp",
+                                                    "limit": 2}, headers=_auth(admin_token))
+    assert resp.headers["x-total-count"] == "4"
+    assert len(resp.json()["items"]) == 2
+
+
+async def test_scores_fields(client: AsyncClient, admin_token, results):
+    headers = _auth(admin_token)
+    default = (await client.get("/api/scores/", params={"limit": 1}, headers=headers)).json()["items"][0]
+    assert "elements" not in default and "components" not in default
+    assert default["skater_club"] == "CSG"
+    assert default["competition_date"] == "2025-11-01"
+
+    resp = await client.get("/api/scores/", params={"limit": 1, "fields": "id, rank,elements"}, headers=headers)
+    assert list(resp.json()["items"][0]) == ["id", "rank", "elements"]
+    assert resp.json()["items"][0]["elements"] == [{"name": "2A"}]
+
+    resp = await client.get("/api/scores/", params={"fields": "id,password"}, headers=headers)
+    assert resp.status_code == 400
+
+
+async def test_invalid_page_parameters(client: AsyncClient, admin_token, results):
+    headers = _auth(admin_token)
+    for params in ({"cursor": "not-a-cursor"}, {"cursor": "WzEsMl0"}, {"limit": 0}, {"limit": 1001}):
+        resp = await client.get("/api/scores/", params=params, headers=headers)
+        assert resp.status_code == 400, params
+
+
+async def test_category_results_pages(client: AsyncClient, admin_token, results):
+    paged = await _walk(client, admin_token, "/api/scores/category-results",
+                        competition_id=results[0].id, limit=3)
+    assert [r["overall_rank"] for r in paged] == [1, 2, 3, None]
+
+    resp = await client.get("/api/scores/category-results", params={"fields": "id,combined_total"},
+                            headers=_auth(admin_token))
+    assert resp.headers["x-total-count"] == "8"
+    assert set(resp.json()["items"][0]) == {"id", "combined_total"}
@@ -0,0 +1,10 @@
+import pytest
+
+from app.services.scrapers.isu import ISUScraper
+from app.services.scrapers.swiss_timing import SwissTimingScraper
+
+
+@pytest.mark.parametrize("scraper_cls", [ISUScraper, SwissTimingScraper])
+async def test_stub_scrapers_accept_the_base_signature(scraper_cls):
+    with pytest.raises(NotImplementedError):
+        await scraper_cls().scrape("http://example.com", skip_seg_urls={"seg.htm"}, index_only=True)
@@ -0,0 +1,155 @@
+from datetime import date
+
+from sqlalchemy import select
+
+from app.models.category_result import CategoryResult
+from app.models.competition import Competition
+from app.models.score import Score
+from app.models.skater import Skater
+from app.models.skater_season_summary import SkaterSeasonSummary
+from app.services.season_summary import refresh_season_summaries
+
+
+async def _seed(db_session):
+    skater = Skater(first_name="Alice", last_name="DUPONT", club="CSG")
+    db_session.add(skater)
+    comps = [
+        Competition(name="Automne", url="http://c/1", date=date(2025, 10, 15), season="2025-2026"),
+        Competition(name="Hiver", url="http://c/2", date=date(2026, 1, 20), season="2025-2026"),
+        Competition(name="Open", url="http://c/3", date=date(2026, 2, 1), season="2025-2026"),
+    ]
+    db_session.add_all(comps)
+    await db_session.flush()
+    common = dict(skater_id=skater.id, category="R2 Novice Femme", club="CSG",
+                  skating_level="R2", age_group="Novice", gender="Femme")
+    db_session.add_all([
+        Score(competition_id=comps[0].id, segment="SP", total_score=30.0, technical_score=18.0,
+              component_score=12.0, **common),
+        Score(competition_id=comps[0].id, segment="FS", total_score=50.0, technical_score=27.0,
+              component_score=23.0, **common),
+        Score(competition_id=comps[1].id, segment="SP", total_score=34.0, technical_score=21.0,
+              component_score=13.0, **common),
+        Score(competition_id=comps[1].id, segment="FS", total_score=48.0, technical_score=25.0,
+              component_score=23.0, **common),
+        # No category result for this one: its segment total counts as a result
+        Score(competition_id=comps[2].id, segment="FS", total_score=90.0, technical_score=50.0,
+              component_score=40.0, **common),
+        CategoryResult(competition_id=comps[0].id, overall_rank=2, combined_total=80.0,
+                       segment_count=2, **common),
+        CategoryResult(competition_id=comps[1].id, overall_rank=4, combined_total=82.0,
+                       segment_count=2, **common),
+    ])
+    await db_session.flush()
+    return skater, comps
+
+
+async def _summaries(db_session, skater_id):
+    return (await db_session.execute(
+        select(SkaterSeasonSummary).where(SkaterSeasonSummary.skater_id == skater_id)
+    )).scalars().all()
+
+
+async def test_refresh_builds_season_totals(db_session):
+    skater, _ = await _seed(db_session)
+
+    assert await refresh_season_summaries(db_session, [skater.id]) == 1
+    await db_session.commit()
+
+    [summary] = await _summaries(db_session, skater.id)
+    assert (summary.season, summary.skating_level, summary.club_key) == ("2025-2026", "R2", "csg")
+    assert summary.competitions_entered == 3
+    assert summary.programs == 5
+    assert summary.podiums == 1
+    assert summary.results_count == 2
+    assert (summary.first_tss, summary.first_date) == (80.0, date(2025, 10, 15))
+    assert (summary.last_tss, summary.last_date) == (82.0, date(2026, 1, 20))
+    assert summary.best_total == 90.0
+    assert (summary.best_tss, summary.best_tes, summary.best_pcs) == (90.0, 50.0, 40.0)
+    assert summary.segment_bests["SP"] == {
+        "tss": 34.0, "tes": 21.0, "pcs": 13.0, "competition": "Hiver", "date": "2026-01-20",
+    }
+    assert summary.progression == [
+        {"date": "2025-10-15", "value": 80.0},
+        {"date": "2026-01-20", "value": 82.0},
+    ]
+
+
+async def test_refresh_drops_rows_of_skaters_without_results(db_session):
+    skater, comps = await _seed(db_session)
+    await refresh_season_summaries(db_session, [skater.id])
+    await db_session.commit()
+
+    for comp in comps:
+        await db_session.delete(comp)
+    await refresh_season_summaries(db_session, [skater.id])
+    await db_session.commit()
+
+    assert await _summaries(db_session, skater.id) == []
+
+
+async def test_import_refreshes_touched_skaters(db_session, monkeypatch):
+    from app.services import import_service
+    from app.services.site_scraper import ScrapedCategoryResult, ScrapedCompetitionInfo, ScrapedResult
+
+    comp = Competition(name="Comp", url="http://test/import", date=date(2025, 11, 1), season="2025-2026")
+    db_session.add(comp)
+    await db_session.commit()
+
+    class _Scraper:
+        async def scrape(self, url, **kwargs):
+            results = [ScrapedResult(name="Léa MARTIN", category="R1 Junior Femme", segment="FS",
+                                     rank=1, total_score=61.5)]
+            cat_results = [ScrapedCategoryResult(name="Léa MARTIN", category="R1 Junior Femme",
+                                                 overall_rank=1, combined_total=61.5)]
+            return [], results, cat_results, ScrapedCompetitionInfo(), ""
+
+    monkeypatch.setattr(import_service, "get_scraper", lambda url: _Scraper())
+    await import_service.run_import(db_session, comp.id)
+
+    [summary] = (await db_session.execute(select(SkaterSeasonSummary))).scalars().all()
+    assert (summary.programs, summary.podiums, summary.last_tss) == (1, 1, 61.5)
+
+
+async def test_merge_moves_summaries_to_target(client, db_session, admin_token):
+    skater, _ = await _seed(db_session)
+    target = Skater(first_name="Alice", last_name="DUPONT-X")
+    db_session.add(target)
+    await db_session.flush()
+    await refresh_season_summaries(db_session, [skater.id])
+    await db_session.commit()
+    target_id, source_id = target.id, skater.id
+
+    resp = await client.post(
+        "/api/skaters/merge",
+        json={"target_id": target_id, "source_ids": [source_id]},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert resp.status_code == 200
+
+    assert await _summaries(db_session, source_id) == []
+    [summary] = await _summaries(db_session, target_id)
+    assert summary.programs == 5
+
+
+async def test_season_summary_endpoint(client, db_session, admin_token):
+    skater, _ = await _seed(db_session)
+    await refresh_season_summaries(db_session, [skater.id])
+    await db_session.commit()
+
+    resp = await client.get(
+        f"/api/skaters/{skater.id}/season-summary",
+        params={"season": "2025-2026"},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["competitions_entered"] == 3
+    assert data["best_total"] == 90.0
+    assert (data["first_tss"], data["last_tss"]) == (80.0, 82.0)
+
+    resp = await client.get(
+        f"/api/skaters/{skater.id}/season-summary",
+        params={"season": "2019-2020"},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert resp.json()["best_total"] is None
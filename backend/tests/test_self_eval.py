@@ -32,7 +32,7 @@ async def test_upsert_program_skater(client, skater_token, skater_user_with_skat
 
 async def test_upsert_program_updates_existing(client, skater_token, skater_user_with_skater):
     _, _, skater = skater_user_with_skater
-    await client.put(
+    first = await client.put(
         "/api/training/programs",
         json={"skater_id": skater.id, "segment": "SP", "elements": ["2A"]},
         headers={"Authorization": f"Bearer {skater_token}"},
@@ -44,6 +44,7 @@ async def test_upsert_program_updates_existing(client, skater_token, skater_user
     )
     assert resp.status_code == 200
     assert resp.json()["elements"] == ["2A", "3F"]
+    assert resp.json()["id"] == first.json()["id"]
 
 
 async def test_list_programs(client, skater_token, skater_user_with_skater):
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from app.services.single_flight import SingleFlight
+
+
+async def test_concurrent_calls_share_one_computation():
+    flight = SingleFlight()
+    release = asyncio.Event()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await release.wait()
+        return {"value": 42}
+
+    tasks = [asyncio.create_task(flight.run("dashboard", "2025-2026", compute)) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert flight.stats()["in_flight"] == 1
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == [1]
+    assert all(result is results[0] for result in results)
+    stats = flight.stats()
+    assert (stats["computations"], stats["coalesced"], stats["peak_waiters"]) == (1, 2, 2)
+    assert stats["coalesced_by_route"] == {"dashboard": 2}
+    assert stats["in_flight"] == 0
+
+
+async def test_distinct_keys_and_later_calls_compute_again():
+    flight = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0)
+        return object()
+
+    a, b = await asyncio.gather(flight.run("stats", 1, compute), flight.run("stats", 2, compute))
+    later = await flight.run("stats", 1, compute)
+
+    assert a is not b and later is not a
+    assert (flight.computations, flight.coalesced) == (3, 0)
+
+
+async def test_leader_error_is_raised_in_waiters():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def compute():
+        await release.wait()
+        raise ValueError("boom")
+
+    tasks = [asyncio.create_task(flight.run("stats", "k", compute)) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert [type(r) for r in results] == [ValueError, ValueError]
+    assert flight.stats()["in_flight"] == 0
+
+
+async def test_waiter_takes_over_when_leader_is_cancelled():
+    flight = SingleFlight()
+    leader_started = asyncio.Event()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        if len(calls) == 1:
+            leader_started.set()
+            await asyncio.Event().wait()  # never finishes
+        return "done"
+
+    leader = asyncio.create_task(flight.run("team-scores", 7, compute))
+    await leader_started.wait()
+    waiter = asyncio.create_task(flight.run("team-scores", 7, compute))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await waiter == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert flight.computations == 2
@@ -2,13 +2,18 @@ import pytest
 import pytest_asyncio
 from datetime import date
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.competition import Competition
 from app.models.skater import Skater
 from app.models.category_result import CategoryResult
 from app.models.score import Score
+from app.models.score_element import ScoreElement
 from app.models.app_settings import AppSettings
+from app.services.score_elements import replace_score_elements
+from app.services.score_distribution import competition_cohorts, refresh_distributions
+from app.services.season_summary import refresh_season_summaries
 
 
 @pytest_asyncio.fixture
@@ -52,6 +57,7 @@ async def seed_data(db_session: AsyncSession):
         segment_count=1, skating_level="R2", age_group="Minime", gender="Femme",
     ))
 
+    await refresh_season_summaries(db_session, [skater1.id, skater2.id, skater3.id])
     await db_session.commit()
     return {"skater1": skater1, "skater2": skater2, "skater3": skater3}
 
@@ -121,6 +127,7 @@ async def seed_benchmark_data(db_session: AsyncSession):
             segment_count=1, skating_level="R2", age_group="Minime", gender="Femme",
         ))
 
+    await refresh_distributions(db_session, await competition_cohorts(db_session, comp.id))
     await db_session.commit()
 
 
@@ -143,6 +150,54 @@ async def test_benchmarks(client: AsyncClient, admin_token: str, seed_benchmark_
     assert data["p75"] is not None
 
 
+@pytest.mark.asyncio
+async def test_benchmarks_merge_seasons(client: AsyncClient, admin_token: str, db_session, seed_benchmark_data):
+    comp = Competition(name="Old Comp", url="http://test/old", date=date(2024, 11, 1), season="2024-2025")
+    skater = Skater(first_name="Old", last_name="Timer")
+    db_session.add_all([comp, skater])
+    await db_session.flush()
+    db_session.add(CategoryResult(
+        competition_id=comp.id, skater_id=skater.id, category="R2 Minime Femme", overall_rank=1,
+        combined_total=60.0, segment_count=1, skating_level="R2", age_group="Minime", gender="Femme",
+    ))
+    await refresh_distributions(db_session, await competition_cohorts(db_session, comp.id))
+    await db_session.commit()
+
+    url = "/api/stats/benchmarks?skating_level=R2&age_group=Minime&gender=Femme"
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    all_seasons = (await client.get(url, headers=headers)).json()
+    one_season = (await client.get(f"{url}&season=2025-2026", headers=headers)).json()
+
+    assert (all_seasons["data_points"], all_seasons["max"], all_seasons["median"]) == (11, 60.0, 35.0)
+    assert (one_season["data_points"], one_season["max"], one_season["median"]) == (10, 50.0, 34.0)
+
+
+@pytest.mark.asyncio
+async def test_percentile_rank(client: AsyncClient, admin_token: str, seed_benchmark_data):
+    url = "/api/stats/percentile?skating_level=R2&age_group=Minime&gender=Femme"
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    data = (await client.get(f"{url}&score=36", headers=headers)).json()
+    assert (data["data_points"], data["percentile"]) == (10, 60.0)
+    # A tie counts half
+    assert (await client.get(f"{url}&score=20", headers=headers)).json()["percentile"] == 5.0
+    empty = (await client.get(f"{url}&score=36&segment=SP", headers=headers)).json()
+    assert (empty["data_points"], empty["percentile"]) == (0, None)
+
+
+@pytest.mark.asyncio
+async def test_histogram(client: AsyncClient, admin_token: str, seed_benchmark_data):
+    url = "/api/stats/histogram?skating_level=R2&age_group=Minime&gender=Femme&season=2025-2026"
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    data = (await client.get(f"{url}&bins=3", headers=headers)).json()
+    assert data["data_points"] == 10
+    assert [(b["lower"], b["upper"], b["count"]) for b in data["bins"]] == [
+        (20.0, 30.0, 3), (30.0, 40.0, 4), (40.0, 50.0, 3),
+    ]
+    assert (await client.get(f"{url}&bins=0", headers=headers)).status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_benchmarks_no_data(client: AsyncClient, admin_token: str, seed_benchmark_data):
     resp = await client.get(
@@ -183,6 +238,8 @@ async def seed_element_data(db_session: AsyncSession):
         ],
     )
     db_session.add(score)
+    await db_session.flush()
+    await replace_score_elements(db_session, score)
     await db_session.commit()
 
 
@@ -210,3 +267,20 @@ async def test_element_mastery(client: AsyncClient, admin_token: str, seed_eleme
     assert len(data["steps"]) == 1
     assert data["steps"][0]["element_type"] == "StSq"
     assert data["steps"][0]["level_distribution"]["3"] == 1
+
+
+async def test_element_mastery_skips_jumps_without_type(
+    client: AsyncClient, admin_token: str, seed_element_data, db_session: AsyncSession,
+):
+    score = (await db_session.execute(select(Score))).scalar_one()
+    db_session.add(ScoreElement(
+        score_id=score.id, position=7, code="Eu", element_type="jump",
+        base_code="Eu", jump_type=None, level=0, markers_mask=0, goe=0.0,
+    ))
+    await db_session.commit()
+
+    resp = await client.get(
+        "/api/stats/element-mastery",
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert {j["jump_type"] for j in resp.json()["jumps"]} == {"2A", "2Lz", "2T"}
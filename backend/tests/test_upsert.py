@@ -0,0 +1,40 @@
+from sqlalchemy import func, select
+
+from app.models.competition import Competition
+from app.models.skater import Skater
+from app.models.skater_program import SkaterProgram
+from app.services.upsert import insert_ignore, upsert
+
+
+async def test_insert_ignore_skips_conflicting_rows(db_session):
+    db_session.add(Competition(name="Existing", url="http://c/1"))
+    await db_session.commit()
+
+    await insert_ignore(db_session, Competition, [
+        {"name": "Duplicate", "url": "http://c/1"},
+        {"name": "New", "url": "http://c/2"},
+    ], conflict=["url"])
+    await db_session.commit()
+
+    rows = (await db_session.execute(
+        select(Competition.url, Competition.name).order_by(Competition.url)
+    )).all()
+    assert [tuple(r) for r in rows] == [("http://c/1", "Existing"), ("http://c/2", "New")]
+
+
+async def test_upsert_inserts_then_updates_same_row(db_session):
+    skater = Skater(first_name="Lea", last_name="PETIT")
+    db_session.add(skater)
+    await db_session.flush()
+    values = {"skater_id": skater.id, "segment": "FS", "elements": ["2A"]}
+
+    first = await upsert(db_session, SkaterProgram, values,
+                         conflict=["skater_id", "segment"], update=["elements"])
+    second = await upsert(db_session, SkaterProgram, {**values, "elements": ["2A", "3S"]},
+                          conflict=["skater_id", "segment"], update=["elements"])
+    await db_session.commit()
+
+    assert first == second
+    program = await db_session.get(SkaterProgram, first, populate_existing=True)
+    assert program.elements == ["2A", "3S"]
+    assert (await db_session.execute(select(func.count(SkaterProgram.id)))).scalar() == 1
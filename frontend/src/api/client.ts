@@ -154,6 +154,7 @@ export interface Competition {
   metadata_confirmed: boolean;
   polling_enabled: boolean;
   polling_activated_at: string | null;
+  next_poll_at: string | null;
 }
 
 export const COMPETITION_TYPES: Record<string, string> = {
@@ -227,8 +228,9 @@ export interface Score {
   technical_score: number | null;
   component_score: number | null;
   deductions: number | null;
-  components: Record<string, number | { score: number; factor: number; judges: number[] }> | null;
-  elements: ScoreElement[] | null;
+  /** Served by /scores/ only when listed in its `fields` parameter */
+  components?: Record<string, number | { score: number; factor: number; judges: number[] }> | null;
+  elements?: ScoreElement[] | null;
   skating_level: string | null;
   age_group: string | null;
   gender: string | null;
@@ -263,6 +265,20 @@ export interface CategoryResult {
   gender: string | null;
 }
 
+export interface SkaterSeasonSummary {
+  skater_id: number;
+  season: string | null;
+  competitions_entered: number;
+  programs: number;
+  podiums: number;
+  best_total: number | null;
+  best_tss: number | null;
+  best_tes: number | null;
+  best_pcs: number | null;
+  first_tss: number | null;
+  last_tss: number | null;
+}
+
 export interface Skater {
   id: number;
   first_name: string;
@@ -442,11 +458,48 @@ export interface JobInfo {
   competition_id: number;
   competition_name: string | null;
   status: "queued" | "running" | "completed" | "failed" | "cancelled";
+  priority: 0 | 1 | 2;
   result: ImportResult | EnrichResult | null;
   error: string | null;
   created_at: string;
   started_at: string | null;
   completed_at: string | null;
+  progress: JobProgress | null;
+  metrics: JobMetrics | null;
+}
+
+/** One page of a keyset-paginated listing; pass `next_cursor` back as `cursor`. */
+export interface CursorPage<T> {
+  items: T[];
+  next_cursor: string | null;
+}
+
+/** Fetch every page of a keyset-paginated listing. */
+async function allPages<T>(path: string, qs: URLSearchParams): Promise<T[]> {
+  const items: T[] = [];
+  qs.set("limit", "1000");
+  for (;;) {
+    const page = await request<CursorPage<T>>(`${path}?${qs}`);
+    items.push(...page.items);
+    if (!page.next_cursor) return items;
+    qs.set("cursor", page.next_cursor);
+  }
+}
+
+export interface JobPage {
+  items: JobInfo[];
+  next_cursor: string | null;
+}
+
+export interface JobProgress {
+  phase: string;
+  done: number;
+  total: number;
+}
+
+export interface JobMetrics {
+  total_seconds: number;
+  phases: Record<string, { seconds: number; count: number }>;
 }
 
 export interface ProgressionRankingEntry {
@@ -474,6 +527,17 @@ export interface BenchmarkData {
   p75: number | null;
 }
 
+export interface PercentileRank {
+  score: number;
+  data_points: number;
+  percentile: number | null;
+}
+
+export interface ScoreHistogram {
+  data_points: number;
+  bins: { lower: number; upper: number; count: number }[];
+}
+
 // --- Training Tracking Types ---
 
 export interface WeeklyReview {
@@ -738,6 +802,11 @@ export interface CompetitionClubAnalysis {
   results: ClubSkaterResult[];
 }
 
+export interface SeasonClubAnalysisEntry {
+  competition: { id: number; name: string; date: string | null; season: string };
+  kpis: CompetitionClubAnalysis["kpis"];
+}
+
 // --- Team Scoring Types ---
 
 export interface TeamSkaterEntry {
@@ -1063,7 +1132,24 @@ export const api = {
   },
 
   jobs: {
-    list: () => request<JobInfo[]>("/jobs/"),
+    list: (params?: {
+      status?: JobInfo["status"][];
+      type?: JobInfo["type"];
+      trigger?: JobInfo["trigger"];
+      competition_id?: number;
+      limit?: number;
+      cursor?: string;
+    }) => {
+      const qs = new URLSearchParams();
+      params?.status?.forEach((s) => qs.append("status", s));
+      if (params?.type) qs.set("type", params.type);
+      if (params?.trigger) qs.set("trigger", params.trigger);
+      if (params?.competition_id !== undefined) qs.set("competition_id", String(params.competition_id));
+      if (params?.limit !== undefined) qs.set("limit", String(params.limit));
+      if (params?.cursor) qs.set("cursor", params.cursor);
+      const query = qs.toString() ? `?${qs}` : "";
+      return request<JobPage>(`/jobs/${query}`);
+    },
     get: (id: string) => request<JobInfo>(`/jobs/${id}`),
     cancel: (id: string) => request<JobInfo>(`/jobs/${id}/cancel`, { method: "POST" }),
   },
@@ -1110,6 +1196,12 @@ export const api = {
       const query = qs.toString() ? `?${qs}` : "";
       return request<CategoryResult[]>(`/skaters/${id}/category-results${query}`);
     },
+    seasonSummary: (id: number, season?: string) => {
+      const qs = new URLSearchParams();
+      if (season) qs.set("season", season);
+      const query = qs.toString() ? `?${qs}` : "";
+      return request<SkaterSeasonSummary>(`/skaters/${id}/season-summary${query}`);
+    },
     elements: (id: number, opts?: { elementType?: string; season?: string }) => {
       const qs = new URLSearchParams();
       if (opts?.elementType) qs.set("element_type", opts.elementType);
@@ -1127,6 +1219,7 @@ export const api = {
   },
 
   scores: {
+    /** Every matching score, following the pages; without components and elements. */
     list: (params?: {
       competition_id?: number;
       skater_id?: number;
@@ -1138,10 +1231,30 @@ export const api = {
       if (params?.skater_id !== undefined)
         qs.set("skater_id", String(params.skater_id));
       if (params?.segment) qs.set("segment", params.segment);
+      return allPages<Score>("/scores/", qs);
+    },
+    page: (params?: {
+      competition_id?: number;
+      skater_id?: number;
+      segment?: string;
+      fields?: (keyof Score)[];
+      limit?: number;
+      cursor?: string;
+    }) => {
+      const qs = new URLSearchParams();
+      if (params?.competition_id !== undefined)
+        qs.set("competition_id", String(params.competition_id));
+      if (params?.skater_id !== undefined)
+        qs.set("skater_id", String(params.skater_id));
+      if (params?.segment) qs.set("segment", params.segment);
+      if (params?.fields) qs.set("fields", params.fields.join(","));
+      if (params?.limit) qs.set("limit", String(params.limit));
+      if (params?.cursor) qs.set("cursor", params.cursor);
       const query = qs.toString() ? `?${qs}` : "";
-      return request<Score[]>(`/scores/${query}`);
+      return request<CursorPage<Partial<Score>>>(`/scores/${query}`);
     },
     elements: (id: number) => request<Element[]>(`/scores/${id}/elements`),
+    /** Every matching category result, following the pages. */
     categoryResults: (params?: {
       competition_id?: number;
       skater_id?: number;
@@ -1151,8 +1264,7 @@ export const api = {
         qs.set("competition_id", String(params.competition_id));
       if (params?.skater_id !== undefined)
         qs.set("skater_id", String(params.skater_id));
-      const query = qs.toString() ? `?${qs}` : "";
-      return request<CategoryResult[]>(`/scores/category-results${query}`);
+      return allPages<CategoryResult>("/scores/category-results", qs);
     },
   },
 
@@ -1194,6 +1306,42 @@ export const api = {
       if (params.season) qs.set("season", params.season);
       return request<BenchmarkData>(`/stats/benchmarks?${qs}`);
     },
+    percentile: (params: {
+      skating_level: string;
+      age_group: string;
+      gender: string;
+      score: number;
+      season?: string;
+      segment?: string;
+    }) => {
+      const qs = new URLSearchParams({
+        skating_level: params.skating_level,
+        age_group: params.age_group,
+        gender: params.gender,
+        score: String(params.score),
+      });
+      if (params.season) qs.set("season", params.season);
+      if (params.segment) qs.set("segment", params.segment);
+      return request<PercentileRank>(`/stats/percentile?${qs}`);
+    },
+    histogram: (params: {
+      skating_level: string;
+      age_group: string;
+      gender: string;
+      season?: string;
+      segment?: string;
+      bins?: number;
+    }) => {
+      const qs = new URLSearchParams({
+        skating_level: params.skating_level,
+        age_group: params.age_group,
+        gender: params.gender,
+      });
+      if (params.season) qs.set("season", params.season);
+      if (params.segment) qs.set("segment", params.segment);
+      if (params.bins !== undefined) qs.set("bins", String(params.bins));
+      return request<ScoreHistogram>(`/stats/histogram?${qs}`);
+    },
     elementMastery: (params?: {
       season?: string;
       club?: string;
@@ -1217,6 +1365,13 @@ export const api = {
       const query = qs.toString() ? `?${qs}` : "";
       return request<CompetitionClubAnalysis>(`/stats/competition-club-analysis${query}`);
     },
+    seasonClubAnalysis: (params?: { season?: string; club?: string }) => {
+      const qs = new URLSearchParams();
+      if (params?.season) qs.set("season", params.season);
+      if (params?.club) qs.set("club", params.club);
+      const query = qs.toString() ? `?${qs}` : "";
+      return request<SeasonClubAnalysisEntry[]>(`/stats/season-club-analysis${query}`);
+    },
   },
 
   training: {
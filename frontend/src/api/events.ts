@@ -0,0 +1,104 @@
+import { getAccessToken } from "./client";
+
+const BASE = import.meta.env.VITE_API_URL || "/api";
+
+type Listener = (data: unknown) => void;
+
+// One shared connection to /api/events, opened while at least one listener is
+// registered. EventSource can't send the Authorization header, so the stream
+// is read with fetch.
+const listeners = new Map<string, Set<Listener>>();
+const statusListeners = new Set<(connected: boolean) => void>();
+let controller: AbortController | null = null;
+let connected = false;
+
+function setConnected(value: boolean) {
+  if (connected === value) return;
+  connected = value;
+  statusListeners.forEach((cb) => cb(value));
+}
+
+function dispatch(block: string) {
+  let event = "message";
+  const data: string[] = [];
+  for (const line of block.split(/\r?\n/)) {
+    if (line.startsWith("event:")) event = line.slice(6).trim();
+    else if (line.startsWith("data:")) data.push(line.slice(5).trimStart());
+  }
+  if (data.length === 0) return;
+  let parsed: unknown;
+  try {
+    parsed = JSON.parse(data.join("\n"));
+  } catch {
+    return;
+  }
+  listeners.get(event)?.forEach((cb) => cb(parsed));
+}
+
+async function run(signal: AbortSignal) {
+  let delay = 1000;
+  while (!signal.aborted) {
+    const token = getAccessToken();
+    try {
+      if (!token) throw new Error("not authenticated");
+      const res = await fetch(`${BASE}/events/`, {
+        headers: { Authorization: `Bearer ${token}`, Accept: "text/event-stream" },
+        credentials: "include",
+        signal,
+      });
+      if (!res.ok || !res.body) throw new Error(`${res.status}`);
+      setConnected(true);
+      delay = 1000;
+      const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+      let buffer = "";
+      for (;;) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += value;
+        const blocks = buffer.split(/\r?\n\r?\n/);
+        buffer = blocks.pop() ?? "";
+        blocks.forEach(dispatch);
+      }
+    } catch {
+      // Fall through to reconnect
+    }
+    setConnected(false);
+    if (signal.aborted) return;
+    await new Promise((r) => setTimeout(r, delay));
+    delay = Math.min(delay * 2, 30_000);
+  }
+}
+
+function ensureConnection() {
+  if (controller) return;
+  controller = new AbortController();
+  run(controller.signal);
+}
+
+function maybeDisconnect() {
+  if (controller && listeners.size === 0) {
+    controller.abort();
+    controller = null;
+    setConnected(false);
+  }
+}
+
+export function onServerEvent(event: string, cb: Listener): () => void {
+  if (!listeners.has(event)) listeners.set(event, new Set());
+  listeners.get(event)!.add(cb);
+  ensureConnection();
+  return () => {
+    const set = listeners.get(event);
+    set?.delete(cb);
+    if (set && set.size === 0) listeners.delete(event);
+    maybeDisconnect();
+  };
+}
+
+export function onStreamStatus(cb: (connected: boolean) => void): () => void {
+  statusListeners.add(cb);
+  cb(connected);
+  return () => {
+    statusListeners.delete(cb);
+  };
+}
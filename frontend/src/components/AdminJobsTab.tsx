@@ -1,5 +1,5 @@
 import { useState, useRef, useEffect } from "react";
-import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
+import { useInfiniteQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import { api, type JobInfo, type ImportResult, type EnrichResult } from "../api/client";
 
 function parseUTC(iso: string): Date {
@@ -55,6 +55,29 @@ const TRIGGER_LABELS: Record<string, string> = {
   bulk: "lot",
 };
 
+const PAGE_SIZE = 50;
+
+const STATUS_LABELS: Record<string, string> = {
+  queued: "En attente",
+  running: "En cours",
+  completed: "Terminée",
+  failed: "Échouée",
+  cancelled: "Annulée",
+};
+
+const PRIORITY_LABELS: Record<number, string> = {
+  0: "haute",
+  1: "normale",
+  2: "basse",
+};
+
+const PHASE_LABELS: Record<string, string> = {
+  fetch: "Téléchargement",
+  parse: "Analyse",
+  match: "Appariement",
+  write: "Écriture",
+};
+
 function resultSummary(job: JobInfo): string {
   if (!job.result) return "";
   if (job.type === "enrich") {
@@ -132,6 +155,12 @@ function JobDetailModal({
                 {job.status}
               </p>
             </div>
+            <div>
+              <span className="text-on-surface-variant">Priorité</span>
+              <p className="text-on-surface font-medium">
+                {PRIORITY_LABELS[job.priority] ?? job.priority}
+              </p>
+            </div>
             <div>
               <span className="text-on-surface-variant">Compétition</span>
               <p className="text-on-surface font-medium">{job.competition_name ?? `#${job.competition_id}`}</p>
@@ -154,6 +183,25 @@ function JobDetailModal({
             )}
           </div>
 
+          {/* Phase timings */}
+          {job.metrics && Object.keys(job.metrics.phases).length > 0 && (
+            <div className="bg-surface-container-low rounded-xl p-4 space-y-2">
+              <h4 className="text-sm font-semibold text-on-surface">
+                Durée par phase ({job.metrics.total_seconds.toFixed(1)}s)
+              </h4>
+              <div className="grid grid-cols-2 gap-2 text-sm">
+                {Object.entries(job.metrics.phases).map(([name, p]) => (
+                  <div key={name}>
+                    <span className="text-on-surface-variant">{PHASE_LABELS[name] ?? name}</span>
+                    <p className="font-mono text-on-surface">
+                      {p.seconds.toFixed(1)}s · {p.count}
+                    </p>
+                  </div>
+                ))}
+              </div>
+            </div>
+          )}
+
           {/* Import result */}
           {importResult && (
             <div className="bg-surface-container-low rounded-xl p-4 space-y-2">
@@ -305,12 +353,24 @@ export default function AdminJobsTab() {
   const qc = useQueryClient();
   const [detailJob, setDetailJob] = useState<JobInfo | null>(null);
 
-  const { data: jobs, isLoading } = useQuery({
-    queryKey: ["admin-jobs"],
-    queryFn: () => api.jobs.list(),
+  const [statusFilter, setStatusFilter] = useState<JobInfo["status"] | "">("");
+  const [typeFilter, setTypeFilter] = useState<JobInfo["type"] | "">("");
+
+  const { data, isLoading, fetchNextPage, hasNextPage, isFetchingNextPage } = useInfiniteQuery({
+    queryKey: ["admin-jobs", statusFilter, typeFilter],
+    queryFn: ({ pageParam }) =>
+      api.jobs.list({
+        status: statusFilter ? [statusFilter] : undefined,
+        type: typeFilter || undefined,
+        limit: PAGE_SIZE,
+        cursor: pageParam,
+      }),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (last) => last.next_cursor ?? undefined,
     refetchInterval: 5000,
     refetchOnMount: "always",
   });
+  const jobs = data?.pages.flatMap((p) => p.items);
 
   const cancelMutation = useMutation({
     mutationFn: (id: string) => api.jobs.cancel(id),
@@ -331,11 +391,35 @@ export default function AdminJobsTab() {
 
   return (
     <div className="space-y-4">
-      <div>
-        <h2 className="font-headline font-bold text-on-surface text-lg">Tâches</h2>
-        <p className="text-sm text-on-surface-variant">
-          Historique des 7 derniers jours
-        </p>
+      <div className="flex items-end justify-between gap-4">
+        <div>
+          <h2 className="font-headline font-bold text-on-surface text-lg">Tâches</h2>
+          <p className="text-sm text-on-surface-variant">
+            Historique des 7 derniers jours
+          </p>
+        </div>
+        <div className="flex gap-2">
+          <select
+            value={statusFilter}
+            onChange={(e) => setStatusFilter(e.target.value as JobInfo["status"] | "")}
+            className="bg-surface-container-low rounded-xl px-3 py-2 text-sm text-on-surface"
+          >
+            <option value="">Tous les statuts</option>
+            {Object.entries(STATUS_LABELS).map(([value, label]) => (
+              <option key={value} value={value}>{label}</option>
+            ))}
+          </select>
+          <select
+            value={typeFilter}
+            onChange={(e) => setTypeFilter(e.target.value as JobInfo["type"] | "")}
+            className="bg-surface-container-low rounded-xl px-3 py-2 text-sm text-on-surface"
+          >
+            <option value="">Tous les types</option>
+            {Object.entries(TYPE_LABELS).map(([value, label]) => (
+              <option key={value} value={value}>{label}</option>
+            ))}
+          </select>
+        </div>
       </div>
 
       {!jobs || jobs.length === 0 ? (
@@ -379,7 +463,9 @@ export default function AdminJobsTab() {
                       {job.competition_name ?? `#${job.competition_id}`}
                     </td>
                     <td className="px-4 py-3 text-on-surface-variant whitespace-nowrap">
-                      {job.started_at ? formatRelativeTime(job.started_at) : "En attente"}
+                      {job.started_at
+                        ? formatRelativeTime(job.started_at)
+                        : `En attente (priorité ${PRIORITY_LABELS[job.priority] ?? job.priority})`}
                     </td>
                     <td
                       className="px-4 py-3 font-mono text-on-surface-variant whitespace-nowrap"
@@ -388,7 +474,9 @@ export default function AdminJobsTab() {
                       {job.started_at && job.completed_at
                         ? formatDuration(job.started_at, job.completed_at)
                         : job.started_at
-                          ? "..."
+                          ? job.progress
+                            ? `${PHASE_LABELS[job.progress.phase] ?? job.progress.phase} ${job.progress.done}/${job.progress.total}`
+                            : "..."
                           : "—"}
                     </td>
                     <td className="px-4 py-3 text-on-surface-variant max-w-[180px] truncate">
@@ -408,6 +496,17 @@ export default function AdminJobsTab() {
               })}
             </tbody>
           </table>
+          {hasNextPage && (
+            <div className="flex justify-center py-3">
+              <button
+                onClick={() => fetchNextPage()}
+                disabled={isFetchingNextPage}
+                className="text-sm font-medium text-primary hover:underline disabled:opacity-50"
+              >
+                {isFetchingNextPage ? "Chargement..." : "Charger plus"}
+              </button>
+            </div>
+          )}
         </div>
       )}
 
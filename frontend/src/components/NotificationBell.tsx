@@ -2,6 +2,7 @@ import { useState, useRef, useEffect } from "react";
 import { useQuery, useQueryClient, useMutation } from "@tanstack/react-query";
 import { useNavigate } from "react-router-dom";
 import { api, AppNotification } from "../api/client";
+import { onServerEvent } from "../api/events";
 
 export default function NotificationBell() {
   const [open, setOpen] = useState(false);
@@ -9,12 +10,23 @@ export default function NotificationBell() {
   const navigate = useNavigate();
   const queryClient = useQueryClient();
 
+  // Count pushed by the event stream; the query is the initial load and a
+  // slow fallback if the stream is unavailable.
   const { data: countData } = useQuery({
     queryKey: ["notifications", "count"],
     queryFn: api.me.notifications.count,
-    refetchInterval: 60_000,
+    refetchInterval: 5 * 60_000,
   });
 
+  useEffect(
+    () =>
+      onServerEvent("notifications", (data) => {
+        queryClient.setQueryData(["notifications", "count"], data);
+        queryClient.invalidateQueries({ queryKey: ["notifications", "list"] });
+      }),
+    [queryClient],
+  );
+
   const { data: notifications } = useQuery({
     queryKey: ["notifications", "list"],
     queryFn: () => api.me.notifications.list(),
@@ -9,6 +9,7 @@ import {
 } from "react";
 import { useQueryClient } from "@tanstack/react-query";
 import { api, type JobInfo, type ImportResult, type EnrichResult } from "../api/client";
+import { onServerEvent, onStreamStatus } from "../api/events";
 
 // --- Bulk import types ---
 export interface Lot {
@@ -76,12 +77,10 @@ export function JobProvider({ children }: { children: ReactNode }) {
     if (recoveredRef.current) return;
     recoveredRef.current = true;
 
-    api.jobs.list().then((serverJobs) => {
+    api.jobs.list({ status: ["queued", "running"], limit: 200 }).then((page) => {
       const active: Record<string, JobInfo> = {};
-      for (const job of serverJobs) {
-        if (job.status === "queued" || job.status === "running") {
-          active[job.id] = job;
-        }
+      for (const job of page.items) {
+        active[job.id] = job;
       }
       if (Object.keys(active).length > 0) {
         setActiveJobs((prev) => ({ ...active, ...prev }));
@@ -106,11 +105,14 @@ export function JobProvider({ children }: { children: ReactNode }) {
         competition_id: 0,
         competition_name: null,
         status: "queued",
+        priority: 2,
         result: null,
         error: null,
         created_at: "",
         started_at: null,
         completed_at: null,
+        progress: null,
+        metrics: null,
       };
     }
     setBulkJobs((prev) => ({ ...prev, ...newJobs }));
@@ -144,59 +146,76 @@ export function JobProvider({ children }: { children: ReactNode }) {
   const bulkJobsRef = useRef(bulkJobs);
   bulkJobsRef.current = bulkJobs;
 
+  // Apply a (possibly partial) job update from polling or the event stream.
+  const applyJobUpdate = useCallback((update: Partial<JobInfo> & { id: string }) => {
+    const prevActive = activeJobsRef.current[update.id];
+    if (prevActive) {
+      const job = { ...prevActive, ...update } as JobInfo;
+      activeJobsRef.current = { ...activeJobsRef.current, [job.id]: job };
+      setActiveJobs((prev) => ({ ...prev, [job.id]: job }));
+      if (job.status !== prevActive.status && (job.status === "completed" || job.status === "failed")) {
+        qc.invalidateQueries({ queryKey: ["competitions"] });
+        qc.invalidateQueries({ queryKey: ["scores"] });
+        if (job.status === "failed" && job.error) {
+          setFailedErrors((prev) => ({
+            ...prev,
+            [job.competition_id]: {
+              type: job.type,
+              error: job.error!,
+              timestamp: new Date().toISOString(),
+            },
+          }));
+        }
+        if (job.status === "completed" && job.result) {
+          if (job.type === "enrich") {
+            setEnrichResults((prev) => ({
+              ...prev,
+              [job.competition_id]: job.result as EnrichResult,
+            }));
+            setDismissedEnrich((prev) => {
+              const next = new Set(prev);
+              next.delete(job.competition_id);
+              return next;
+            });
+          } else {
+            setImportResults((prev) => ({
+              ...prev,
+              [job.competition_id]: job.result as ImportResult,
+            }));
+            setDismissedResults((prev) => {
+              const next = new Set(prev);
+              next.delete(job.competition_id);
+              return next;
+            });
+          }
+        }
+      }
+    }
+
+    const prevBulk = bulkJobsRef.current[update.id];
+    if (prevBulk) {
+      const job = { ...prevBulk, ...update } as JobInfo;
+      bulkJobsRef.current = { ...bulkJobsRef.current, [job.id]: job };
+      setBulkJobs((prev) => ({ ...prev, [job.id]: job }));
+      if (job.status !== prevBulk.status && (job.status === "completed" || job.status === "failed")) {
+        qc.invalidateQueries({ queryKey: ["competitions"] });
+        qc.invalidateQueries({ queryKey: ["scores"] });
+      }
+    }
+  }, [qc]);
+
   const pollJobs = useCallback(async () => {
+    const isActive = (j: JobInfo) => j.status === "queued" || j.status === "running";
+
     // Poll per-competition jobs
     const current = activeJobsRef.current;
-    const activeIds = Object.entries(current)
-      .filter(([, j]) => j.status === "queued" || j.status === "running")
-      .map(([id]) => id);
-
-    for (const jobId of activeIds) {
+    for (const [jobId, prev] of Object.entries(current)) {
+      if (!isActive(prev)) continue;
       try {
-        const job = await api.jobs.get(jobId);
-        if (job.status !== current[jobId]?.status) {
-          setActiveJobs((prev) => ({ ...prev, [jobId]: job }));
-          if (job.status === "completed" || job.status === "failed") {
-            qc.invalidateQueries({ queryKey: ["competitions"] });
-            qc.invalidateQueries({ queryKey: ["scores"] });
-            if (job.status === "failed" && job.error) {
-              setFailedErrors((prev) => ({
-                ...prev,
-                [job.competition_id]: {
-                  type: job.type,
-                  error: job.error!,
-                  timestamp: new Date().toISOString(),
-                },
-              }));
-            }
-            if (job.status === "completed" && job.result) {
-              if (job.type === "enrich") {
-                setEnrichResults((prev) => ({
-                  ...prev,
-                  [job.competition_id]: job.result as EnrichResult,
-                }));
-                setDismissedEnrich((prev) => {
-                  const next = new Set(prev);
-                  next.delete(job.competition_id);
-                  return next;
-                });
-              } else {
-                setImportResults((prev) => ({
-                  ...prev,
-                  [job.competition_id]: job.result as ImportResult,
-                }));
-                setDismissedResults((prev) => {
-                  const next = new Set(prev);
-                  next.delete(job.competition_id);
-                  return next;
-                });
-              }
-            }
-          }
-        }
+        applyJobUpdate(await api.jobs.get(jobId));
       } catch {
-        setActiveJobs((prev) => ({
-          ...prev,
+        setActiveJobs((p) => ({
+          ...p,
           [jobId]: { ...current[jobId], status: "failed", error: "Lost contact with job" },
         }));
       }
@@ -204,30 +223,29 @@ export function JobProvider({ children }: { children: ReactNode }) {
 
     // Poll bulk jobs
     const bulk = bulkJobsRef.current;
-    const bulkActiveIds = Object.entries(bulk)
-      .filter(([, j]) => j.status === "queued" || j.status === "running")
-      .map(([id]) => id);
-
-    for (const jobId of bulkActiveIds) {
+    for (const [jobId, prev] of Object.entries(bulk)) {
+      if (!isActive(prev)) continue;
       try {
-        const job = await api.jobs.get(jobId);
-        if (job.status !== bulk[jobId]?.status) {
-          setBulkJobs((prev) => ({ ...prev, [jobId]: job }));
-          if (job.status === "completed" || job.status === "failed") {
-            qc.invalidateQueries({ queryKey: ["competitions"] });
-            qc.invalidateQueries({ queryKey: ["scores"] });
-          }
-        }
+        applyJobUpdate(await api.jobs.get(jobId));
       } catch {
-        setBulkJobs((prev) => ({
-          ...prev,
+        setBulkJobs((p) => ({
+          ...p,
           [jobId]: { ...bulk[jobId], status: "failed", error: "Perdu le contact" },
         }));
       }
     }
-  }, [qc]);
+  }, [applyJobUpdate]);
+
+  // Live updates from the server event stream
+  const [streamConnected, setStreamConnected] = useState(false);
+  useEffect(() => onStreamStatus(setStreamConnected), []);
+  useEffect(
+    () => onServerEvent("job", (data) => applyJobUpdate(data as Partial<JobInfo> & { id: string })),
+    [applyJobUpdate],
+  );
 
-  // Polling interval
+  // Fallback polling: fast when the stream is down, slow safety net otherwise
+  // (jobs run by another server process are not streamed to this one).
   const pollRef = useRef<ReturnType<typeof setInterval> | null>(null);
 
   useEffect(() => {
@@ -244,7 +262,7 @@ export function JobProvider({ children }: { children: ReactNode }) {
     }
 
     if (!pollRef.current) {
-      pollRef.current = setInterval(pollJobs, 2000);
+      pollRef.current = setInterval(pollJobs, streamConnected ? 30_000 : 2000);
     }
 
     return () => {
@@ -253,7 +271,7 @@ export function JobProvider({ children }: { children: ReactNode }) {
         pollRef.current = null;
       }
     };
-  }, [activeJobs, bulkJobs, pollJobs]);
+  }, [activeJobs, bulkJobs, pollJobs, streamConnected]);
 
   return (
     <JobContext.Provider
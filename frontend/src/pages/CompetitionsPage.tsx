@@ -9,6 +9,16 @@ import ErrorDetailModal from "../components/ErrorDetailModal";
 const inputClass =
   "bg-surface-container rounded-lg px-4 py-3 w-full focus:outline-none focus:ring-2 focus:ring-primary text-sm text-on-surface placeholder:text-on-surface-variant";
 
+function pollingTitle(c: Competition): string {
+  if (!c.polling_enabled) return "Activer le suivi automatique";
+  if (!c.next_poll_at) return "Suivi automatique actif";
+  const next = new Date(c.next_poll_at.endsWith("Z") ? c.next_poll_at : c.next_poll_at + "Z");
+  return `Suivi automatique actif — prochaine vérification ${next.toLocaleString("fr-FR", {
+    dateStyle: "short",
+    timeStyle: "short",
+  })}`;
+}
+
 export default function CompetitionsPage() {
   const qc = useQueryClient();
   const { user } = useAuth();
@@ -556,7 +566,7 @@ export default function CompetitionsPage() {
                             ? "bg-primary text-on-primary"
                             : "bg-surface-container text-on-surface-variant"
                         }`}
-                        title={c.polling_enabled ? "Suivi automatique actif" : "Activer le suivi automatique"}
+                        title={pollingTitle(c)}
                       >
                         <span className="material-symbols-outlined text-base leading-none">sync</span>
                       </button>
@@ -685,7 +695,7 @@ export default function CompetitionsPage() {
                             ? "bg-primary text-on-primary"
                             : "bg-surface-container text-on-surface-variant"
                         }`}
-                        title={c.polling_enabled ? "Suivi automatique actif" : "Activer le suivi automatique"}
+                        title={pollingTitle(c)}
                       >
                         <span className="material-symbols-outlined text-base leading-none">sync</span>
                       </button>
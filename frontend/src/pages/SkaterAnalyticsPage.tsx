@@ -246,6 +246,12 @@ export default function SkaterAnalyticsPage() {
     placeholderData: keepPreviousData,
   });
 
+  const { data: seasonSummary } = useQuery({
+    queryKey: ["skater-season-summary", skaterId, selectedSeason],
+    queryFn: () => api.skaters.seasonSummary(skaterId, selectedSeason ?? undefined),
+    placeholderData: keepPreviousData,
+  });
+
   const trainingSeasonRange = selectedSeason ? seasonDateRange(selectedSeason) : undefined;
 
   const { data: trainingReviews } = useQuery({
@@ -452,28 +458,8 @@ export default function SkaterAnalyticsPage() {
     });
   })();
 
-  // ── Derived: best TSS (max across category results + scores without a result) ──
-  const bestTss = (() => {
-    const catKeys = new Set<string>();
-    let best: number | null = null;
-
-    for (const r of categoryResults ?? []) {
-      if (r.combined_total == null) continue;
-      catKeys.add(`${r.competition_id}__${r.category ?? ""}`);
-      if (best == null || r.combined_total > best) best = r.combined_total;
-    }
-
-    // Also consider scores from competitions missing a category result
-    for (const s of scores ?? []) {
-      if (s.total_score == null) continue;
-      const key = `${s.competition_id}__${s.category ?? ""}`;
-      if (!catKeys.has(key)) {
-        if (best == null || s.total_score > best) best = s.total_score;
-      }
-    }
-
-    return best;
-  })();
+  // ── Best TSS (category results + scores without a result), from the season summary ──
+  const bestTss = seasonSummary?.best_total ?? null;
 
   // ── Derived: element KPIs ──────────────────────────────────────────────────
   const hasElements = elements && elements.length > 0;
@@ -630,7 +616,7 @@ export default function SkaterAnalyticsPage() {
             />
             <HeroStatBox
               label="Compétitions"
-              value={String(historyRows.length)}
+              value={String(seasonSummary?.competitions_entered ?? historyRows.length)}
             />
             {user?.role === "admin" && skater?.manual_create && (
               <button